@@ -4,65 +4,51 @@ PopTop Business Plan PDF Generator
 Generates a professionally styled PDF business plan using ReportLab
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.colors import HexColor, white, black
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from reportlab.lib.colors import white
 from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, ListFlowable, ListItem, KeepTogether
+from reportlab.platypus import Paragraph, Spacer, PageBreak
+
+from poptop import ROOT
+from poptop.pdf import (
+    PRIMARY, SECONDARY, PAGE_SIZE as letter,
+    Document, render_if_changed, add_page_number_after_cover,
+    create_data_table, create_titled_box, create_metrics_row,
+    create_panel_table, create_section_title, create_image_grid,
 )
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
-from reportlab.pdfgen import canvas
-from reportlab.platypus.flowables import Flowable
-import os
 
-# Color scheme
-PRIMARY = HexColor('#1a365d')
-SECONDARY = HexColor('#c9a227')
-ACCENT = HexColor('#2d3748')
-LIGHT = HexColor('#f7fafc')
-TEXT = HexColor('#2d3748')
-TEXT_LIGHT = HexColor('#718096')
-
-class ColoredBox(Flowable):
-    """A colored box with text inside"""
-    def __init__(self, width, height, color, text="", text_color=white):
-        Flowable.__init__(self)
-        self.width = width
-        self.height = height
-        self.color = color
-        self.text = text
-        self.text_color = text_color
-
-    def draw(self):
-        self.canv.setFillColor(self.color)
-        self.canv.roundRect(0, 0, self.width, self.height, 5, fill=1, stroke=0)
-
-class MetricCard(Flowable):
-    """A metric card with value and label"""
-    def __init__(self, value, label, width=1.5*inch, height=0.8*inch):
-        Flowable.__init__(self)
-        self.width = width
-        self.height = height
-        self.value = value
-        self.label = label
-
-    def draw(self):
-        # Background
-        self.canv.setFillColor(LIGHT)
-        self.canv.roundRect(0, 0, self.width, self.height, 3, fill=1, stroke=0)
-        # Left border
-        self.canv.setFillColor(SECONDARY)
-        self.canv.rect(0, 0, 3, self.height, fill=1, stroke=0)
-        # Value
-        self.canv.setFillColor(PRIMARY)
-        self.canv.setFont("Helvetica-Bold", 14)
-        self.canv.drawCentredString(self.width/2, self.height - 25, self.value)
-        # Label
-        self.canv.setFillColor(TEXT_LIGHT)
-        self.canv.setFont("Helvetica", 7)
-        self.canv.drawCentredString(self.width/2, 8, self.label.upper())
+try:
+    from poptop.mesh import DEFAULT_MATERIAL, MATERIALS, load_parts, quote
+except ImportError:  # NumPy not installed: the plan builds without CAD figures
+    load_parts = None
+
+try:
+    from poptop.mesh import production_parts
+    from poptop.thumbnails import render_thumbnails
+except ImportError:  # NumPy or Pillow missing: no part renders
+    render_thumbnails = None
+
+EST_COGS = 140  # $/unit planning assumption (Target Economics, Core Assumptions)
+
+def cad_part_rows(parts):
+    """Part analysis table rows from the measured CAD meshes"""
+    rows = []
+    for mesh in parts:
+        envelope = " x ".join(f"{d:.0f}" for d in mesh.size)
+        rows.append([mesh.name, envelope, f"{mesh.volume / 1000:,.1f} cm³",
+                     f"{mesh.area / 100:,.0f} cm²", f"{mesh.mass():,.0f} g"])
+    return rows
+
+def part_thumbnails():
+    """(PNG path, caption) for every production part, rendered or taken from the thumbnail cache"""
+    if render_thumbnails is None:
+        return []
+    images = render_thumbnails(production_parts())
+    return [(png, os.path.splitext(os.path.basename(stl))[0]) for stl, png in images.items()]
 
 def create_cover_page(canvas, doc):
     """Draw the cover page"""
@@ -112,209 +98,22 @@ def create_cover_page(canvas, doc):
 
     canvas.restoreState()
 
-def add_page_number(canvas, doc):
-    """Add page number to each page"""
-    if doc.page > 1:  # Skip cover page
-        canvas.saveState()
-        canvas.setFont("Helvetica", 9)
-        canvas.setFillColor(TEXT_LIGHT)
-        canvas.drawCentredString(letter[0]/2, 0.5*inch, str(doc.page - 1))
-        canvas.restoreState()
-
-def create_styles():
-    """Create custom paragraph styles"""
-    styles = getSampleStyleSheet()
-
-    styles.add(ParagraphStyle(
-        name='SectionTitle',
-        fontName='Helvetica-Bold',
-        fontSize=24,
-        textColor=PRIMARY,
-        spaceBefore=20,
-        spaceAfter=12,
-        borderPadding=(0, 0, 5, 0),
-    ))
-
-    styles.add(ParagraphStyle(
-        name='SubsectionTitle',
-        fontName='Helvetica-Bold',
-        fontSize=12,
-        textColor=PRIMARY,
-        spaceBefore=15,
-        spaceAfter=8,
-        textTransform='uppercase',
-    ))
-
-    styles.add(ParagraphStyle(
-        name='CustomBody',
-        fontName='Helvetica',
-        fontSize=10,
-        textColor=TEXT,
-        spaceBefore=6,
-        spaceAfter=6,
-        leading=14,
-        alignment=TA_JUSTIFY,
-    ))
-
-    # Override default BodyText
-    styles['BodyText'].fontName = 'Helvetica'
-    styles['BodyText'].fontSize = 10
-    styles['BodyText'].textColor = TEXT
-    styles['BodyText'].leading = 14
-
-    styles.add(ParagraphStyle(
-        name='HighlightTitle',
-        fontName='Helvetica-Bold',
-        fontSize=12,
-        textColor=SECONDARY,
-        spaceBefore=0,
-        spaceAfter=8,
-    ))
-
-    styles.add(ParagraphStyle(
-        name='HighlightBody',
-        fontName='Helvetica',
-        fontSize=10,
-        textColor=white,
-        leading=14,
-    ))
-
-    styles.add(ParagraphStyle(
-        name='BulletText',
-        fontName='Helvetica',
-        fontSize=10,
-        textColor=TEXT,
-        leftIndent=20,
-        spaceBefore=3,
-        spaceAfter=3,
-    ))
-
-    styles.add(ParagraphStyle(
-        name='TableHeader',
-        fontName='Helvetica-Bold',
-        fontSize=9,
-        textColor=white,
-    ))
-
-    styles.add(ParagraphStyle(
-        name='TableCell',
-        fontName='Helvetica',
-        fontSize=9,
-        textColor=TEXT,
-    ))
-
-    styles.add(ParagraphStyle(
-        name='CenteredQuote',
-        fontName='Helvetica-Oblique',
-        fontSize=14,
-        textColor=PRIMARY,
-        alignment=TA_CENTER,
-        spaceBefore=10,
-        spaceAfter=10,
-    ))
-
-    return styles
-
-def create_highlight_box(title, content, styles):
-    """Create a highlighted box with title and content"""
-    data = [[
-        Paragraph(f'<font color="#{SECONDARY.hexval()[2:]}">{title}</font>', styles['HighlightTitle']),
-    ], [
-        Paragraph(content, styles['HighlightBody'])
-    ]]
-
-    t = Table(data, colWidths=[6.5*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), PRIMARY),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 15),
-        ('ROUNDEDCORNERS', [5, 5, 5, 5]),
-    ]))
-    return t
-
-def create_metrics_row(metrics, styles):
-    """Create a row of metric cards"""
-    data = [[]]
-    for value, label in metrics:
-        cell_content = f'''<para align="center">
-            <font size="16" color="#{PRIMARY.hexval()[2:]}"><b>{value}</b></font><br/>
-            <font size="7" color="#{TEXT_LIGHT.hexval()[2:]}">{label.upper()}</font>
-        </para>'''
-        data[0].append(Paragraph(cell_content, styles['BodyText']))
-
-    t = Table(data, colWidths=[1.625*inch] * len(metrics))
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 5),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-        ('LINEBEFORESTARTPADDING', (0, 0), (-1, -1), 0),
-        ('LINEBEFORE', (0, 0), (0, -1), 3, SECONDARY),
-        ('LINEBEFORE', (1, 0), (1, -1), 3, SECONDARY),
-        ('LINEBEFORE', (2, 0), (2, -1), 3, SECONDARY),
-        ('LINEBEFORE', (3, 0), (3, -1), 3, SECONDARY),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    return t
-
-def create_data_table(headers, rows, col_widths=None):
-    """Create a styled data table"""
-    data = [headers] + rows
-
-    if col_widths is None:
-        col_widths = [6.5*inch / len(headers)] * len(headers)
-
-    t = Table(data, colWidths=col_widths)
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('TEXTCOLOR', (0, 1), (-1, -1), TEXT),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, LIGHT]),
-        ('LINEBELOW', (0, 0), (-1, -2), 0.5, HexColor('#e2e8f0')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    return t
-
-def build_document():
-    """Build the complete PDF document"""
-    output_path = '/Users/paulgiarrizzo/Projects/poptop/01-Business-Plan/final/PopTop-Business-Plan-v1.pdf'
-
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-
-    styles = create_styles()
+def quote_warnings():
+    """Parts left out of the resin quote, reported by the build (not on every story build)"""
+    parts = load_parts() if load_parts else []
+    return [f"no resin quote for {problem}" for problem in quote(parts)[2]] if parts else []
+
+def build_story(styles):
+    """Build the story for the business plan"""
     story = []
+    parts = load_parts() if load_parts else []
+    thumbnails = part_thumbnails()
 
     # Cover page placeholder (handled separately)
     story.append(PageBreak())
 
     # ========== EXECUTIVE SUMMARY ==========
-    story.append(Paragraph("01 Executive Summary", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-
-    # Gold line under title
-    line_data = [['']]
-    line_table = Table(line_data, colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("01 Executive Summary"))
 
     story.append(Paragraph(
         "PopTop is a consumer products company building a <b>premium, category-defining beverage "
@@ -329,7 +128,7 @@ def build_document():
         ("60-65%", "Gross Margin"),
         ("$10-20M", "Initial SOM"),
         ("$500M+", "Total TAM"),
-    ], styles))
+    ]))
     story.append(Spacer(1, 15))
 
     story.append(Paragraph(
@@ -342,12 +141,11 @@ def build_document():
     ))
 
     story.append(Spacer(1, 15))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Strategic Vision",
         "PopTop is designed from inception as a <b>brand and platform company</b>, not a single-SKU "
         "novelty product. The long-term objective is to become the dominant and trusted name in "
-        "premium beverage dispensing for social and fan-driven environments.",
-        styles
+        "premium beverage dispensing for social and fan-driven environments."
     ))
 
     story.append(Spacer(1, 15))
@@ -363,12 +161,7 @@ def build_document():
     story.append(PageBreak())
 
     # ========== PROBLEM & OPPORTUNITY ==========
-    story.append(Paragraph("02 Problem & Opportunity", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("02 Problem & Opportunity"))
 
     story.append(Paragraph("THE PROBLEM", styles['SubsectionTitle']))
     story.append(Paragraph(
@@ -409,7 +202,7 @@ def build_document():
         ("Millions", "Engaged Fans"),
         ("Premium", "Spending Trend"),
         ("High", "Brand Loyalty"),
-    ], styles))
+    ]))
 
     story.append(Spacer(1, 15))
     story.append(Paragraph(
@@ -421,18 +214,20 @@ def build_document():
     story.append(PageBreak())
 
     # ========== PRODUCT OVERVIEW ==========
-    story.append(Paragraph("03 Product Overview", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("03 Product Overview"))
 
     story.append(Paragraph("FLAGSHIP PRODUCT (V1)", styles['SubsectionTitle']))
     story.append(Paragraph(
         "A rugged, tabletop/portable drink dispenser designed specifically for tailgates and group events.",
         styles['BodyText']
     ))
+    if thumbnails:
+        story.append(Spacer(1, 10))
+        story.append(create_image_grid(thumbnails, columns=6))
+        story.append(Paragraph(
+            "<i>Current CAD parts, rendered from the STL exports in cad-files.</i>",
+            styles['BodyText']
+        ))
 
     story.append(Paragraph("Core Features:", styles['SubsectionTitle']))
     features = [
@@ -475,38 +270,26 @@ def build_document():
     ))
 
     story.append(Spacer(1, 15))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Platform Philosophy",
         "PopTop is intentionally engineered as a <b>platform</b>, not a one-off product. Each "
-        "version builds on core IP while expanding addressable markets and use cases.",
-        styles
+        "version builds on core IP while expanding addressable markets and use cases."
     ))
 
     story.append(PageBreak())
 
     # ========== MARKET ANALYSIS ==========
-    story.append(Paragraph("04 Market Analysis", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("04 Market Analysis"))
 
     story.append(Paragraph("TARGET CUSTOMER PROFILE", styles['SubsectionTitle']))
 
     # Two column table for demographics
-    demo_data = [
-        [Paragraph("<b>Primary Demographics</b>", styles['BodyText']),
-         Paragraph("<b>Psychographics</b>", styles['BodyText'])],
-        [Paragraph("• Collegiate sports fans and alumni<br/>• Tailgaters and watch-party hosts<br/>• Booster clubs and alumni associations<br/>• Age range: 25-60<br/>• Middle to upper-middle income", styles['BulletText']),
-         Paragraph("• Value quality and durability<br/>• Strong brand/team alignment<br/>• Social signaling conscious<br/>• Repeat purchasers of premium fan gear<br/>• Multi-generational traditions", styles['BulletText'])]
-    ]
-    demo_table = Table(demo_data, colWidths=[3.25*inch, 3.25*inch])
-    demo_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
+    story.append(create_panel_table([
+        ("Primary Demographics",
+         "• Collegiate sports fans and alumni<br/>• Tailgaters and watch-party hosts<br/>• Booster clubs and alumni associations<br/>• Age range: 25-60<br/>• Middle to upper-middle income"),
+        ("Psychographics",
+         "• Value quality and durability<br/>• Strong brand/team alignment<br/>• Social signaling conscious<br/>• Repeat purchasers of premium fan gear<br/>• Multi-generational traditions"),
     ]))
-    story.append(demo_table)
 
     story.append(Spacer(1, 15))
     story.append(Paragraph("PRIMARY MARKET: COLLEGIATE ATHLETICS", styles['SubsectionTitle']))
@@ -540,35 +323,26 @@ def build_document():
         ("0.25%", "Initial Penetration"),
         ("$10-20M", "Initial SOM"),
         ("$500M+", "Total TAM"),
-    ], styles))
+    ]))
 
     story.append(PageBreak())
 
     # ========== COMPETITIVE LANDSCAPE ==========
-    story.append(Paragraph("05 Competitive Landscape", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("05 Competitive Landscape"))
 
-    comp_data = [
-        [Paragraph("<b>Direct Competitors</b>", styles['BodyText']),
-         Paragraph("<b>Competitive Advantages</b>", styles['BodyText'])],
-        [Paragraph("• Generic drink dispensers (Amazon, big-box)<br/>• Keg-style novelty products<br/>• Basic plastic dispensers<br/><br/><b>Indirect Competitors</b><br/>• Premium coolers (YETI, Igloo)<br/>• Party beverage tubs<br/>• DIY/improvised solutions", styles['BulletText']),
-         Paragraph("• <b>Purpose-built</b> for tailgating use case<br/>• <b>Premium design</b> & materials<br/>• <b>Licensed collegiate branding</b><br/>• <b>Platform extensibility</b><br/>• <b>Strong brand narrative</b><br/>• <b>First-mover</b> in category", styles['BulletText'])]
-    ]
-    comp_table = Table(comp_data, colWidths=[3.25*inch, 3.25*inch])
-    comp_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')]))
-    story.append(comp_table)
+    story.append(create_panel_table([
+        ("Direct Competitors",
+         "• Generic drink dispensers (Amazon, big-box)<br/>• Keg-style novelty products<br/>• Basic plastic dispensers<br/><br/><b>Indirect Competitors</b><br/>• Premium coolers (YETI, Igloo)<br/>• Party beverage tubs<br/>• DIY/improvised solutions"),
+        ("Competitive Advantages",
+         "• <b>Purpose-built</b> for tailgating use case<br/>• <b>Premium design</b> & materials<br/>• <b>Licensed collegiate branding</b><br/>• <b>Platform extensibility</b><br/>• <b>Strong brand narrative</b><br/>• <b>First-mover</b> in category"),
+    ]))
 
     story.append(Spacer(1, 15))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Strategic Position",
         "<b>No incumbent brand owns this category.</b> PopTop has the opportunity to establish "
         "category leadership similar to how YETI defined premium coolers. The combination of "
-        "licensed branding + premium construction + tailgate-specific design creates a defensible moat.",
-        styles
+        "licensed branding + premium construction + tailgate-specific design creates a defensible moat."
     ))
 
     story.append(Spacer(1, 15))
@@ -588,12 +362,7 @@ def build_document():
     story.append(PageBreak())
 
     # ========== LICENSING & PARTNERSHIPS ==========
-    story.append(Paragraph("06 Licensing & Partnerships", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("06 Licensing & Partnerships"))
 
     story.append(Paragraph("LICENSING STRATEGY", styles['SubsectionTitle']))
     story.append(Paragraph(
@@ -603,23 +372,14 @@ def build_document():
     ))
 
     story.append(Spacer(1, 10))
-    phase_data = [
-        [Paragraph("<b>Phase 1: Foundation</b>", styles['BodyText']),
-         Paragraph("<b>Phase 2: Expansion</b>", styles['BodyText']),
-         Paragraph("<b>Phase 3: Scale</b>", styles['BodyText'])],
-        [Paragraph("• Establish CLC relationship<br/>• Fanatics partnership<br/>• 3-5 flagship programs", styles['BulletText']),
-         Paragraph("• Power 5 conferences<br/>• Top 25 programs<br/>• Regional expansion", styles['BulletText']),
-         Paragraph("• Full FBS coverage<br/>• Pro sports leagues<br/>• International", styles['BulletText'])]
-    ]
-    phase_table = Table(phase_data, colWidths=[2.17*inch, 2.17*inch, 2.17*inch])
-    phase_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(phase_table)
+    story.append(create_panel_table([
+        ("Phase 1: Foundation",
+         "• Establish CLC relationship<br/>• Fanatics partnership<br/>• 3-5 flagship programs"),
+        ("Phase 2: Expansion",
+         "• Power 5 conferences<br/>• Top 25 programs<br/>• Regional expansion"),
+        ("Phase 3: Scale",
+         "• Full FBS coverage<br/>• Pro sports leagues<br/>• International"),
+    ], shaded=True))
 
     story.append(Spacer(1, 15))
     story.append(Paragraph("STRATEGIC PARTNERS (TARGET)", styles['SubsectionTitle']))
@@ -635,42 +395,27 @@ def build_document():
     ))
 
     story.append(Spacer(1, 15))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Licensing as a Moat",
         "Licensing is a <b>moat, not a tax</b>. PopTop becomes a preferred platform partner rather "
         "than a one-off licensed item. Deep licensing relationships create barriers to entry for "
-        "competitors and drive recurring revenue through new school additions.",
-        styles
+        "competitors and drive recurring revenue through new school additions."
     ))
 
     story.append(PageBreak())
 
     # ========== GO-TO-MARKET STRATEGY ==========
-    story.append(Paragraph("07 Go-To-Market Strategy", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("07 Go-To-Market Strategy"))
 
     story.append(Paragraph("PHASED APPROACH", styles['SubsectionTitle']))
-    gtm_data = [
-        [Paragraph("<b>Phase 1: D2C</b>", styles['BodyText']),
-         Paragraph("<b>Phase 2: Wholesale</b>", styles['BodyText']),
-         Paragraph("<b>Phase 3: Enterprise</b>", styles['BodyText'])],
-        [Paragraph("• PopTop.com launch<br/>• Limited school drops<br/>• Pre-orders / waitlists<br/>• Scarcity-driven launches", styles['BulletText']),
-         Paragraph("• Fanatics integration<br/>• Campus bookstores<br/>• Sporting goods retailers<br/>• Regional chains", styles['BulletText']),
-         Paragraph("• Alumni associations<br/>• Corporate tailgates<br/>• Event rentals<br/>• Venue partnerships", styles['BulletText'])]
-    ]
-    gtm_table = Table(gtm_data, colWidths=[2.17*inch, 2.17*inch, 2.17*inch])
-    gtm_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(gtm_table)
+    story.append(create_panel_table([
+        ("Phase 1: D2C",
+         "• PopTop.com launch<br/>• Limited school drops<br/>• Pre-orders / waitlists<br/>• Scarcity-driven launches"),
+        ("Phase 2: Wholesale",
+         "• Fanatics integration<br/>• Campus bookstores<br/>• Sporting goods retailers<br/>• Regional chains"),
+        ("Phase 3: Enterprise",
+         "• Alumni associations<br/>• Corporate tailgates<br/>• Event rentals<br/>• Venue partnerships"),
+    ], shaded=True))
 
     story.append(Spacer(1, 15))
     story.append(Paragraph("MARKETING STRATEGY", styles['SubsectionTitle']))
@@ -680,15 +425,12 @@ def build_document():
         styles['BodyText']
     ))
 
-    mkt_data = [
-        [Paragraph("<b>Channels</b>", styles['BodyText']),
-         Paragraph("<b>Tactics</b>", styles['BodyText'])],
-        [Paragraph("• Instagram / TikTok (lifestyle content)<br/>• Game day photography<br/>• Influencer partnerships<br/>• Alumni network activations<br/>• Stadium/event presence", styles['BulletText']),
-         Paragraph("• Limited edition drops by school<br/>• Early access for alumni groups<br/>• User-generated content campaigns<br/>• Rivalry week promotions<br/>• Championship tie-ins", styles['BulletText'])]
-    ]
-    mkt_table = Table(mkt_data, colWidths=[3.25*inch, 3.25*inch])
-    mkt_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')]))
-    story.append(mkt_table)
+    story.append(create_panel_table([
+        ("Channels",
+         "• Instagram / TikTok (lifestyle content)<br/>• Game day photography<br/>• Influencer partnerships<br/>• Alumni network activations<br/>• Stadium/event presence"),
+        ("Tactics",
+         "• Limited edition drops by school<br/>• Early access for alumni groups<br/>• User-generated content campaigns<br/>• Rivalry week promotions<br/>• Championship tie-ins"),
+    ]))
 
     story.append(Spacer(1, 15))
     story.append(Paragraph("LAUNCH TIMELINE", styles['SubsectionTitle']))
@@ -706,12 +448,7 @@ def build_document():
     story.append(PageBreak())
 
     # ========== BRAND & POSITIONING ==========
-    story.append(Paragraph("08 Brand & Positioning", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("08 Brand & Positioning"))
 
     story.append(Paragraph("BRAND ATTRIBUTES", styles['SubsectionTitle']))
     story.append(create_metrics_row([
@@ -719,13 +456,12 @@ def build_document():
         ("Premium", "Quality & Craft"),
         ("Social", "Community Focused"),
         ("Tradition", "Built to Last"),
-    ], styles))
+    ]))
 
     story.append(Spacer(1, 20))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Brand Positioning",
-        '<para align="center"><font size="16"><i>"The Centerpiece of Your Tailgate"</i></font></para>',
-        styles
+        '<para align="center"><font size="16"><i>"The Centerpiece of Your Tailgate"</i></font></para>'
     ))
 
     story.append(Spacer(1, 15))
@@ -738,25 +474,17 @@ def build_document():
     ))
 
     story.append(Spacer(1, 15))
-    brand_data = [
-        [Paragraph("<b>Design Principles</b>", styles['BodyText']),
-         Paragraph("<b>Brand Voice</b>", styles['BodyText'])],
-        [Paragraph("• Clean, modern aesthetics<br/>• Premium material finishes<br/>• Bold, visible branding<br/>• Modular customization<br/>• Instagram-worthy design", styles['BulletText']),
-         Paragraph("• Confident but not arrogant<br/>• Fun but not frivolous<br/>• Premium but accessible<br/>• Tradition-honoring<br/>• Community-building", styles['BulletText'])]
-    ]
-    brand_table = Table(brand_data, colWidths=[3.25*inch, 3.25*inch])
-    brand_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')]))
-    story.append(brand_table)
+    story.append(create_panel_table([
+        ("Design Principles",
+         "• Clean, modern aesthetics<br/>• Premium material finishes<br/>• Bold, visible branding<br/>• Modular customization<br/>• Instagram-worthy design"),
+        ("Brand Voice",
+         "• Confident but not arrogant<br/>• Fun but not frivolous<br/>• Premium but accessible<br/>• Tradition-honoring<br/>• Community-building"),
+    ]))
 
     story.append(PageBreak())
 
     # ========== OPERATIONS & MANUFACTURING ==========
-    story.append(Paragraph("09 Operations & Manufacturing", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("09 Operations & Manufacturing"))
 
     story.append(Paragraph("PRODUCT DEVELOPMENT STATUS", styles['SubsectionTitle']))
     for item in ["Initial concept and product requirements defined",
@@ -768,25 +496,31 @@ def build_document():
         styles['BodyText']
     ))
 
+    if parts:
+        density, _ = MATERIALS[DEFAULT_MATERIAL]
+        story.append(Spacer(1, 15))
+        story.append(Paragraph("CAD PART ANALYSIS", styles['SubsectionTitle']))
+        story.append(create_data_table(
+            ["Part", "Envelope (mm)", "Volume", "Surface", f"{DEFAULT_MATERIAL} Mass"],
+            cad_part_rows(parts),
+            [2.1*inch, 1.3*inch, 1.0*inch, 1.0*inch, 1.1*inch]
+        ))
+        story.append(Paragraph(
+            f"<i>Measured from the STL exports in cad-files as solid parts, {DEFAULT_MATERIAL} at "
+            f"{density} g/cm³.</i>",
+            styles['BodyText']
+        ))
+
     story.append(Spacer(1, 15))
     story.append(Paragraph("MANUFACTURING STRATEGY", styles['SubsectionTitle']))
-    mfg_data = [
-        [Paragraph("<b>Phase 1: Pilot</b>", styles['BodyText']),
-         Paragraph("<b>Phase 2: Scaled</b>", styles['BodyText']),
-         Paragraph("<b>Phase 3: Full Scale</b>", styles['BodyText'])],
-        [Paragraph("• Low-volume runs<br/>• Domestic/near-shore mfg<br/>• Rapid iteration<br/>• Field testing", styles['BulletText']),
-         Paragraph("• Overseas partners<br/>• US-based QC<br/>• Tooling investment<br/>• Volume pricing", styles['BulletText']),
-         Paragraph("• Multiple SKUs<br/>• Regional distribution<br/>• Inventory optimization<br/>• JIT fulfillment", styles['BulletText'])]
-    ]
-    mfg_table = Table(mfg_data, colWidths=[2.17*inch, 2.17*inch, 2.17*inch])
-    mfg_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(mfg_table)
+    story.append(create_panel_table([
+        ("Phase 1: Pilot",
+         "• Low-volume runs<br/>• Domestic/near-shore mfg<br/>• Rapid iteration<br/>• Field testing"),
+        ("Phase 2: Scaled",
+         "• Overseas partners<br/>• US-based QC<br/>• Tooling investment<br/>• Volume pricing"),
+        ("Phase 3: Full Scale",
+         "• Multiple SKUs<br/>• Regional distribution<br/>• Inventory optimization<br/>• JIT fulfillment"),
+    ], shaded=True))
 
     story.append(Spacer(1, 15))
     story.append(Paragraph("SUPPLY CHAIN & RISKS", styles['SubsectionTitle']))
@@ -805,12 +539,7 @@ def build_document():
     story.append(PageBreak())
 
     # ========== TEAM & ADVISORS ==========
-    story.append(Paragraph("10 Team & Advisors", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("10 Team & Advisors"))
 
     story.append(Paragraph("CORE TEAM", styles['SubsectionTitle']))
     story.append(create_data_table(
@@ -842,23 +571,17 @@ def build_document():
         story.append(Paragraph(f"• {item}", styles['BulletText']))
 
     story.append(Spacer(1, 15))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Team Strengths",
         "The team combines <b>entrepreneurial drive</b> with <b>engineering capability</b> and "
         "<b>business acumen</b>. In-house 3D printing capability (4'x4' printer) enables rapid "
-        "prototyping and iteration without external dependencies.",
-        styles
+        "prototyping and iteration without external dependencies."
     ))
 
     story.append(PageBreak())
 
     # ========== FINANCIAL PROJECTIONS ==========
-    story.append(Paragraph("11 Financial Projections", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("11 Financial Projections"))
 
     story.append(Paragraph("CORE ASSUMPTIONS", styles['SubsectionTitle']))
     story.append(create_metrics_row([
@@ -866,7 +589,19 @@ def build_document():
         ("$140", "Est. COGS/Unit"),
         ("62%", "Gross Margin"),
         ("$235", "Gross Profit/Unit"),
-    ], styles))
+    ]))
+
+    mass, resin, problems = quote(parts) if parts else (0, 0, [])
+    if parts and len(problems) < len(parts):
+        quoted = len(parts) - len(problems)
+        story.append(Spacer(1, 10))
+        story.append(Paragraph(
+            f"Modeled plastic content: <b>{mass / 1000:.2f} kg</b> of {DEFAULT_MATERIAL} across "
+            f"{quoted} production part{'s' if quoted != 1 else ''}, about <b>${resin:,.2f}</b> of resin per set "
+            f"({resin / EST_COGS:.1%} of est. COGS); the balance is tooling amortization, "
+            f"hardware, finishing, packaging and freight.",
+            styles['BodyText']
+        ))
 
     story.append(Spacer(1, 20))
     story.append(Paragraph("THREE-YEAR PROJECTIONS", styles['SubsectionTitle']))
@@ -900,12 +635,7 @@ def build_document():
     story.append(PageBreak())
 
     # ========== CAPITAL & GROWTH STRATEGY ==========
-    story.append(Paragraph("12 Capital & Growth Strategy", styles['SectionTitle']))
-    story.append(Spacer(1, 5))
-    line_table = Table([['']], colWidths=[6.5*inch], rowHeights=[3])
-    line_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), SECONDARY)]))
-    story.append(line_table)
-    story.append(Spacer(1, 15))
+    story.extend(create_section_title("12 Capital & Growth Strategy"))
 
     story.append(Paragraph("INITIAL CAPITAL NEEDS", styles['SubsectionTitle']))
     story.append(create_data_table(
@@ -920,54 +650,62 @@ def build_document():
     ))
 
     story.append(Spacer(1, 15))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Target Raise (Optional)",
         '<para align="center"><font size="20"><b>$500K - $1.5M</b></font></para>'
         '<para align="center">Strategic investors preferred. Ideal partner brings <b>distribution</b>, '
-        '<b>licensing leverage</b>, or <b>eComm scale</b>.</para>',
-        styles
+        '<b>licensing leverage</b>, or <b>eComm scale</b>.</para>'
     ))
 
     story.append(Spacer(1, 15))
     story.append(Paragraph("EXIT VISION", styles['SubsectionTitle']))
-    exit_data = [
-        [Paragraph("<b>Strategic Acquirers</b>", styles['BodyText']),
-         Paragraph("<b>Exit Criteria</b>", styles['BodyText'])],
-        [Paragraph("• Fanatics<br/>• YETI<br/>• Private equity roll-up<br/>• Consumer products conglomerate", styles['BulletText']),
-         Paragraph("• Established brand leadership<br/>• Proven unit economics<br/>• Scalable licensing model<br/>• Platform extensibility demonstrated", styles['BulletText'])]
-    ]
-    exit_table = Table(exit_data, colWidths=[3.25*inch, 3.25*inch])
-    exit_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')]))
-    story.append(exit_table)
+    story.append(create_panel_table([
+        ("Strategic Acquirers",
+         "• Fanatics<br/>• YETI<br/>• Private equity roll-up<br/>• Consumer products conglomerate"),
+        ("Exit Criteria",
+         "• Established brand leadership<br/>• Proven unit economics<br/>• Scalable licensing model<br/>• Platform extensibility demonstrated"),
+    ]))
 
     story.append(Spacer(1, 20))
-    story.append(create_highlight_box(
+    story.append(create_titled_box(
         "Long-Term Vision",
         "PopTop aims to be the <b>default beverage system for fans</b>. Brand scales across "
-        "beverage platforms and becomes synonymous with premium tailgate experiences.",
-        styles
+        "beverage platforms and becomes synonymous with premium tailgate experiences."
     ))
 
     # Confidential footer
     story.append(Spacer(1, 40))
     story.append(Paragraph(
         "<i>This document is confidential and intended for strategic discussion purposes only.</i>",
-        ParagraphStyle('Footer', parent=styles['BodyText'], alignment=TA_CENTER, textColor=TEXT_LIGHT, fontSize=9)
+        styles['Footer']
     ))
     story.append(Paragraph(
         "PopTop, LLC | A Munn Family Holdings Company | Indiana",
-        ParagraphStyle('Footer2', parent=styles['BodyText'], alignment=TA_CENTER, textColor=TEXT_LIGHT, fontSize=9)
+        styles['Footer']
     ))
 
-    # Build with cover page
-    def first_page(canvas, doc):
-        create_cover_page(canvas, doc)
+    return story
 
-    def later_pages(canvas, doc):
-        add_page_number(canvas, doc)
+DOCUMENT = Document(
+    name='business-plan',
+    output_path=ROOT / '01-Business-Plan' / 'final' / 'PopTop-Business-Plan-v1.pdf',
+    build_story=build_story,
+    on_first_page=create_cover_page,
+    on_later_pages=add_page_number_after_cover,
+    source=__file__,
+    sectioned=True,
+    warnings=quote_warnings,
+)
 
-    doc.build(story, onFirstPage=first_page, onLaterPages=later_pages)
-    print(f"PDF created successfully: {output_path}")
+def build_document(force=False):
+    """Build the complete PDF document (skipped when nothing has changed)"""
+    pages, rendered = render_if_changed(DOCUMENT, force=force)
+    if rendered:
+        print(f"PDF created successfully: {DOCUMENT.output_path}")
+        for warning in DOCUMENT.warnings():
+            print(f"Warning: {warning}", file=sys.stderr)
+    else:
+        print(f"PDF up to date: {DOCUMENT.output_path}")
 
 if __name__ == "__main__":
-    build_document()
+    build_document(force='--force' in sys.argv)
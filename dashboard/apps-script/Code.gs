@@ -10,6 +10,9 @@
  * 5. Save (Ctrl+S)
  * 6. Run 'setupTriggers' function once
  * 7. Authorize when prompted
+ * 8. For `poptop sync` and dashboard pushes, add a SYNC_TOKEN script
+ *    property (Project Settings > Script Properties) and give the same
+ *    value to the sender as SHEETS_WEBHOOK_TOKEN
  */
 
 // ============================================
@@ -715,6 +718,100 @@ function updateDashboard() {
   Logger.log('Dashboard updated at ' + today);
 }
 
+/**
+ * Write a dashboard payload computed by `python3 -m poptop dashboard --json`.
+ * Values and formats arrive as same-sized 2-D grids, so the whole tab is
+ * written with one range update instead of cell by cell.
+ */
+function applyDashboardPayload(payload) {
+  const ss = SpreadsheetApp.getActiveSpreadsheet();
+  let dashSheet = ss.getSheetByName(CONFIG.SHEETS.DASHBOARD);
+  if (!dashSheet) {
+    dashSheet = ss.insertSheet(CONFIG.SHEETS.DASHBOARD, 0);
+  }
+
+  dashSheet.getDataRange().breakApart();
+  dashSheet.clear();
+  dashSheet.clearFormats();
+
+  dashSheet.getRange(payload.range)
+    .setValues(payload.values)
+    .setBackgrounds(payload.backgrounds)
+    .setFontColors(payload.fontColors)
+    .setFontWeights(payload.fontWeights)
+    .setFontSizes(payload.fontSizes)
+    .setHorizontalAlignments(payload.horizontalAlignments);
+
+  payload.merges.forEach(m => dashSheet.getRange(m[0], m[1], m[2], m[3]).merge());
+  Object.keys(payload.rowHeights).forEach(row => {
+    dashSheet.setRowHeight(Number(row), payload.rowHeights[row]);
+  });
+  payload.columnWidths.forEach((width, idx) => dashSheet.setColumnWidth(idx + 1, width));
+  dashSheet.setFrozenRows(payload.frozenRows);
+
+  Logger.log('Dashboard payload applied (' + payload.range + ')');
+}
+
+/**
+ * Apply incremental dashboard changes from the Python aggregator:
+ * either {full: payload} when the layout moved, or {updates: [...]} with
+ * only the cell runs whose value or format changed.
+ */
+function applyDashboardUpdates(change) {
+  if (change.full) {
+    applyDashboardPayload(change.full);
+    return;
+  }
+
+  const dashSheet = SpreadsheetApp.getActiveSpreadsheet().getSheetByName(CONFIG.SHEETS.DASHBOARD);
+  if (!dashSheet) return;
+
+  change.updates.forEach(u => {
+    dashSheet.getRange(u.range)
+      .setValues(u.values)
+      .setBackgrounds(u.backgrounds)
+      .setFontColors(u.fontColors)
+      .setFontWeights(u.fontWeights)
+      .setFontSizes(u.fontSizes)
+      .setHorizontalAlignments(u.horizontalAlignments);
+  });
+
+  Logger.log('Dashboard updated: ' + change.updates.length + ' range(s)');
+}
+
+/**
+ * Write changed cells sent by `python3 -m poptop sync`. Only data cells that
+ * differ from the last sync arrive (never the header or formula columns
+ * such as Days Left), and every sheet's ranges come in the same request.
+ */
+function applySheetRows(updates) {
+  const ss = SpreadsheetApp.getActiveSpreadsheet();
+  const sheets = {};
+
+  updates.forEach(u => {
+    if (!sheets[u.sheet]) {
+      sheets[u.sheet] = ss.getSheetByName(u.sheet) || ss.insertSheet(u.sheet);
+    }
+    sheets[u.sheet].getRange(u.range).setValues(u.values);
+  });
+
+  Logger.log('Sheet rows written: ' + updates.length + ' range(s)');
+}
+
+/**
+ * Current display values of the named sheets, so a first sync can keep
+ * cells the team already filled in instead of overwriting them.
+ */
+function readSheetRows(names) {
+  const ss = SpreadsheetApp.getActiveSpreadsheet();
+  const sheets = {};
+  names.forEach(name => {
+    const sheet = ss.getSheetByName(name);
+    sheets[name] = sheet ? sheet.getDataRange().getDisplayValues() : [];
+  });
+  return sheets;
+}
+
 // ============================================
 // UTILITY FUNCTIONS
 // ============================================
@@ -1095,6 +1192,17 @@ function showOpenActionItems() {
 // WEBHOOK ENDPOINT (for GitHub Actions)
 // ============================================
 
+const WRITE_EVENTS = ['dashboard_payload', 'dashboard_update', 'sheet_rows', 'sheet_values'];
+
+/**
+ * True when token matches the SYNC_TOKEN script property. With no
+ * SYNC_TOKEN set, every data event is refused.
+ */
+function hasSyncToken(token) {
+  const expected = PropertiesService.getScriptProperties().getProperty('SYNC_TOKEN');
+  return Boolean(expected) && token === expected;
+}
+
 /**
  * Handle incoming webhook from GitHub Actions
  * Deploy as Web App: Deploy > New Deployment > Web App > Execute as Me > Anyone
@@ -1102,7 +1210,48 @@ function showOpenActionItems() {
 function doPost(e) {
   try {
     const data = JSON.parse(e.postData.contents);
-    Logger.log('Webhook received: ' + JSON.stringify(data));
+    Logger.log('Webhook received: ' + data.event);
+
+    // Events that read or write sheet data need the shared secret set in
+    // Project Settings > Script Properties as SYNC_TOKEN
+    if (WRITE_EVENTS.indexOf(data.event) !== -1 && !hasSyncToken(data.token)) {
+      return ContentService.createTextOutput(JSON.stringify({
+        status: 'error',
+        message: 'Unauthorized'
+      })).setMimeType(ContentService.MimeType.JSON);
+    }
+
+    if (data.event === 'sheet_values') {
+      return ContentService.createTextOutput(JSON.stringify({
+        status: 'success',
+        message: data.sheets.length + ' sheet(s) read',
+        sheets: readSheetRows(data.sheets)
+      })).setMimeType(ContentService.MimeType.JSON);
+    }
+
+    if (data.event === 'dashboard_payload') {
+      applyDashboardPayload(data.payload);
+      return ContentService.createTextOutput(JSON.stringify({
+        status: 'success',
+        message: 'Dashboard written'
+      })).setMimeType(ContentService.MimeType.JSON);
+    }
+
+    if (data.event === 'dashboard_update') {
+      applyDashboardUpdates(data.change);
+      return ContentService.createTextOutput(JSON.stringify({
+        status: 'success',
+        message: 'Dashboard cells updated'
+      })).setMimeType(ContentService.MimeType.JSON);
+    }
+
+    if (data.event === 'sheet_rows') {
+      applySheetRows(data.updates);
+      return ContentService.createTextOutput(JSON.stringify({
+        status: 'success',
+        message: data.updates.length + ' range(s) written'
+      })).setMimeType(ContentService.MimeType.JSON);
+    }
 
     if (data.event === 'meeting_notes_updated') {
       // Trigger a refresh of the dashboard
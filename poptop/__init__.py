@@ -0,0 +1,10 @@
+"""
+PopTop project tooling
+Shared Python code behind the document generators and project scripts
+"""
+
+import os
+from pathlib import Path
+
+# Project root (same convention as the shell scripts' POPTOP_DIR)
+ROOT = Path(os.environ.get('POPTOP_DIR') or Path(__file__).resolve().parent.parent)
@@ -0,0 +1,588 @@
+"""
+PopTop command line
+Usage: python -m poptop <command> [options]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+EXAMPLES = '''examples:
+  poptop watch
+  poptop email 2026-02-06 --open
+  poptop build business-plan
+  poptop dashboard --html /tmp/dashboard.html
+  poptop search owner:brian date:2026-02
+  poptop diff execution-plan-v1 execution-plan-v2.1
+  poptop status --imports
+
+Command modules are imported only when their command runs, so commands
+that do not render start without loading ReportLab.'''
+
+def cmd_build(args):
+    from .build import build_all, discover_documents
+
+    if args.list:
+        for name, document in discover_documents().items():
+            print(f"{name:<24} {document.output_path}")
+        return 0
+    if args.optimize is not None:
+        from .pdf.optimize import PYPDF_REQUIREMENT, available
+        if not available():
+            print(f"Error: --optimize needs {PYPDF_REQUIREMENT} (pip3 install '{PYPDF_REQUIREMENT}')", file=sys.stderr)
+            return 1
+    try:
+        build_all(args.documents, jobs=args.jobs, force=args.force, optimize=args.optimize, fonts=args.embed_fonts)
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+def cmd_optimize(args):
+    from .pdf.optimize import PYPDF_REQUIREMENT, available, optimize_pdf
+
+    if not available():
+        print(f"Error: optimizing needs {PYPDF_REQUIREMENT} (pip3 install '{PYPDF_REQUIREMENT}')", file=sys.stderr)
+        return 1
+    total_before = total_after = 0
+    for path in args.paths:
+        before, after = optimize_pdf(path, args.level)
+        total_before += before
+        total_after += after
+        print(f"{path}: {before / 1024:.1f} KB -> {after / 1024:.1f} KB ({(after - before) / before:+.0%})")
+    if len(args.paths) > 1:
+        print(f"Saved {(total_before - total_after) / 1024:.1f} KB of {total_before / 1024:.1f} KB")
+    return 0
+
+def cmd_bench(args):
+    import json
+
+    from .bench import BASELINE_FILE, available, change, load_baseline, regressions, run_benchmarks, save_baseline
+
+    args.baseline = args.baseline or str(BASELINE_FILE)
+    names = args.documents or available()
+    unknown = [name for name in names if name not in available()]
+    if unknown:
+        print(f"Error: unknown document(s): {', '.join(unknown)} (one of {', '.join(available())})",
+              file=sys.stderr)
+        return 1
+    baseline = load_baseline(args.baseline)
+
+    def report(name, m):
+        versus = ''
+        if name in baseline:
+            versus = f" {change(baseline[name]['seconds'], m['seconds']):>+7.1%}"
+        print(f"{name:<20} {m['pages']:>5} {m['flowables']:>6} {m['story_seconds']:>7.3f} {m['render_seconds']:>7.3f} "
+              f"{m['pages_per_second']:>7.1f} {m['peak_rss_mb']:>7.1f} {m['output_bytes'] / 1024:>8.0f}{versus}",
+              flush=True)
+
+    print(f"{'Document':<20} {'Pages':>5} {'Flows':>6} {'Story s':>7} {'Layout s':>7} {'Pages/s':>7} "
+          f"{'Peak MB':>7} {'KB':>8}{'  vs base' if baseline else ''}")
+    results = run_benchmarks(names, runs=args.runs, report=report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Saved baseline: {args.baseline}")
+        return 0
+    found = regressions(results, baseline, args.threshold)
+    for name, metric, old, new, delta in found:
+        print(f"REGRESSION {name}: {metric} {old} -> {new} ({delta:+.1%}, threshold {args.threshold:.0%})")
+    return 1 if found else 0
+
+def cmd_dashboard(args):
+    import json
+    from datetime import date
+
+    from .dashboard import dashboard_stats, render_html, render_pdf, sheet_payload
+
+    stats = dashboard_stats(today=date.fromisoformat(args.today) if args.today else None)
+    if args.json:
+        payload = json.dumps(sheet_payload(stats), ensure_ascii=False)
+        if args.json == '-':
+            print(payload)
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                f.write(payload)
+    if args.html:
+        with open(args.html, 'w', encoding='utf-8') as f:
+            f.write(render_html(stats))
+    if args.pdf:
+        render_pdf(stats, args.pdf)
+    if not (args.json or args.html or args.pdf):
+        for label, value, _ in stats.quick_stats():
+            print(f"{label:<14} {value:>4}")
+        print()
+        for display, done, total, pct in stats.phase_progress():
+            print(f"{display:<52} {done:>3}/{total:<3} {pct:>3}%")
+        print()
+        for task in stats.overdue:
+            print(f"OVERDUE  {task.due_date}  {task.owner:<16} {task.name}")
+        for task in stats.due_soon:
+            print(f"DUE SOON {task.due_date}  {task.owner:<16} {task.name}")
+    return 0
+
+def cmd_profile(args):
+    import tempfile
+
+    from .build import discover_documents
+    from .pdf.profile import PROFILE_DIR, profile_document
+
+    documents = discover_documents()
+    if args.document not in documents:
+        print(f"Error: unknown document {args.document!r} (one of {', '.join(documents)})", file=sys.stderr)
+        return 1
+    document = documents[args.document]
+    output_dir = Path(args.output_dir or PROFILE_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler, pages, page_times = profile_document(document, os.path.join(tmp, f'{document.name}.pdf'))
+
+    print(f"{document.name}: {pages} pages laid out in {profiler.seconds:.3f}s "
+          f"({len(profiler.stats)} flowables, {sum(sum(s.calls.values()) for s in profiler.stats)} calls)")
+    print(f"\n{'Seconds':>8} {'Self':>7} {'Wrap':>5} {'Split':>5} {'Draw':>5} {'Page':>4}  {'Section':<24} Flowable")
+    for stats in profiler.slowest(args.top):
+        print(f"{stats.total:>8.4f} {stats.self_seconds:>7.4f} {stats.calls['wrap']:>5} {stats.calls['split']:>5} "
+              f"{stats.calls['draw']:>5} {stats.page or 0:>4}  {stats.section[:24]:<24} {stats.label}")
+    print(f"\n{'Seconds':>8}  Section")
+    for section, seconds in sorted(profiler.sections.items(), key=lambda item: item[1], reverse=True):
+        print(f"{seconds:>8.4f}  {section}")
+    print(f"\n{'Page':>4} {'Wall s':>7} {'Flowables s':>11}")
+    for page, wall, flowables in page_times:
+        print(f"{page:>4} {wall:>7.4f} {flowables:>11.4f}")
+
+    folded = output_dir / f'{document.name}.folded'
+    pages_tsv = output_dir / f'{document.name}-pages.tsv'
+    profiler.write_folded(folded)
+    profiler.write_pages(pages_tsv, page_times)
+    print(f"\nFlame graph stacks: {folded} (flamegraph.pl {folded} > {document.name}.svg, or open in speedscope)")
+    print(f"Page timings: {pages_tsv}")
+    return 0
+
+def cmd_stamp(args):
+    from .build import discover_documents
+    from .pdf.document import render_if_changed
+    from .pdf.stamp import available, stamp_copies
+
+    if not available():
+        print("Error: stamping needs pypdf (pip3 install pypdf)", file=sys.stderr)
+        return 1
+    documents = discover_documents()
+    if args.document not in documents:
+        print(f"Error: unknown document {args.document!r} (one of {', '.join(documents)})", file=sys.stderr)
+        return 1
+    recipients = list(args.recipients)
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            recipients += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    if not recipients:
+        print("Error: no recipients (name them, or pass --file with one per line)", file=sys.stderr)
+        return 1
+    document = documents[args.document]
+    pages, rendered = render_if_changed(document)
+    print(f"{document.name}: {pages} pages, {'built' if rendered else 'up to date'}")
+    stamp_copies(document.output_path, recipients, args.output_dir, jobs=args.jobs)
+    return 0
+
+def cmd_diff(args):
+    import time
+
+    from .build import DEFINITION_GLOB, discover_definitions
+    from .pdf.diff import diff_definitions, html_report
+
+    def definition(name):
+        if os.path.exists(name):
+            return name
+        path = discover_definitions().get(name)
+        if path is None:
+            raise KeyError(f"{name!r} is neither a definition file nor a document defined by one ({DEFINITION_GLOB})")
+        return path
+
+    try:
+        old, new = definition(args.old), definition(args.new)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    plan_diff = diff_definitions(old, new)
+    seconds = time.perf_counter() - started
+    for section in plan_diff.sections:
+        if section.status != 'unchanged' or args.all:
+            print(f"  {section.status:<9} {section.title}" + (f"  ({len(section.changes)} change(s))"
+                                                             if section.changes else ''))
+    print(f"{plan_diff.summary()} [{seconds * 1000:.1f} ms]")
+    if args.html:
+        Path(args.html).write_text(html_report(plan_diff), encoding='utf-8')
+        print(f"HTML report: {args.html}")
+    if args.pdf:
+        # Only the changelog PDF needs the layout engine
+        from .pdf.diff import changelog_story
+        from .pdf.flowables import add_page_number, create_document
+        from .pdf.theme import get_styles
+
+        story = changelog_story(plan_diff, get_styles())
+        create_document(args.pdf).build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
+        print(f"Changelog PDF: {args.pdf}")
+    return 0
+
+def cmd_schedule(args):
+    from .schedule import Schedule
+    from .tasks import load_tasks
+
+    try:
+        schedule = Schedule(load_tasks())
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for task_id, dep in schedule.missing:
+        print(f"Warning: task {task_id} depends on unknown task {dep}", file=sys.stderr)
+    print(f"Earliest finish: {schedule.finish_date()}")
+    print("\nCritical path:")
+    for task in schedule.critical_path():
+        entry = schedule[task.id]
+        slack = '-' if entry.slack is None else f"{entry.slack}d"
+        print(f"  {task.id:>4}  {entry.earliest_start} -> {entry.earliest_finish}  {slack:>5}  {task.name}")
+    risky = schedule.at_risk(args.slack)
+    print(f"\nTasks with slack under {args.slack} day(s): {len(risky)}")
+    for entry in risky:
+        print(f"  {entry.task.id:>4}  {entry.slack:>4}d  due {entry.task.due_date}  {entry.task.name}")
+    return 0
+
+def cmd_email(args):
+    from datetime import date
+
+    from .emails import render_emails
+
+    start = date.fromisoformat(args.date) if args.date else date.today()
+    end = date.fromisoformat(args.to) if args.to else None
+    try:
+        outputs = render_emails(start, end, output_dir=args.output_dir)
+    except (LookupError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for output in outputs:
+        print(f"Generated: {output}")
+    if args.open and outputs:
+        import webbrowser
+        webbrowser.open(Path(outputs[-1]).resolve().as_uri())
+    if not outputs:
+        print(f"No meeting notes found between {start} and {end}", file=sys.stderr)
+        return 1
+    return 0
+
+def cmd_actions(args):
+    from .actions import ACTION_ITEMS_FILE, format_ar, process_notes, read_tsv, tsv_rows, update_tsv, write_tsv
+
+    items, added = process_notes(write=not args.dry_run)
+    for item in (items if args.list else added):
+        print(f"{format_ar(item.ar)}  {item.meeting_date}  {item.owner:<10} {item.action}"
+              + (f"  (due {item.due})" if item.due else ''))
+    verb = 'Found' if args.dry_run else 'Extracted'
+    print(f"{verb} {len(added)} new action item(s); {len(items)} in total", file=sys.stderr)
+    if args.tsv:
+        # Merge into the target's own rows; stdout (or a new file) starts from the sheet's TSV
+        target = args.tsv != '-' and os.path.exists(args.tsv)
+        rows = tsv_rows(items, read_tsv(args.tsv if target else ACTION_ITEMS_FILE))
+        if args.tsv == '-':
+            write_tsv(rows, sys.stdout)
+        elif not update_tsv(rows, args.tsv, write=not args.dry_run):
+            print(f"{args.tsv} is already up to date", file=sys.stderr)
+        elif args.dry_run:
+            print(f"{args.tsv} would be updated (not written: --dry-run)", file=sys.stderr)
+    return 0
+
+def cmd_search(args):
+    import time
+
+    from .search import open_index
+
+    started = time.perf_counter()
+    index = open_index(rebuild=args.rebuild)
+    loaded = time.perf_counter()
+    try:
+        hits = index.search(' '.join(args.query), limit=args.limit)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    searched = time.perf_counter()
+    for path, line, text in hits:
+        print(f"{path}:{line}: {text}")
+    print(f"{len(hits)} match(es) in {(searched - loaded) * 1000:.1f} ms "
+          f"(index load {(loaded - started) * 1000:.0f} ms, {len(index.files)} files)", file=sys.stderr)
+    return 0 if hits else 1
+
+def cmd_mesh(args):
+    from .mesh import MATERIALS, Mesh, find_parts, size_problem
+
+    if args.material not in MATERIALS:
+        print(f"Error: unknown material {args.material!r} (one of {', '.join(MATERIALS)})", file=sys.stderr)
+        return 1
+    print(f"{'Part':<28} {'Triangles':>9}  {'Size (mm)':<22} {'Vol cm3':>9} {'Area cm2':>9} "
+          f"{args.material + ' g':>9} {'Resin $':>8}")
+    for path in args.paths or find_parts():
+        mesh = Mesh.from_file(path)
+        size = ' x '.join(f"{d:.0f}" for d in mesh.size)
+        problem = size_problem(mesh)
+        if problem:
+            # No mass or cost for a part whose units are in doubt
+            print(f"Warning: {problem}", file=sys.stderr)
+            mass, cost = f"{'-':>9}", f"{'-':>8}"
+        else:
+            mass, cost = f"{mesh.mass(args.material):>9.1f}", f"{mesh.material_cost(args.material):>8.2f}"
+        print(f"{mesh.name[:28]:<28} {len(mesh):>9}  {size:<22} {mesh.volume / 1000:>9.1f} "
+              f"{mesh.area / 100:>9.1f} {mass} {cost}")
+    return 0
+
+def cmd_preview(args):
+    from .mesh import Mesh, find_parts
+    from .simplify import IndexedMesh, decimate, write_ply
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print(f"{'Part':<28} {'Triangles':>9} {'Welded':>7} {'Preview':>7}  {'STL KB':>7} {'PLY KB':>7}")
+    for path in args.paths or find_parts():
+        mesh = Mesh.from_file(path)
+        welded = IndexedMesh.from_mesh(mesh)
+        preview = decimate(welded, args.triangles)
+        output = output_dir / f'{mesh.name}.ply'
+        write_ply(preview, output)
+        print(f"{mesh.name[:28]:<28} {len(mesh):>9} {len(welded.vertices):>7} {len(preview):>7}  "
+              f"{os.path.getsize(path) / 1024:>7.0f} {os.path.getsize(output) / 1024:>7.0f}")
+    return 0
+
+def cmd_thumbnails(args):
+    from .mesh import find_parts
+    from .thumbnails import VIEWS, render_thumbnails
+
+    if args.view not in VIEWS:
+        print(f"Error: unknown view {args.view!r} (one of {', '.join(VIEWS)})", file=sys.stderr)
+        return 1
+    for stl, png in render_thumbnails(args.paths or find_parts(), args.size, args.view, args.jobs).items():
+        print(f"{stl} -> {png}")
+    return 0
+
+def cmd_watch(args):
+    from .watcher import watch
+
+    watch(quiet=args.quiet, max_delay=args.max_delay, push=not args.no_push)
+    return 0
+
+def cmd_sync(args):
+    from .sheets import MOCK_FILE, MockBackend, SheetSync, WebhookBackend, benchmark
+
+    if args.benchmark:
+        print(f"{'Scenario':<14} {'Syncs':>5} {'Trips':>5} {'Ranges':>6} {'Rows':>6} {'Cells':>6} "
+              f"{'Per-cell':>8} {'Seconds':>8}")
+        for name, results in benchmark(args.benchmark, args.latency):
+            print(f"{name:<14} {len(results):>5} {sum(r.round_trips for r in results):>5} "
+                  f"{sum(len(r.updates) for r in results):>6} {sum(r.rows for r in results):>6} "
+                  f"{sum(r.cells for r in results):>6} {sum(r.changed for r in results):>8} "
+                  f"{sum(r.seconds for r in results):>8.3f}")
+        print("Per-cell: calls a setValue per changed cell would need (one round trip each)")
+        return 0
+
+    url = args.url or os.environ.get('SHEETS_WEBHOOK_URL')
+    if args.mock or not url:
+        backend = MockBackend(args.mock or MOCK_FILE)
+    else:
+        backend = WebhookBackend(url, args.token)
+    result = SheetSync(backend).sync(dry_run=args.dry_run)
+    for update in result.updates:
+        print(f"{update['sheet']}!{update['range']}  {len(update['values'])} row(s)")
+    if result.conflicts:
+        print(f"Kept {len(result.conflicts)} cell(s) already filled in the sheet (first sync): "
+              f"{', '.join(result.conflicts[:10])}{' ...' if len(result.conflicts) > 10 else ''}", file=sys.stderr)
+    print(f"{'Would send' if args.dry_run else 'Sent'} {result.rows} row(s), {result.cells} cell(s) "
+          f"in {len(result.updates)} range(s), {result.round_trips} round trip(s), {result.seconds:.3f}s")
+    return 0
+
+def cmd_status(args):
+    import shutil
+
+    from .status import COMMAND_MODULES, dependencies, git, import_report, watcher_running
+
+    unknown = [c for c in args.commands if c not in COMMAND_MODULES]
+    if unknown:
+        print(f"Error: unknown command(s) {', '.join(unknown)} (one of {', '.join(COMMAND_MODULES)})",
+              file=sys.stderr)
+        return 1
+    print("=== PopTop Automation Status ===")
+    print()
+    running = watcher_running()
+    if running is None:
+        print("File Watcher: unknown (no pgrep)")
+    else:
+        print("File Watcher: " + ("RUNNING" if running else "NOT RUNNING (start with: poptop watch)"))
+    print()
+    print("Git Status:")
+    print(git('status', '-s'))
+    print()
+    print("Recent Commits:")
+    print(git('log', '--oneline', '-3'))
+    print()
+    print("Dependencies:")
+    if sys.platform == 'darwin':
+        print("  fswatch: " + ("installed" if shutil.which('fswatch')
+                               else "not installed (watcher polls instead; brew install fswatch)"))
+    for module, purpose, hint, installed in dependencies():
+        print(f"  {module}: " + ("installed" if installed else f"NOT INSTALLED ({hint})") + f" - {purpose}")
+    if args.imports:
+        print()
+        print("Startup (fresh interpreter, -X importtime):")
+        if import_report(args.commands or None):
+            return 1
+    return 0
+
+def cmd_webhook(args):
+    from .webhook import serve
+
+    serve(args.host, args.port, quiet=args.quiet, max_delay=args.max_delay, token=args.token)
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='poptop', description='PopTop project tools', epilog=EXAMPLES,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command')
+
+    build = commands.add_parser('build', help='Render PopTop PDFs in parallel')
+    build.add_argument('documents', nargs='*', help='Document names (default: all)')
+    build.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+    build.add_argument('-f', '--force', action='store_true', help='Rebuild even if inputs are unchanged')
+    build.add_argument('--list', action='store_true', help='List discovered documents and exit')
+    build.add_argument('--optimize', type=int, nargs='?', const=9, metavar='LEVEL',
+                       help='Recompress and deduplicate the output (Flate level 0-9, default 9)')
+    build.add_argument('--embed-fonts', nargs='?', const='', metavar='DIR',
+                       help='Embed subset TrueType fonts from DIR (default: bundled Vera) instead of Helvetica')
+    build.set_defaults(func=cmd_build)
+
+    optimize = commands.add_parser('optimize', help='Recompress and deduplicate existing PDFs in place')
+    optimize.add_argument('paths', nargs='+', help='PDF files')
+    optimize.add_argument('--level', type=int, default=9, help='Flate level 0-9 (default: 9)')
+    optimize.set_defaults(func=cmd_optimize)
+
+    dashboard = commands.add_parser('dashboard', help='Compute Command Center stats from the task TSVs')
+    dashboard.add_argument('--today', help='Evaluate as of this date (YYYY-MM-DD)')
+    dashboard.add_argument('--json', metavar='PATH', help="Write the batched sheet payload ('-' for stdout)")
+    dashboard.add_argument('--html', metavar='PATH', help='Write the dashboard as HTML')
+    dashboard.add_argument('--pdf', metavar='PATH', help='Write the dashboard as PDF')
+    dashboard.set_defaults(func=cmd_dashboard)
+
+    schedule = commands.add_parser('schedule', help='Critical path and slack from task dependencies')
+    schedule.add_argument('--slack', type=int, default=0, help='List tasks with less slack than this (days)')
+    schedule.set_defaults(func=cmd_schedule)
+
+    email = commands.add_parser('email', help="Render a meeting's email draft as HTML for Gmail")
+    email.add_argument('date', nargs='?', help='Meeting date, YYYY-MM-DD (default: today)')
+    email.add_argument('--to', metavar='DATE', help='Render every meeting from date through this date')
+    email.add_argument('--output-dir', default='/tmp/poptop-emails', help='Where to write email-DATE.html')
+    email.add_argument('--open', action='store_true', help='Open the (last) email in the browser to copy into Gmail')
+    email.set_defaults(func=cmd_email)
+
+    actions = commands.add_parser('actions', help='Extract ==Owner== action items from the meeting notes')
+    actions.add_argument('--dry-run', action='store_true', help="Report new items without numbering or writing them")
+    actions.add_argument('--list', action='store_true', help='List every action item, not just new ones')
+    actions.add_argument('--tsv', metavar='PATH',
+                         help="Write all items in the Action Items sheet TSV schema ('-' for stdout)")
+    actions.set_defaults(func=cmd_actions)
+
+    search = commands.add_parser('search', help='Search plans, notes, docs and generator text')
+    search.add_argument('query', nargs='+',
+                        help='Words, "quoted phrases", owner:NAME, phase:N, date:YYYY[-MM[-DD]], in:PATH')
+    search.add_argument('-n', '--limit', type=int, help='Show at most this many matches')
+    search.add_argument('--rebuild', action='store_true', help='Reindex every file from scratch')
+    search.set_defaults(func=cmd_search)
+
+    mesh = commands.add_parser('mesh', help='Measure the CAD STL parts (volume, area, size, material)')
+    mesh.add_argument('paths', nargs='*', help='STL files (default: every STL in cad-files)')
+    mesh.add_argument('--material', default='ABS', help='Material for mass and resin cost (default: ABS)')
+    mesh.set_defaults(func=cmd_mesh)
+
+    preview = commands.add_parser('preview', help='Write decimated, indexed PLY previews of the CAD STL parts')
+    preview.add_argument('paths', nargs='*', help='STL files (default: every STL in cad-files)')
+    preview.add_argument('--triangles', type=int, default=5000, help='Triangle budget per part (default: 5000)')
+    preview.add_argument('--output-dir', default='/tmp/poptop-previews', help='Where to write NAME.ply')
+    preview.set_defaults(func=cmd_preview)
+
+    thumbnails = commands.add_parser('thumbnails', help='Render cached PNG thumbnails of the CAD STL parts')
+    thumbnails.add_argument('paths', nargs='*', help='STL files (default: every STL in cad-files)')
+    thumbnails.add_argument('--view', default='iso', help='Camera: iso, front, side or top (default: iso)')
+    thumbnails.add_argument('--size', type=int, default=480, help='Image width and height in pixels (default: 480)')
+    thumbnails.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+    thumbnails.set_defaults(func=cmd_thumbnails)
+
+    watch = commands.add_parser('watch', help='Auto-commit and push meeting note changes in batches')
+    watch.add_argument('--quiet', type=float, default=2.0, help='Commit after this many quiet seconds (default: 2)')
+    watch.add_argument('--max-delay', type=float, default=30.0,
+                       help='Commit after this many seconds even if notes keep changing (default: 30)')
+    watch.add_argument('--no-push', action='store_true', help='Commit locally without pushing')
+    watch.set_defaults(func=cmd_watch)
+
+    sync = commands.add_parser('sync', help='Send changed Tasks/Phases/Risks/Action Items rows to the sheet in one batch')
+    sync.add_argument('--url', help='Apps Script web app URL (default: $SHEETS_WEBHOOK_URL)')
+    sync.add_argument('--token', help='Shared secret matching the SYNC_TOKEN script property (default: $SHEETS_WEBHOOK_TOKEN)')
+    sync.add_argument('--mock', help='Sync into this JSON file instead (default without a URL: .poptop-cache/mock-sheets.json)')
+    sync.add_argument('--dry-run', action='store_true', help='Show the ranges that would be sent')
+    sync.add_argument('--benchmark', type=int, metavar='EDITS', help='Benchmark EDITS edits against a fresh mock sheet')
+    sync.add_argument('--latency', type=float, default=0.0, help='Simulated seconds per mock round trip (benchmark)')
+    sync.set_defaults(func=cmd_sync)
+
+    webhook = commands.add_parser('webhook', help='Local stand-in for the Sheets sync webhook (coalesces refreshes)')
+    webhook.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    webhook.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    webhook.add_argument('--token', help='Shared secret data events must carry (default: $SHEETS_WEBHOOK_TOKEN)')
+    webhook.add_argument('--quiet', type=float, default=2.0,
+                         help='Refresh after this many quiet seconds per repo (default: 2)')
+    webhook.add_argument('--max-delay', type=float, default=30.0,
+                         help='Refresh after this many seconds even if events keep coming (default: 30)')
+    webhook.set_defaults(func=cmd_webhook)
+
+    stamp = commands.add_parser('stamp', help='Watermarked per-recipient copies of a built PDF (no re-layout)')
+    stamp.add_argument('recipients', nargs='*', help='Recipient names')
+    stamp.add_argument('-f', '--file', help='File with one recipient per line (# comments)')
+    stamp.add_argument('--document', default='business-plan', help='Document to stamp (default: business-plan)')
+    stamp.add_argument('--output-dir', default='/tmp/poptop-copies', help='Where to write the copies and distribution.tsv')
+    stamp.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+    stamp.set_defaults(func=cmd_stamp)
+
+    diff = commands.add_parser('diff', help='Structural diff between two plan definitions (sections, tables, rows)')
+    diff.add_argument('old', help='Older document name or .pdf.md definition (e.g. execution-plan-v1)')
+    diff.add_argument('new', help='Newer document name or .pdf.md definition (e.g. execution-plan-v2.1)')
+    diff.add_argument('--html', help='Write an HTML report here')
+    diff.add_argument('--pdf', help='Write a changelog PDF here')
+    diff.add_argument('--all', action='store_true', help='List unchanged sections too')
+    diff.set_defaults(func=cmd_diff)
+
+    profile = commands.add_parser('profile', help='Time every flowable of one document build (flame graph + per-page report)')
+    profile.add_argument('document', help='Document name (see build --list)')
+    profile.add_argument('--top', type=int, default=15, help='Slowest flowables to list (default: 15)')
+    profile.add_argument('--output-dir', help='Where to write the .folded stacks and page timings (default: .poptop-cache/profiles)')
+    profile.set_defaults(func=cmd_profile)
+
+    bench = commands.add_parser('bench', help='Benchmark the document generators against a stored baseline')
+    bench.add_argument('documents', nargs='*',
+                       help='Documents to run (default: all, plus the stress-100/stress-1000 documents)')
+    bench.add_argument('-n', '--runs', type=int, default=5,
+                       help='Renders per document; time is the fastest, story/layout the medians (default: 5)')
+    bench.add_argument('--save', action='store_true', help='Store these results as the baseline')
+    bench.add_argument('--baseline', help='Baseline file (default: .poptop-cache/bench-baseline.json)')
+    bench.add_argument('--threshold', type=float, default=0.25,
+                       help='Fail when time, pages/s, peak RSS or size is this much worse (default: 0.25)')
+    bench.add_argument('--json', help='Also write the results to this file')
+    bench.set_defaults(func=cmd_bench)
+
+    status = commands.add_parser('status', help='Watcher, git and dependency status (--imports: startup times)')
+    status.add_argument('--imports', action='store_true',
+                        help='Time each command\'s cold start and name heavy imports; fails over the budget')
+    status.add_argument('commands', nargs='*', help='Commands to time with --imports (default: all)')
+    status.set_defaults(func=cmd_status)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
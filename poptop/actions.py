@@ -0,0 +1,313 @@
+"""
+PopTop action items
+Pulls action items (ARs) out of the meeting notes without leaving the
+machine. A line that highlights an owner is an action item for them:
+
+    - ==Brian== to send a prototype to Vulcan Springs (due Feb 20)
+
+The first highlight is the owner, the rest of the line is the action and an
+optional "(due ...)" / "(by ...)" is the due date. Each new item gets the
+next AR number from a counter shared by every meeting, is added to the
+file's "Action Items" table (created after the header if missing), and the
+line is rewritten as "Brian to send ... (AR-009)" so it is never extracted
+twice. Existing Action Items tables are read as they are.
+
+Files are streamed line by line and only files with new items are
+rewritten. Rows come out in the dashboard/initial-action-items-data.tsv
+schema.
+"""
+
+import csv
+import os
+import re
+from datetime import date
+
+from . import ROOT
+from .notes import NOTES_DIR, is_email_draft, note_date
+
+ACTION_ITEMS_FILE = ROOT / 'dashboard' / 'initial-action-items-data.tsv'
+COUNTER_FILE = ROOT / 'dashboard' / 'ar-counter.txt'
+
+TSV_COLUMNS = ('AR#', 'Meeting Date', 'Owner', 'Action', 'Due', 'Status', 'Completed Date', 'Notes')
+TABLE_COLUMNS = ('AR#', 'Owner', 'Action', 'Due', 'Status')
+
+_HIGHLIGHT_RE = re.compile(r'==([^=\n]+?)==')
+_AR_RE = re.compile(r'\bAR-(\d{3,})\b')
+_DUE_RE = re.compile(r'\s*\((?:due|by)[:\s]+([^)]+)\)', re.IGNORECASE)
+_HEADING_RE = re.compile(r'^#{1,6}\s+Action Items\b', re.IGNORECASE)
+_LIST_RE = re.compile(r'^(\s*(?:[-*+]|\d+[.)])\s+(?:\[.\]\s+)?)')
+_MONTHS = {m: i for i, m in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1)}
+_MONTH_DAY_RE = re.compile(r'\b([A-Za-z]{3})[a-z]*\.?\s+(\d{1,2})(?:\s*-\s*(\d{1,2}))?\b')
+
+def format_ar(number):
+    return f'AR-{number:03d}'
+
+def due_date(text, year):
+    """
+    ISO date for a due note: '2026-02-13', 'Feb 13', 'WW06 (Feb 10-14)' (the
+    range's end). None for anything else (e.g. a bare work week).
+    """
+    try:
+        return date.fromisoformat(text.strip())
+    except ValueError:
+        pass
+    match = _MONTH_DAY_RE.search(text)
+    if match and match.group(1).lower() in _MONTHS:
+        try:
+            return date(year, _MONTHS[match.group(1).lower()], int(match.group(3) or match.group(2)))
+        except ValueError:
+            return None
+    return None
+
+def _plain_date(text):
+    """True if a due note is just a date ('Feb 13', '2026-02-13')"""
+    text = text.strip()
+    match = _MONTH_DAY_RE.fullmatch(text)
+    return bool(match and not match.group(3)) or bool(re.fullmatch(r'\d{4}-\d{2}-\d{2}', text))
+
+class ActionItem:
+    """One row of an Action Items table"""
+    __slots__ = ('ar', 'owner', 'action', 'due', 'status', 'meeting_date', 'source')
+
+    def __init__(self, ar, owner, action, due='', status='Open', meeting_date=None, source=None):
+        self.ar = ar
+        self.owner = owner
+        self.action = action
+        self.due = due
+        self.status = status
+        self.meeting_date = meeting_date
+        self.source = source
+
+    def __repr__(self):
+        return f"ActionItem({format_ar(self.ar)}, {self.owner!r}, {self.action!r})"
+
+    def table_cells(self):
+        return [format_ar(self.ar), self.owner, self.action, self.due, self.status]
+
+class NotesScan:
+    """What one streamed notes file contains"""
+    def __init__(self, path):
+        self.path = path
+        self.meeting_date = note_date(os.path.basename(path))
+        self.items = []          # rows of its Action Items table
+        self.highlights = []     # (line number, owner, action, due) not yet extracted
+        self.max_ar = 0          # highest AR number mentioned anywhere
+        self.table_start = None  # line numbers of the table: [start, end)
+        self.table_end = None
+        self.table_aligned = False
+        self.rule = None         # first '---' line and first blank line, where
+        self.blank = None        # a missing table is inserted
+
+def _cells(line):
+    """Cells of a Markdown table row; '\\|' is a literal pipe inside a cell"""
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', line.strip().strip('|'))]
+
+def _escape(cell):
+    return cell.replace('|', '\\|')
+
+def _highlight(line):
+    """(owner, action, due) for an owner-highlighted line, else None"""
+    match = _HIGHLIGHT_RE.search(line)
+    if not match:
+        return None
+    owner = match.group(1).strip()
+    # The action follows the owner ("==Brian== to send ..."); if nothing
+    # does, it is what came before ("Send the deck ==Brian==")
+    action = line[match.end():]
+    if not action.strip(' .:-–—'):
+        action = _LIST_RE.sub('', line[:match.start()])
+    due = ''
+    due_match = _DUE_RE.search(action)
+    if due_match:
+        due = due_match.group(1).strip()
+        action = action[:due_match.start()] + action[due_match.end():]
+    action = re.sub(r'^\s*(?:[:\-–—]\s*|to\s+)', '', action).strip()
+    action = _HIGHLIGHT_RE.sub(r'\1', action)
+    return owner, action[:1].upper() + action[1:], due
+
+def scan_notes(path):
+    """Stream one notes file into a NotesScan"""
+    scan = NotesScan(path)
+    in_section = in_table = False
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f):
+            line = line.rstrip('\n')
+            for ar in _AR_RE.findall(line):
+                scan.max_ar = max(scan.max_ar, int(ar))
+            stripped = line.strip()
+
+            if stripped == '---' and scan.rule is None:
+                scan.rule = number
+            elif not stripped and number and scan.blank is None:
+                scan.blank = number
+            if stripped.startswith('#'):
+                in_section = bool(_HEADING_RE.match(stripped))
+                in_table = False
+                continue
+            if in_section and stripped.startswith('|'):
+                cells = _cells(stripped)
+                if not in_table:
+                    scan.table_start = number
+                in_table = True
+                scan.table_end = number + 1
+                if len(cells) >= 5 and _AR_RE.fullmatch(cells[0]):
+                    scan.table_aligned |= line != '| ' + ' | '.join(map(_escape, cells)) + ' |'
+                    scan.items.append(ActionItem(
+                        int(cells[0][3:]), cells[1], cells[2], cells[3], cells[4],
+                        scan.meeting_date, path))
+                continue
+            if in_table:
+                in_section = in_table = False
+            if stripped.startswith('|'):
+                continue  # a highlight in some other table is formatting, not an owner
+
+            if not is_email_draft(path) and not _AR_RE.search(line):
+                found = _highlight(line)
+                if found:
+                    scan.highlights.append((number,) + found)
+    return scan
+
+def _render_table(items, aligned):
+    rows = [list(TABLE_COLUMNS)] + [[_escape(cell) for cell in item.table_cells()] for item in items]
+    if not aligned:
+        lines = ['| ' + ' | '.join(rows[0]) + ' |', '|' + '|'.join('-----' for _ in TABLE_COLUMNS) + '|']
+        return lines + ['| ' + ' | '.join(row) + ' |' for row in rows[1:]]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(TABLE_COLUMNS))]
+    def line(row):
+        return '| ' + ' | '.join(cell.ljust(width) for cell, width in zip(row, widths)) + ' |'
+    return [line(rows[0]), '| ' + ' | '.join('-' * width for width in widths) + ' |'] + [line(row) for row in rows[1:]]
+
+def _rewrite(scan, new_items):
+    """Write new_items into the file's table and tag their source lines"""
+    with open(scan.path, encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    for (number, _, _, _), item in zip(scan.highlights, new_items):
+        line = _HIGHLIGHT_RE.sub(r'\1', lines[number], count=1)
+        lines[number] = f"{line.rstrip()} ({format_ar(item.ar)})"
+
+    items = scan.items + new_items
+    if scan.table_start is not None:
+        lines[scan.table_start:scan.table_end] = _render_table(items, scan.table_aligned)
+    elif scan.rule is not None:
+        lines[scan.rule + 1:scan.rule + 1] = ['', '## Action Items', ''] + _render_table(items, True)
+    else:
+        at = scan.blank if scan.blank is not None else len(lines)
+        lines[at:at] = ['', '## Action Items', ''] + _render_table(items, True)
+    with open(scan.path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+def read_counter(path=COUNTER_FILE):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return int(f.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+def write_counter(number, path=COUNTER_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'{number}\n')
+
+def notes_files(notes_dir=NOTES_DIR):
+    """Markdown notes, oldest meeting first (email drafts after the notes they copy)"""
+    with os.scandir(notes_dir) as entries:
+        paths = [e.path for e in entries if e.name.endswith('.md') and e.is_file()]
+    def order(path):
+        name = os.path.basename(path)
+        return note_date(name) or date.min, is_email_draft(name), name
+    return sorted(paths, key=order)
+
+def process_notes(paths=None, counter_path=COUNTER_FILE, write=True):
+    """
+    Extract every action item from the notes, numbering new ones from the
+    global counter. With write=True new items are written back to their
+    files and the counter is saved. Returns (all items, new items), oldest
+    first.
+    """
+    paths = notes_files() if paths is None else paths
+    scans = [scan_notes(path) for path in paths]
+    last = max([read_counter(counter_path)] + [scan.max_ar for scan in scans])
+
+    items = {}
+    added = []
+    for scan in scans:
+        for item in scan.items:
+            items.setdefault(item.ar, item)
+        new_items = []
+        for _, owner, action, due in scan.highlights:
+            last += 1
+            new_items.append(ActionItem(last, owner, action, due, 'Open', scan.meeting_date, scan.path))
+        for item in new_items:
+            items[item.ar] = item
+        added.extend(new_items)
+        if write and new_items:
+            _rewrite(scan, new_items)
+    if write:
+        write_counter(last, counter_path)
+    return [items[ar] for ar in sorted(items)], added
+
+def read_tsv(path=ACTION_ITEMS_FILE):
+    """{AR#: row dict} from an action items TSV (empty if it does not exist)"""
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            return {row['AR#']: row for row in csv.DictReader(f, delimiter='\t')}
+    except FileNotFoundError:
+        return {}
+
+def _ar_order(ar):
+    """Sort key for AR# cells: numbered ARs in order, anything else after them"""
+    match = _AR_RE.fullmatch(ar)
+    return (0, int(match.group(1)), '') if match else (1, 0, ar)
+
+def tsv_rows(items, existing=None):
+    """
+    Rows (lists in TSV_COLUMNS order) for items plus every existing row
+    (from read_tsv) the notes no longer mention, such as items added in
+    the sheet, merged by AR#. Values already in existing are kept where the
+    notes do not say otherwise.
+    """
+    existing = existing or {}
+    rows = {}
+    for item in items:
+        ar = format_ar(item.ar)
+        row = dict(existing.get(ar) or {column: '' for column in TSV_COLUMNS})
+        year = item.meeting_date.year if item.meeting_date else date.today().year
+        due = due_date(item.due, year) if item.due else None
+        row.update({'AR#': ar, 'Owner': item.owner, 'Action': item.action, 'Status': item.status})
+        if item.meeting_date:
+            row['Meeting Date'] = item.meeting_date.isoformat()
+        if due:
+            row['Due'] = due.isoformat()
+        if not row.get('Notes') and item.due and not _plain_date(item.due):
+            row['Notes'] = item.due  # keep work weeks and ranges the date drops
+        rows[ar] = [row.get(column) or '' for column in TSV_COLUMNS]
+    for ar, row in existing.items():
+        if ar not in rows:
+            rows[ar] = [row.get(column) or '' for column in TSV_COLUMNS]
+    return [rows[ar] for ar in sorted(rows, key=_ar_order)]
+
+def write_tsv(rows, f):
+    """Write a header plus rows to an open text file"""
+    writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+    writer.writerow(TSV_COLUMNS)
+    writer.writerows(rows)
+
+def update_tsv(rows, path=ACTION_ITEMS_FILE, write=True):
+    """
+    Write a header plus rows to path unless it already holds the same
+    values (trailing empty cells aside). Returns True if it differed (and,
+    with write, was written).
+    """
+    width = len(TSV_COLUMNS)
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            current = [row + [''] * (width - len(row)) for row in csv.reader(f, delimiter='\t')]
+    except FileNotFoundError:
+        current = None
+    if current == [list(TSV_COLUMNS)] + [list(row) for row in rows]:
+        return False
+    if not write:
+        return True
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        write_tsv(rows, f)
+    return True
@@ -0,0 +1,170 @@
+"""
+PopTop document benchmarks
+Renders the business plan, the execution plans and synthetic stress
+documents built from the same flowable helpers, N times each, and records
+wall time, pages/sec, flowable count, peak RSS and output size. Time is
+the fastest of the N renders: run-to-run noise only ever adds time, so the
+minimum is far steadier than a single run or the mean.
+
+Every document is measured in a fresh worker process, so its peak RSS is
+its own, and renders to a temporary file with the build caches bypassed:
+the numbers are for a cold, full layout. Results can be saved as a
+baseline (.poptop-cache/bench-baseline.json, per machine) and later runs
+compared against it with a regression threshold.
+"""
+
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import ROOT
+
+BASELINE_FILE = ROOT / '.poptop-cache' / 'bench-baseline.json'
+THRESHOLD = 0.25  # fraction a gated metric may get worse before it counts as a regression (above timing noise)
+RUNS = 5
+
+STRESS_PAGES = {'stress-100': 100, 'stress-1000': 1000}
+
+# Gated metrics: +1 when bigger is worse, -1 when smaller is worse
+GATES = {
+    'seconds': 1,
+    'pages_per_second': -1,
+    'peak_rss_mb': 1,
+    'output_bytes': 1,
+}
+
+def stress_story(styles, pages):
+    """pages pages of typical plan content, one section per page, from the shared helpers"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import PageBreak, Paragraph, Spacer
+
+    from .pdf import (
+        create_data_table, create_metrics_row, create_section_title, create_titled_box,
+    )
+
+    story = []
+    for page in range(1, pages + 1):
+        story.extend(create_section_title(f"{page:04d} Stress Section"))
+        story.append(Paragraph(
+            "PopTop stress content: the same paragraphs, metric cards, tables and boxes the "
+            "plans are made of, repeated one section per page so layout cost scales with length. "
+            f"This is section {page} of {pages}.",
+            styles['BodyText']
+        ))
+        story.append(Spacer(1, 12))
+        story.append(create_metrics_row([
+            (f"{page}", "Section"), ("$375", "Target ASP"), ("60%", "Gross Margin"), ("Fall 2026", "Launch"),
+        ]))
+        story.append(Spacer(1, 12))
+        story.append(create_data_table(
+            ["Item", "Owner", "Due", "Status"],
+            [[f"Task {page}.{row}", "Paul Giarrizzo", "9/1/2026", "In Progress"] for row in range(1, 13)],
+            [2.75*inch, 1.5*inch, 1.0*inch, 1.25*inch]
+        ))
+        story.append(Spacer(1, 12))
+        story.append(create_titled_box("KEY POINT", "Every stress page carries a titled box as well."))
+        story.append(PageBreak())
+    return story[:-1]
+
+def _document(name):
+    from .build import discover_documents
+    from .pdf import Document
+
+    if name in STRESS_PAGES:
+        pages = STRESS_PAGES[name]
+        return Document(name, None, lambda styles: stress_story(styles, pages))
+    return discover_documents()[name]
+
+def _peak_rss_mb():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+def _measure(name, runs):
+    """Worker: build and render one document runs times; returns its metrics"""
+    from .pdf import get_styles, render
+
+    document = _document(name)
+    story_times, render_times = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, f'{name}.pdf')
+        for _ in range(runs):
+            started = time.perf_counter()
+            story = document.build_story(get_styles())
+            built = time.perf_counter()
+            flowables = len(story)
+            pages = render(document, output, story=story)
+            story_times.append(built - started)
+            render_times.append(time.perf_counter() - built)
+        size = os.path.getsize(output)
+    seconds = min(s + r for s, r in zip(story_times, render_times))
+    return {
+        'runs': runs,
+        'pages': pages,
+        'flowables': flowables,
+        'seconds': round(seconds, 4),
+        'story_seconds': round(statistics.median(story_times), 4),
+        'render_seconds': round(statistics.median(render_times), 4),
+        'pages_per_second': round(pages / seconds, 2),
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'output_bytes': size,
+    }
+
+def available():
+    """Names run_benchmarks accepts: every discovered document plus the stress documents"""
+    from .build import discover_documents
+
+    return list(discover_documents()) + list(STRESS_PAGES)
+
+def run_benchmarks(names, runs=RUNS, report=print):
+    """{name: metrics}, each document measured in its own fresh process"""
+    results = {}
+    context = multiprocessing.get_context('spawn')
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[name] = pool.submit(_measure, name, runs).result()
+        report(name, results[name])
+    return results
+
+def load_baseline(path=BASELINE_FILE):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(results, path=BASELINE_FILE):
+    """Merge results into the baseline file (documents not benchmarked keep their entry)"""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f'{path}.tmp'
+    with open(partial, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(partial, path)
+
+def change(old, new):
+    """Relative change from old to new (0.25 = 25% bigger)"""
+    return (new - old) / old if old else 0.0
+
+def regressions(results, baseline, threshold=THRESHOLD):
+    """[(name, metric, baseline value, new value, change)] for every gated metric worse by more than threshold"""
+    found = []
+    for name, metrics in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        for metric, sign in GATES.items():
+            if metric in old and metric in metrics:
+                delta = change(old[metric], metrics[metric])
+                if delta * sign > threshold:
+                    found.append((name, metric, old[metric], metrics[metric], delta))
+    return found
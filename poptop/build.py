@@ -0,0 +1,121 @@
+"""
+PopTop batch document builder
+Discovers every document (Markdown definitions and generator scripts)
+and renders them in parallel
+"""
+
+import importlib.util
+import os
+import time
+from functools import lru_cache
+
+from . import ROOT
+
+# Definitions and generator scripts live in the numbered project folders
+DEFINITION_GLOB = '[0-9][0-9]-*/**/*.pdf.md'
+GENERATOR_GLOB = '[0-9][0-9]-*/**/generate_*.py'
+
+def load_generator(path):
+    """Import a generator script by path and return its module"""
+    module_name = 'poptop_generator_' + path.stem
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def discover_definitions():
+    """Map document name -> definition file, parsing front matter only (no rendering imports)"""
+    from .pdf.definitions import load_definition
+
+    return {load_definition(path)['front']['name']: path for path in sorted(ROOT.glob(DEFINITION_GLOB))}
+
+@lru_cache(maxsize=None)
+def discover_documents():
+    """
+    Map document name -> Document for every definition file and every
+    generator that defines one. Definitions come from their mtime-cached
+    parsed data; a generator that wraps a definition yields the same name.
+    """
+    from .pdf.definitions import load_document
+
+    documents = {}
+    for path in sorted(ROOT.glob(DEFINITION_GLOB)):
+        document = load_document(path)
+        documents[document.name] = document
+    for path in sorted(ROOT.glob(GENERATOR_GLOB)):
+        document = getattr(load_generator(path), 'DOCUMENT', None)
+        if document is not None:
+            documents[document.name] = document
+    return documents
+
+def _render_one(name, force=False, optimize=None, fonts=None):
+    """Worker entry point: render a single document by name unless it is up to date"""
+    from .pdf import render_if_changed
+    from .pdf.optimize import optimize_pdf
+    from .pdf.theme import embed_fonts
+
+    if fonts is not None:
+        embed_fonts(fonts or None)
+    document = discover_documents()[name]
+    started = time.perf_counter()
+    options = {'optimize': optimize} if optimize is not None else None
+    pages, rendered = render_if_changed(document, force=force, options=options)
+    sizes = None
+    if rendered and optimize is not None:
+        sizes = optimize_pdf(document.output_path, optimize)
+    warnings = document.warnings() if rendered and document.warnings else []
+    return name, str(document.output_path), pages, time.perf_counter() - started, rendered, sizes, warnings
+
+def build_all(names=None, jobs=None, force=False, optimize=None, fonts=None, report=print):
+    """
+    Render the named documents (default: all) across a process pool,
+    skipping any whose output was already built from identical inputs.
+    optimize is a Flate level for the output optimizer (None: off); fonts
+    is a TrueType family directory to embed ('' for the bundled one, None:
+    base-14 Helvetica). Returns a list of (name, output_path, pages,
+    seconds, rendered, (bytes before, bytes after) or None, warnings) in
+    completion order; warnings (from Document.warnings) only for documents
+    that were rendered.
+    """
+    documents = discover_documents()
+    names = list(names or documents)
+    unknown = [n for n in names if n not in documents]
+    if unknown:
+        raise KeyError(f"Unknown document(s): {', '.join(unknown)}. "
+                       f"Available: {', '.join(documents)}")
+
+    # Imported here so modules that only need the globs (search) stay quick to import
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(names)))
+    started = time.perf_counter()
+    results = []
+
+    # Documents were discovered (and ReportLab imported) before the pool
+    # starts, so forked workers begin with everything already loaded.
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_render_one, name, force, optimize, fonts) for name in names]
+        for future in as_completed(futures):
+            result = future.result()
+            name, path, pages, seconds, rendered, sizes, warnings = result
+            results.append(result)
+            state = 'built' if rendered else 'up to date'
+            saved = ''
+            if sizes:
+                before, after = sizes
+                saved = f"  {(after - before) / 1024:+.1f} KB ({(after - before) / before:+.0%})"
+            report(f"  {name:<24} {pages:>3} pages  {seconds:6.2f}s  {state:<10}  {path}{saved}")
+            for warning in warnings:
+                report(f"    warning: {warning}")
+
+    total = time.perf_counter() - started
+    slowest = max((r[3] for r in results), default=0)
+    built = sum(1 for r in results if r[4])
+    report(f"Built {built} of {len(results)} document(s) in {total:.2f}s "
+           f"(slowest {slowest:.2f}s, sum {sum(r[3] for r in results):.2f}s, {jobs} worker(s))")
+    optimized = [r[5] for r in results if r[5]]
+    if optimized:
+        before, after = sum(s[0] for s in optimized), sum(s[1] for s in optimized)
+        report(f"Optimizer saved {(before - after) / 1024:.1f} KB of {before / 1024:.1f} KB "
+               f"({(before - after) / before:.0%}) across {len(optimized)} document(s)")
+    return results
@@ -0,0 +1,648 @@
+"""
+PopTop dashboard engine
+Computes the Command Center stats from the task TSVs in a single pass and
+renders them as one batched sheet payload, HTML or PDF.
+
+The sheet payload mirrors what updateDashboard() in Code.gs draws, but as
+equally sized 2-D grids (values, backgrounds, font colors, ...) so Apps
+Script can write the whole Dashboard tab with one range update
+(applyDashboardPayload in Code.gs).
+"""
+
+import csv
+from datetime import date, datetime, timedelta
+from html import escape
+
+from .tasks import DASHBOARD_DIR, TASK_FILES, Status, diff_tasks, edit_task, iter_tasks, load_tasks
+
+PHASES_FILE = DASHBOARD_DIR / 'initial-phases-data.tsv'
+
+# Matches CONFIG.WARNING_DAYS in Code.gs
+WARNING_DAYS = 3
+
+STAT_LABELS = ['Total Tasks', 'Completed', 'In Progress', 'Blocked', 'Not Started', 'Overdue']
+STAT_COLORS = ['#1a365d', '#38a169', '#3182ce', '#dd6b20', '#718096', '#e53e3e']
+
+MILESTONES = [
+    ['Reboot Call', 'Feb 6, 2026'],
+    ['Design Freeze', 'Apr 24, 2026'],
+    ['CLC Submission', 'May 1, 2026'],
+    ['CLC Approval (est.)', 'Jun 12 - Jul 24, 2026'],
+    ['Production Auth', 'Jul 31, 2026'],
+    ['Soft Launch', 'Aug 21, 2026'],
+    ['PUBLIC LAUNCH', 'Sep 1, 2026'],
+]
+
+PRIMARY = '#1a365d'
+LIGHT = '#f7fafc'
+MUTED = '#718096'
+DANGER = '#e53e3e'
+DANGER_LIGHT = '#fff5f5'
+WARNING = '#d69e2e'
+SUCCESS = '#38a169'
+WHITE = '#ffffff'
+BLACK = '#000000'
+
+SHEET_COLUMNS = 6
+COLUMN_WIDTHS = [200, 130, 100, 100, 100, 100]
+
+def _percent(done, total):
+    """Rounded like Math.round so the numbers match the Apps Script dashboard"""
+    return int(done * 100 / total + 0.5) if total else 0
+
+def _short_date(day):
+    return f"{day:%b} {day.day}" if day else ''
+
+def load_phases(path=PHASES_FILE):
+    """[(phase, name)] from the Phases TSV, in sheet order"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = csv.reader(f, delimiter='\t')
+        next(rows, None)
+        return [(row[0], row[1] if len(row) > 1 else '') for row in rows if row and row[0]]
+
+class DashboardStats:
+    """Everything the Command Center shows, gathered in one pass over the tasks"""
+    def __init__(self, today):
+        self.today = today
+        self.total = 0
+        self.by_status = dict.fromkeys(Status, 0)
+        self.phases = {}     # phase -> [total, completed]
+        self.owners = {}     # owner -> [in progress, completed, total, overdue]
+        self.overdue = []
+        self.due_soon = []
+        self.phase_names = {}
+        self.at_risk = []        # ScheduleEntry list from poptop.schedule
+        self.critical_path = []
+
+    def quick_stats(self):
+        """[(label, value, color)] for the stat cards"""
+        values = [
+            self.total,
+            self.by_status[Status.COMPLETE],
+            self.by_status[Status.IN_PROGRESS],
+            self.by_status[Status.BLOCKED],
+            self.by_status[Status.NOT_STARTED],
+            len(self.overdue),
+        ]
+        return list(zip(STAT_LABELS, values, STAT_COLORS))
+
+    def phase_progress(self):
+        """[(display name, completed, total, percent)] in phase order"""
+        rows = []
+        for phase, name in self.phase_names.items():
+            total, completed = self.phases.get(phase, (0, 0))
+            display = f"{phase}: {name}" if name else phase
+            rows.append((display, completed, total, _percent(completed, total)))
+        return rows
+
+    def workload(self):
+        """[(owner, in progress, completed, total, percent)]"""
+        return [(owner, active, done, total, _percent(done, total))
+                for owner, (active, done, total, _) in self.owners.items()]
+
+    def days_overdue(self, task):
+        return (self.today - task.due_date).days
+
+def _by_due_date(task):
+    return task.due_date, task.id
+
+def compute_stats(tasks, phases=None, today=None, warning_days=WARNING_DAYS):
+    """
+    Single pass over tasks: status counts, per-phase and per-owner tallies,
+    overdue and due-soon lists. phases is [(phase, name)] to fix the phase
+    order and names (default: phases in the order tasks mention them).
+    """
+    stats = DashboardStats(today or date.today())
+    today = stats.today
+    complete = Status.COMPLETE
+    in_progress = Status.IN_PROGRESS
+
+    for task in tasks:
+        stats.total += 1
+        stats.by_status[task.status] += 1
+        is_complete = task.status is complete
+
+        phase = stats.phases.get(task.phase)
+        if phase is None:
+            phase = stats.phases[task.phase] = [0, 0]
+        phase[0] += 1
+
+        owner = stats.owners.get(task.owner)
+        if owner is None:
+            owner = stats.owners[task.owner] = [0, 0, 0, 0]
+        owner[2] += 1
+
+        if is_complete:
+            phase[1] += 1
+            owner[1] += 1
+        elif task.status is in_progress:
+            owner[0] += 1
+
+        if not is_complete and task.due_date is not None:
+            days = (task.due_date - today).days
+            if days < 0:
+                stats.overdue.append(task)
+                owner[3] += 1
+            elif days <= warning_days:
+                stats.due_soon.append(task)
+
+    stats.overdue.sort(key=_by_due_date)
+    stats.due_soon.sort(key=_by_due_date)
+    if phases is None:
+        phases = [(phase, '') for phase in stats.phases]
+    stats.phase_names = dict(phases)
+    return stats
+
+def dashboard_stats(today=None):
+    """Stats for the checked-in dashboard TSVs, with schedule risk from the dependency graph"""
+    from .schedule import Schedule
+
+    store = load_tasks()
+    stats = compute_stats(store, load_phases(), today=today)
+    schedule = Schedule(store)
+    stats.at_risk = [e for e in schedule.at_risk() if e.task.status is not Status.COMPLETE]
+    stats.critical_path = schedule.critical_path()
+    return stats
+
+class DashboardAggregator:
+    """
+    Incrementally maintained dashboard stats. Counters and the overdue /
+    due-soon sets are adjusted per changed task row (from a TSV diff or a
+    sheet edit), so an update costs the same however many tasks there are.
+    update() then returns only the dashboard cells that changed.
+    """
+    def __init__(self, tasks=(), phases=None, today=None, warning_days=WARNING_DAYS):
+        self.today = today or date.today()
+        self.warning_days = warning_days
+        self.tasks = {}
+        self.by_due = {}     # due date -> {task id}
+        self.total = 0
+        self.by_status = dict.fromkeys(Status, 0)
+        self.phases = {}
+        self.owners = {}
+        self.overdue = set()
+        self.due_soon = set()
+        self.phase_names = dict(phases) if phases is not None else None
+        self.payload = None
+        # Owners and phases are listed in order of their first task in the TSVs,
+        # as compute_stats() lists them
+        self.position = {}   # task id -> row position in the TSVs
+        self._next_position = 0
+        self.members = {}    # ('owner' | 'phase', name) -> {task id}
+        self._first = {}     # ('owner' | 'phase', name) -> position of its first task, while valid
+        for task in tasks:
+            self.upsert(task)
+
+    def _classify(self, task, sign):
+        """Add (sign=1) or withdraw (sign=-1) a task's overdue/due-soon membership"""
+        if task.status is Status.COMPLETE or task.due_date is None:
+            return
+        days = (task.due_date - self.today).days
+        if days < 0:
+            (self.overdue.add if sign > 0 else self.overdue.discard)(task.id)
+            self.owners[task.owner][3] += sign
+        elif days <= self.warning_days:
+            (self.due_soon.add if sign > 0 else self.due_soon.discard)(task.id)
+
+    def _account(self, task, sign):
+        """Add (sign=1) or withdraw (sign=-1) a task's contribution to every counter"""
+        self.total += sign
+        self.by_status[task.status] += sign
+        is_complete = task.status is Status.COMPLETE
+
+        phase = self.phases.setdefault(task.phase, [0, 0])
+        phase[0] += sign
+        phase[1] += sign if is_complete else 0
+
+        owner = self.owners.setdefault(task.owner, [0, 0, 0, 0])
+        owner[0] += sign if task.status is Status.IN_PROGRESS else 0
+        owner[1] += sign if is_complete else 0
+        owner[2] += sign
+        self._classify(task, sign)
+        if owner[2] == 0:
+            del self.owners[task.owner]
+
+        for key in (('phase', task.phase), ('owner', task.owner)):
+            self._first.pop(key, None)
+            members = self.members.setdefault(key, set())
+            if sign > 0:
+                members.add(task.id)
+            else:
+                members.discard(task.id)
+                if not members:
+                    del self.members[key]
+
+        if task.due_date is not None:
+            due = self.by_due.setdefault(task.due_date, set())
+            if sign > 0:
+                due.add(task.id)
+            else:
+                due.discard(task.id)
+                if not due:
+                    del self.by_due[task.due_date]
+
+    def upsert(self, task):
+        """Apply one added or changed task row"""
+        old = self.tasks.get(task.id)
+        if old is not None:
+            self._account(old, -1)
+        else:
+            # A new row goes at the end; sync_files() corrects that if it is not
+            self.position[task.id] = self._next_position
+            self._next_position += 1
+        self.tasks[task.id] = task
+        self._account(task, 1)
+
+    def remove(self, task_id):
+        """Apply one deleted task row"""
+        old = self.tasks.pop(task_id, None)
+        if old is not None:
+            self._account(old, -1)
+            del self.position[task_id]
+
+    def apply_diff(self, changed, removed=()):
+        for task_id in removed:
+            self.remove(task_id)
+        for task in changed:
+            self.upsert(task)
+
+    def apply_edit(self, task_id, column, value):
+        """Apply a single-cell sheet edit (column name or 1-based number)"""
+        task = self.tasks[task_id]
+        edited = edit_task(task, column, value)
+        if edited is not task:
+            self.upsert(edited)
+
+    def sync_files(self, paths=TASK_FILES):
+        """Re-read the task TSVs and apply only the rows that differ; returns (changed, removed)"""
+        current = [task for path in paths for task in iter_tasks(path)]
+        changed, removed = diff_tasks(self.tasks.values(), current)
+        self.apply_diff(changed, removed)
+        position = {task.id: index for index, task in enumerate(current)}
+        if position != self.position:
+            self.position = position
+            self._next_position = len(current)
+            self._first.clear()
+        return len(changed), len(removed)
+
+    def set_today(self, today):
+        """Move the reference date, reclassifying only tasks due near the old or new date"""
+        if today == self.today:
+            return
+        # Membership can only change for due dates between the two windows
+        first = min(self.today, today) - timedelta(days=1)
+        last = max(self.today, today) + timedelta(days=self.warning_days)
+        affected = [self.tasks[task_id] for due, ids in self.by_due.items()
+                    if first <= due <= last for task_id in ids]
+        for task in affected:
+            self._classify(task, -1)
+        self.today = today
+        for task in affected:
+            self._classify(task, 1)
+
+    def _first_position(self, kind, name):
+        """Position of the first task with this owner or phase (recomputed only after it changed)"""
+        key = kind, name
+        first = self._first.get(key)
+        if first is None:
+            first = self._first[key] = min(self.position[task_id] for task_id in self.members[key])
+        return first
+
+    def stats(self):
+        """Snapshot as DashboardStats, for the existing renderers"""
+        stats = DashboardStats(self.today)
+        stats.total = self.total
+        stats.by_status = dict(self.by_status)
+        phases = sorted((phase for phase, counts in self.phases.items() if counts[0]),
+                        key=lambda phase: self._first_position('phase', phase))
+        stats.phases = {phase: list(self.phases[phase]) for phase in phases}
+        owners = sorted(self.owners, key=lambda owner: self._first_position('owner', owner))
+        stats.owners = {owner: list(self.owners[owner]) for owner in owners}
+        stats.overdue = sorted((self.tasks[i] for i in self.overdue), key=_by_due_date)
+        stats.due_soon = sorted((self.tasks[i] for i in self.due_soon), key=_by_due_date)
+        if self.phase_names is None:
+            stats.phase_names = {phase: '' for phase in stats.phases}
+        else:
+            stats.phase_names = dict(self.phase_names)
+        return stats
+
+    def update(self, updated=None):
+        """Cell updates for the Dashboard tab since the previous call (see payload_updates)"""
+        payload = sheet_payload(self.stats(), updated)
+        updates = payload_updates(self.payload, payload)
+        self.payload = payload
+        return updates
+
+# ── Sheet payload ──
+
+class _SheetGrid:
+    """Rows of values with a parallel format for every cell"""
+    def __init__(self, width):
+        self.width = width
+        self.values = []
+        self.backgrounds = []
+        self.font_colors = []
+        self.font_weights = []
+        self.font_sizes = []
+        self.alignments = []
+        self.merges = []
+        self.row_heights = {}
+
+    def add(self, values=(), background=WHITE, color=BLACK, bold=False, size=10,
+            align='left', merge=0):
+        """Append one row; merge=n merges the first n cells. Returns its 1-based row"""
+        values = list(values) + [''] * (self.width - len(values))
+        self.values.append(values)
+        self.backgrounds.append([background] * self.width)
+        self.font_colors.append([color] * self.width)
+        self.font_weights.append(['bold' if bold else 'normal'] * self.width)
+        self.font_sizes.append([size] * self.width)
+        self.alignments.append([align] * self.width)
+        row = len(self.values)
+        if merge:
+            self.merges.append([row, 1, 1, merge])
+        return row
+
+    def style(self, row, column, count=1, **formats):
+        """Override formats for count cells of a row (1-based)"""
+        grids = {
+            'background': self.backgrounds, 'color': self.font_colors,
+            'weight': self.font_weights, 'size': self.font_sizes, 'align': self.alignments,
+        }
+        for key, value in formats.items():
+            cells = grids[key][row - 1]
+            cells[column - 1:column - 1 + count] = [value] * count
+
+    def payload(self):
+        return {
+            'range': f"A1:{chr(ord('A') + self.width - 1)}{len(self.values)}",
+            'values': self.values,
+            'backgrounds': self.backgrounds,
+            'fontColors': self.font_colors,
+            'fontWeights': self.font_weights,
+            'fontSizes': self.font_sizes,
+            'horizontalAlignments': self.alignments,
+            'merges': self.merges,
+            'rowHeights': self.row_heights,
+        }
+
+def _header(grid, labels, background=PRIMARY):
+    row = grid.add(labels, size=9, bold=True, color=WHITE)
+    grid.style(row, 1, len(labels), background=background)
+
+def sheet_payload(stats, updated=None):
+    """
+    The Dashboard tab as one batched update: 2-D grids of values and
+    formats covering the same range, plus merges and sizes.
+    """
+    updated = updated or datetime.now()
+    grid = _SheetGrid(SHEET_COLUMNS)
+
+    title = grid.add(['POPTOP COMMAND CENTER'], background=PRIMARY, color=WHITE, bold=True,
+                     size=18, align='center', merge=SHEET_COLUMNS)
+    grid.row_heights[title] = 50
+    stamp = f"{updated:%b} {updated.day}, {updated:%Y} {updated.hour % 12 or 12}:{updated:%M %p}"
+    grid.add([f"Last Updated: {stamp}"], background=LIGHT, color=MUTED, size=9,
+             align='center', merge=SHEET_COLUMNS)
+    grid.add()
+
+    # Quick stats
+    grid.add(['QUICK STATS'], color=PRIMARY, bold=True, size=12, merge=SHEET_COLUMNS)
+    cards = stats.quick_stats()
+    grid.add([label for label, _, _ in cards], background=LIGHT, color=MUTED, size=9, align='center')
+    values = grid.add([value for _, value, _ in cards], background=LIGHT, bold=True, size=22,
+                      align='center')
+    for column, (_, _, color) in enumerate(cards, start=1):
+        grid.style(values, column, color=color)
+    grid.add()
+
+    # Phase progress
+    grid.add(['PHASE PROGRESS'], color=PRIMARY, bold=True, size=12, merge=SHEET_COLUMNS)
+    _header(grid, ['Phase', 'Progress', '', '% Complete'])
+    progress = stats.phase_progress()
+    for index, (display, _, _, pct) in enumerate(progress):
+        full = int(pct / 10 + 0.5)
+        bar = '█' * full + '░' * (10 - full)
+        row = grid.add([display, bar, '', f"{pct}%"])
+        grid.merges.append([row, 2, 1, 2])
+        grid.style(row, 2, 2, color=SUCCESS if pct >= 80 else (WARNING if pct >= 40 else MUTED))
+        grid.style(row, 4, align='center')
+        if index % 2 == 0:
+            grid.style(row, 1, 4, background=LIGHT)
+    if not progress:
+        grid.add(['No phases data found'], color=MUTED, merge=4)
+    grid.add()
+
+    # Overdue tasks
+    if stats.overdue:
+        grid.add([f"OVERDUE TASKS ({len(stats.overdue)})"], color=DANGER, bold=True, size=12,
+                 merge=SHEET_COLUMNS)
+        _header(grid, ['Task', 'Owner', 'Due Date', 'Days Overdue'], background=DANGER)
+        for task in stats.overdue:
+            row = grid.add([task.name, task.owner, _short_date(task.due_date),
+                            f"{stats.days_overdue(task)} days"], size=9)
+            grid.style(row, 1, 4, background=DANGER_LIGHT)
+            grid.style(row, 4, color=DANGER, weight='bold')
+        grid.add()
+
+    # Team workload
+    grid.add(['TEAM WORKLOAD'], color=PRIMARY, bold=True, size=12, merge=SHEET_COLUMNS)
+    _header(grid, ['Team Member', 'Active', 'Completed', 'Total', 'Completion %'])
+    for index, (owner, active, done, total, pct) in enumerate(stats.workload()):
+        row = grid.add([owner, active, done, total, f"{pct}%" if total else '--'])
+        grid.style(row, 2, 4, align='center')
+        if index % 2 == 0:
+            grid.style(row, 1, 5, background=LIGHT)
+    grid.add()
+
+    # Milestones
+    grid.add(['KEY MILESTONES'], color=PRIMARY, bold=True, size=12, merge=SHEET_COLUMNS)
+    _header(grid, ['Milestone', 'Target Date'])
+    for index, (name, target) in enumerate(MILESTONES):
+        row = grid.add([name, target])
+        if name == 'PUBLIC LAUNCH':
+            grid.style(row, 1, 2, weight='bold', color=PRIMARY)
+        if index % 2 == 0:
+            grid.style(row, 1, 2, background=LIGHT)
+
+    payload = grid.payload()
+    payload['columnWidths'] = COLUMN_WIDTHS
+    payload['frozenRows'] = 2
+    return payload
+
+_GRIDS = ('values', 'backgrounds', 'fontColors', 'fontWeights', 'fontSizes', 'horizontalAlignments')
+
+def _column(index):
+    return chr(ord('A') + index)
+
+def payload_updates(old, new):
+    """
+    Changes between two sheet payloads. Returns {'full': new} when the
+    layout moved (rows added/removed, merges changed), otherwise
+    {'updates': [...]} with one entry per run of changed cells in a row,
+    each carrying the same grids as a full payload.
+    """
+    if (old is None or len(old['values']) != len(new['values'])
+            or old['merges'] != new['merges'] or old['rowHeights'] != new['rowHeights']):
+        return {'full': new}
+    updates = []
+    for r in range(len(new['values'])):
+        changed = [c for c in range(len(new['values'][r]))
+                   if any(old[g][r][c] != new[g][r][c] for g in _GRIDS)]
+        # Group adjacent columns into one range
+        runs = []
+        for c in changed:
+            if runs and runs[-1][1] == c - 1:
+                runs[-1][1] = c
+            else:
+                runs.append([c, c])
+        for start, end in runs:
+            update = {'range': f"{_column(start)}{r + 1}:{_column(end)}{r + 1}"}
+            for g in _GRIDS:
+                update[g] = [new[g][r][start:end + 1]]
+            updates.append(update)
+    return {'updates': updates}
+
+def apply_payload_updates(payload, change):
+    """The payload after a payload_updates() change, what applyDashboardUpdates does to the sheet"""
+    if 'full' in change:
+        return change['full']
+    payload = dict(payload, **{g: [list(row) for row in payload[g]] for g in _GRIDS})
+    for update in change['updates']:
+        start, end = update['range'].split(':')
+        row, first = int(start[1:]) - 1, ord(start[0]) - ord('A')
+        for g in _GRIDS:
+            payload[g][row][first:ord(end[0]) - ord('A') + 1] = update[g][0]
+    return payload
+
+# ── HTML ──
+
+def _html_table(headers, rows, header_background=PRIMARY, row_background=None):
+    cells = ''.join(f'<th style="padding: 8px; text-align: left; color: white;">{escape(str(h))}</th>'
+                    for h in headers)
+    html = (f'<table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">'
+            f'<tr style="background: {header_background};">{cells}</tr>')
+    for index, row in enumerate(rows):
+        background = row_background or (LIGHT if index % 2 == 0 else WHITE)
+        cells = ''.join(f'<td style="padding: 8px; border-bottom: 1px solid #e2e8f0;">{escape(str(c))}</td>'
+                        for c in row)
+        html += f'<tr style="background: {background};">{cells}</tr>'
+    return html + '</table>'
+
+def render_html(stats):
+    """Standalone HTML version of the dashboard (same look as the digest email)"""
+    cards = ''.join(
+        f'<td style="padding: 10px; background: {LIGHT}; text-align: center;">'
+        f'<div style="font-size: 24px; font-weight: bold; color: {color};">{value}</div>'
+        f'<div style="color: {MUTED};">{label}</div></td>'
+        for label, value, color in stats.quick_stats()
+    )
+    heading = f'<h2 style="color: {PRIMARY}; border-bottom: 2px solid #c9a227; padding-bottom: 10px;">'
+    parts = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>PopTop Command Center</title></head><body>',
+        '<div style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto;">',
+        f'<div style="background: {PRIMARY}; color: white; padding: 20px; text-align: center;">',
+        '<h1 style="margin: 0;">Pop<span style="color: #c9a227;">Top</span> Command Center</h1>',
+        f'<p style="margin: 5px 0 0 0;">{stats.today:%B} {stats.today.day}, {stats.today:%Y}</p></div>',
+        '<div style="padding: 20px;">',
+        f'{heading}Quick Stats</h2><table style="width: 100%; margin-bottom: 20px;"><tr>{cards}</tr></table>',
+        f'{heading}Phase Progress</h2>',
+        _html_table(['Phase', 'Done', 'Total', '% Complete'],
+                    [(d, done, total, f"{pct}%") for d, done, total, pct in stats.phase_progress()]),
+    ]
+    if stats.overdue:
+        parts.append(f'<h2 style="color: {DANGER};">Overdue Tasks ({len(stats.overdue)})</h2>')
+        parts.append(_html_table(
+            ['Task', 'Owner', 'Due Date', 'Days Overdue'],
+            [(t.name, t.owner, _short_date(t.due_date), f"{stats.days_overdue(t)} days")
+             for t in stats.overdue],
+            header_background=DANGER, row_background=DANGER_LIGHT))
+    if stats.due_soon:
+        parts.append(f'<h2 style="color: {WARNING};">Due Soon ({len(stats.due_soon)})</h2>')
+        parts.append(_html_table(
+            ['Task', 'Owner', 'Due Date'],
+            [(t.name, t.owner, _short_date(t.due_date)) for t in stats.due_soon],
+            header_background=WARNING))
+    if stats.at_risk:
+        parts.append(f'<h2 style="color: {DANGER};">Schedule Risk ({len(stats.at_risk)})</h2>')
+        parts.append(_html_table(
+            ['Task', 'Owner', 'Due Date', 'Slack (days)'],
+            [(e.task.name, e.task.owner, _short_date(e.task.due_date), e.slack) for e in stats.at_risk],
+            header_background=DANGER))
+    if stats.critical_path:
+        parts.append(f'{heading}Critical Path</h2>')
+        parts.append(_html_table(
+            ['Task', 'Owner', 'Due Date'],
+            [(t.name, t.owner, _short_date(t.due_date)) for t in stats.critical_path]))
+    parts.append(f'{heading}Team Workload</h2>')
+    parts.append(_html_table(
+        ['Team Member', 'Active', 'Completed', 'Total', 'Completion %'],
+        [(o, a, d, t, f"{p}%" if t else '--') for o, a, d, t, p in stats.workload()]))
+    parts.append(f'{heading}Key Milestones</h2>')
+    parts.append(_html_table(['Milestone', 'Target Date'], MILESTONES))
+    parts.append('</div></div></body></html>')
+    return '\n'.join(parts)
+
+# ── PDF ──
+
+def build_story(stats, styles):
+    """Dashboard as a PDF story using the shared flowables"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
+
+    from .pdf import create_metrics_row, create_table
+
+    story = [
+        Paragraph("PopTop Command Center", styles['DocTitle']),
+        Paragraph(f"Status as of {stats.today:%B} {stats.today.day}, {stats.today:%Y}", styles['DocSubtitle']),
+        create_metrics_row([(str(value), label) for label, value, _ in stats.quick_stats()]),
+        Spacer(1, 15),
+        Paragraph("Phase Progress", styles['SectionHeader']),
+        create_table(['Phase', 'Done', 'Total', '% Complete'],
+                     [[d, str(done), str(total), f"{pct}%"] for d, done, total, pct in stats.phase_progress()],
+                     [3.2*inch, 1*inch, 1*inch, 1.3*inch]),
+    ]
+    if stats.overdue:
+        story.append(Paragraph(f"Overdue Tasks ({len(stats.overdue)})", styles['SectionHeader']))
+        story.append(create_table(
+            ['Task', 'Owner', 'Due', 'Days Over'],
+            [[t.name, t.owner, _short_date(t.due_date), str(stats.days_overdue(t))] for t in stats.overdue],
+            [3.2*inch, 1.5*inch, 0.8*inch, 1*inch]))
+    if stats.due_soon:
+        story.append(Paragraph(f"Due Soon ({len(stats.due_soon)})", styles['SectionHeader']))
+        story.append(create_table(
+            ['Task', 'Owner', 'Due'],
+            [[t.name, t.owner, _short_date(t.due_date)] for t in stats.due_soon],
+            [3.2*inch, 1.5*inch, 1.8*inch]))
+    if stats.at_risk:
+        story.append(Paragraph(f"Schedule Risk ({len(stats.at_risk)})", styles['SectionHeader']))
+        story.append(Paragraph("Tasks that cannot meet their due date given their dependencies.", styles['Body']))
+        story.append(create_table(
+            ['Task', 'Owner', 'Due', 'Slack'],
+            [[e.task.name, e.task.owner, _short_date(e.task.due_date), f"{e.slack}d"] for e in stats.at_risk],
+            [3.2*inch, 1.5*inch, 0.8*inch, 1*inch]))
+    if stats.critical_path:
+        story.append(Paragraph("Critical Path", styles['SectionHeader']))
+        story.append(create_table(
+            ['Task', 'Owner', 'Due'],
+            [[t.name, t.owner, _short_date(t.due_date)] for t in stats.critical_path],
+            [3.2*inch, 1.5*inch, 1.8*inch]))
+    story.append(Paragraph("Team Workload", styles['SectionHeader']))
+    story.append(create_table(
+        ['Team Member', 'Active', 'Completed', 'Total', 'Completion %'],
+        [[o, str(a), str(d), str(t), f"{p}%" if t else '--'] for o, a, d, t, p in stats.workload()],
+        [2*inch, 1*inch, 1.1*inch, 1*inch, 1.4*inch]))
+    story.append(Paragraph("Key Milestones", styles['SectionHeader']))
+    story.append(create_table(['Milestone', 'Target Date'], MILESTONES, [3.25*inch, 3.25*inch]))
+    return story
+
+def render_pdf(stats, output_path):
+    """Write the dashboard PDF; returns the page count"""
+    from .pdf import Document, render
+
+    document = Document(
+        name='dashboard',
+        output_path=output_path,
+        build_story=lambda styles: build_story(stats, styles),
+    )
+    return render(document)
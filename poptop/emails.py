@@ -0,0 +1,179 @@
+"""
+PopTop meeting email renderer
+Turns a meeting's email draft (or its agenda, if there is no draft) into a
+styled HTML page ready to paste into Gmail.
+
+The Markdown parser, its extensions and the page template are built once
+per process, drafts are looked up through the notes index, and rendered
+pages are cached by file mtime, so rendering a whole range of meetings is
+one call. Needs python markdown (pip3 install markdown).
+"""
+
+import os
+from pathlib import Path
+
+try:
+    import markdown
+except ImportError:
+    markdown = None
+
+from .notes import NOTES_DIR, NotesIndex
+
+OUTPUT_DIR = Path('/tmp/poptop-emails')
+EXTENSIONS = ('tables', 'fenced_code')
+
+_STYLE = """\
+    body {
+      font-family: Arial, sans-serif;
+      max-width: 700px;
+      margin: 20px auto;
+      padding: 20px;
+      line-height: 1.6;
+      color: #333;
+    }
+    h1 {
+      color: #1a365d;
+      font-size: 20px;
+      border-bottom: 2px solid #c9a227;
+      padding-bottom: 8px;
+    }
+    h2 {
+      color: #1a365d;
+      font-size: 16px;
+      margin-top: 24px;
+      margin-bottom: 12px;
+    }
+    h3 {
+      color: #1a365d;
+      font-size: 14px;
+      margin-top: 16px;
+    }
+    table {
+      border-collapse: collapse;
+      width: 100%;
+      margin: 16px 0;
+      font-size: 13px;
+    }
+    th {
+      background: #1a365d;
+      color: white;
+      padding: 10px;
+      text-align: left;
+    }
+    td {
+      padding: 8px 10px;
+      border-bottom: 1px solid #e2e8f0;
+    }
+    tr:nth-child(even) {
+      background: #f7fafc;
+    }
+    ul, ol {
+      margin: 8px 0;
+      padding-left: 24px;
+    }
+    li {
+      margin: 4px 0;
+    }
+    a {
+      color: #3182ce;
+      text-decoration: none;
+    }
+    a:hover {
+      text-decoration: underline;
+    }
+    strong {
+      color: #1a365d;
+    }
+    em {
+      color: #666;
+    }
+    hr {
+      border: none;
+      border-top: 1px solid #e2e8f0;
+      margin: 24px 0;
+    }
+    code {
+      background: #f7fafc;
+      padding: 2px 6px;
+      border-radius: 3px;
+      font-size: 12px;
+    }
+"""
+
+# Everything around the body is fixed, so the page is two constant halves
+_PAGE_HEAD = '<!DOCTYPE html>\n<html>\n<head>\n  <style>\n' + _STYLE + '  </style>\n</head>\n<body>\n'
+_PAGE_TAIL = '\n</body>\n</html>'
+
+def email_body(text):
+    """
+    The part of a draft that goes into the email: drops the '# Email Draft'
+    title and the To/Subject lines above the first '---'.
+    """
+    lines = text.split('\n')
+    if lines and lines[0].startswith('# '):
+        lines = lines[1:]
+    for i, line in enumerate(lines):
+        if line.startswith('---'):
+            return '\n'.join(lines[i + 1:])
+    return '\n'.join(lines)
+
+class EmailRenderer:
+    """Long-lived Markdown -> HTML email renderer"""
+    def __init__(self, notes_dir=NOTES_DIR):
+        if markdown is None:
+            raise RuntimeError("Email rendering needs python markdown: pip3 install markdown")
+        self.markdown = markdown.Markdown(extensions=list(EXTENSIONS))
+        self.index = NotesIndex(notes_dir)
+        self._pages = {}  # path -> ((mtime_ns, size), html)
+
+    def render_text(self, text):
+        """Full HTML page for one draft's Markdown"""
+        self.markdown.reset()
+        return _PAGE_HEAD + self.markdown.convert(email_body(text)) + _PAGE_TAIL
+
+    def render_file(self, path):
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._pages.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        page = self.render_text(Path(path).read_text(encoding='utf-8'))
+        self._pages[path] = (key, page)
+        return page
+
+    def source_for(self, day):
+        """The meeting's email draft, else its agenda, else None"""
+        return self.index.find(day, 'email-draft') or self.index.find(day, 'agenda')
+
+    def render_date(self, day):
+        """(source path, HTML) for one meeting date; raises LookupError without notes"""
+        path = self.source_for(day)
+        if path is None:
+            raise LookupError(f"No meeting notes found for {day}")
+        return path, self.render_file(path)
+
+    def render_range(self, start, end):
+        """{date: (source path, HTML)} for every meeting with notes in [start, end]"""
+        pages = {}
+        for day in self.index.dates(start, end):
+            path = self.source_for(day)
+            if path:
+                pages[day] = (path, self.render_file(path))
+        return pages
+
+    def write(self, day, html, output_dir=OUTPUT_DIR):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output = output_dir / f'email-{day.isoformat()}.html'
+        output.write_text(html, encoding='utf-8')
+        return output
+
+def render_emails(start, end=None, output_dir=OUTPUT_DIR, renderer=None):
+    """Render and write the email for one date (or every meeting in a range); returns output paths"""
+    renderer = renderer or EmailRenderer()
+    if end is None:
+        path, html = renderer.render_date(start)
+        pages = {start: (path, html)}
+    else:
+        pages = renderer.render_range(start, end)
+    return [renderer.write(day, html, output_dir) for day, (_, html) in sorted(pages.items())]
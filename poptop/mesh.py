@@ -0,0 +1,250 @@
+"""
+PopTop mesh analytics
+Reads the CAD STL exports into NumPy triangle records and measures them in
+vectorized passes: signed volume, surface area, bounding box, and the
+plastic mass and resin cost of making the part.
+
+Binary STL is memory-mapped and viewed as STL_DTYPE records in place, so
+multi-megabyte assemblies are never copied or parsed triangle by triangle;
+ASCII STL is streamed in fixed-size chunks into the same record layout.
+
+STL carries no units; the SolidWorks exports in cad-files are expected in
+millimetres, and size_problem() flags parts whose size says otherwise.
+Needs NumPy (pip3 install numpy).
+"""
+
+import hashlib
+import mmap
+import os
+import re
+from functools import cached_property
+
+import numpy as np
+
+from . import ROOT
+
+CAD_DIR = ROOT / '03-Product-Engineering' / 'cad-files'
+
+# Parts of the current PopTop set, relative to CAD_DIR. The rest of
+# cad-files (the OBS folders, the helmet files) is reference material and
+# stays out of quoted figures; add a part here when it is released.
+PRODUCTION_PARTS = ('PopTop_Curved_Part.STL',)
+
+# Largest dimension (mm) a PopTop part can plausibly have. Outside this the
+# export is probably not in millimetres (an inch export reads 25.4x small).
+PLAUSIBLE_SIZE_MM = (20.0, 600.0)
+
+# Binary STL: 80-byte header, uint32 count, then one 50-byte record per triangle
+STL_DTYPE = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+_HEADER_SIZE = 84
+
+# Density (g/cm³) and bulk resin price ($/kg) for materials we quote
+MATERIALS = {
+    'ABS': (1.04, 2.50),
+    'PETG': (1.27, 3.00),
+    'PLA': (1.24, 2.20),
+    'PP': (0.90, 1.60),
+    'HDPE': (0.95, 1.50),
+}
+DEFAULT_MATERIAL = 'ABS'
+
+# ASCII STL numbers come from 'facet normal x y z' and 'vertex x y z' lines
+_ASCII_RE = re.compile(rb'(?:normal|vertex)\s+(\S+)\s+(\S+)\s+(\S+)')
+ASCII_CHUNK = 1 << 20       # bytes of ASCII STL parsed at a time
+CHUNK_TRIANGLES = 1 << 16   # triangles per block in the float64 reductions
+
+def _binary_count(f, size):
+    """Triangle count if f is a binary STL, else None"""
+    if size < _HEADER_SIZE:
+        return None
+    f.seek(80)
+    count = int.from_bytes(f.read(4), 'little')
+    return count if size == _HEADER_SIZE + count * STL_DTYPE.itemsize else None
+
+def is_binary_stl(path):
+    """
+    True for binary STL. SolidWorks starts binary files with 'solid' too, so
+    the triangle count has to match the file size.
+    """
+    with open(path, 'rb') as f:
+        return _binary_count(f, os.fstat(f.fileno()).st_size) is not None
+
+def _stream_ascii(f):
+    """STL_DTYPE records from an ASCII STL, parsed ASCII_CHUNK bytes at a time"""
+    blocks = []
+    numbers = []  # floats not yet making up a whole facet (12 per facet)
+    tail = b''
+    while True:
+        chunk = f.read(ASCII_CHUNK)
+        data = tail + chunk
+        if chunk:
+            # Only parse up to the last complete line; the rest waits for the next chunk
+            cut = data.rfind(b'\n') + 1
+            data, tail = data[:cut], data[cut:]
+        values = np.array(_ASCII_RE.findall(data), dtype=np.float32).reshape(-1)
+        numbers.append(values)
+        pending = np.concatenate(numbers)
+        whole = len(pending) - len(pending) % 12
+        if whole:
+            facets = pending[:whole].reshape(-1, 12)
+            block = np.zeros(len(facets), dtype=STL_DTYPE)
+            block['normal'] = facets[:, :3]
+            block['vertices'] = facets[:, 3:].reshape(-1, 3, 3)
+            blocks.append(block)
+        numbers = [pending[whole:]]
+        if not chunk:
+            break
+    if len(numbers[0]):
+        raise ValueError(f"{f.name}: truncated facet at end of file")
+    return np.concatenate(blocks) if blocks else np.zeros(0, dtype=STL_DTYPE)
+
+def file_hash(path, salt=''):
+    """SHA-256 of salt plus a file's bytes, for caches keyed on part content"""
+    h = hashlib.sha256(salt.encode())
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def open_stl(path):
+    """
+    STL_DTYPE records (normal, vertices, attribute) for every triangle.
+    Binary files are memory-mapped and viewed in place, without copying;
+    ASCII files are streamed in bounded chunks.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        count = _binary_count(f, size)
+        if count is None:
+            f.seek(0)
+            return _stream_ascii(f)
+        if count == 0:
+            return np.zeros(0, dtype=STL_DTYPE)
+        # The array holds the only reference to the mapping, which outlives the file
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return np.frombuffer(mapped, dtype=STL_DTYPE, count=count, offset=_HEADER_SIZE)
+
+def read_stl(path):
+    """(n, 3, 3) float32 vertices, a view into open_stl's records"""
+    return open_stl(path)['vertices']
+
+class Mesh:
+    """A triangle soup plus its measurements (millimetres)"""
+    def __init__(self, records, name=''):
+        self.records = records
+        self.name = name
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(open_stl(path), os.path.splitext(os.path.basename(path))[0])
+
+    @classmethod
+    def from_triangles(cls, triangles, name=''):
+        records = np.zeros(len(triangles), dtype=STL_DTYPE)
+        records['vertices'] = triangles
+        return cls(records, name)
+
+    @property
+    def triangles(self):
+        """(n, 3, 3) float32 view of the vertices"""
+        return self.records['vertices']
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return f"Mesh({self.name!r}, {len(self)} triangles)"
+
+    def _blocks(self):
+        """
+        (v0, e1, e2) edge arrays, CHUNK_TRIANGLES at a time, so reductions
+        over a mapped file never hold more than one float64 block. float64
+        and a local origin keep the cross products accurate far from 0.
+        """
+        origin = self.bounds[0]
+        triangles = self.triangles
+        for start in range(0, len(triangles), CHUNK_TRIANGLES):
+            v = triangles[start:start + CHUNK_TRIANGLES].astype(np.float64) - origin
+            yield v[:, 0], v[:, 1] - v[:, 0], v[:, 2] - v[:, 0]
+
+    @cached_property
+    def bounds(self):
+        """(min corner, max corner)"""
+        if not len(self):
+            return np.zeros(3), np.zeros(3)
+        # Reduced in place: reshaping the strided view of the file would copy every vertex
+        triangles = self.triangles
+        return triangles.min(axis=(0, 1)).astype(np.float64), triangles.max(axis=(0, 1)).astype(np.float64)
+
+    @property
+    def size(self):
+        low, high = self.bounds
+        return high - low
+
+    @cached_property
+    def signed_volume(self):
+        """Divergence theorem over the triangles; negative if the normals point inward"""
+        return sum(float(np.einsum('ij,ij->', v0, np.cross(e1, e2))) for v0, e1, e2 in self._blocks()) / 6.0
+
+    @property
+    def volume(self):
+        return abs(self.signed_volume)
+
+    @cached_property
+    def area(self):
+        return sum(float(np.linalg.norm(np.cross(e1, e2), axis=1).sum()) for _, e1, e2 in self._blocks()) / 2.0
+
+    def mass(self, material=DEFAULT_MATERIAL):
+        """Grams of material for a solid part"""
+        density, _ = MATERIALS[material]
+        return self.volume / 1000.0 * density
+
+    def material_cost(self, material=DEFAULT_MATERIAL):
+        """Resin cost in dollars (material only, no scrap or processing)"""
+        _, price = MATERIALS[material]
+        return self.mass(material) / 1000.0 * price
+
+def find_parts(directory=CAD_DIR):
+    """Every STL under directory, sorted by name"""
+    paths = [os.path.join(folder, name)
+             for folder, _, names in os.walk(directory)
+             for name in names if name.lower().endswith('.stl')]
+    return sorted(paths, key=lambda p: os.path.basename(p).lower())
+
+def production_parts(directory=CAD_DIR):
+    """Paths of the PRODUCTION_PARTS; raises FileNotFoundError if one is missing"""
+    paths = [os.path.join(directory, name) for name in PRODUCTION_PARTS]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"Production part(s) not found: {', '.join(missing)}")
+    return paths
+
+def load_parts(paths=None):
+    """Meshes for paths (default: the production parts)"""
+    return [Mesh.from_file(path) for path in (paths or production_parts())]
+
+def size_problem(mesh):
+    """Why mesh is implausibly sized for a part in millimetres, or None"""
+    largest = float(max(mesh.size))
+    low, high = PLAUSIBLE_SIZE_MM
+    if largest < low:
+        return f"{mesh.name} is {largest:.1f} mm at its largest (under {low:.0f} mm: exported in inches?)"
+    if largest > high:
+        return f"{mesh.name} is {largest:.0f} mm at its largest (over {high:.0f} mm: wrong units or scale?)"
+    return None
+
+def quote(meshes, material=DEFAULT_MATERIAL):
+    """
+    (grams, resin dollars, problems) summed over meshes. Parts that fail
+    size_problem are left out of the totals and listed in problems.
+    """
+    mass = cost = 0.0
+    problems = []
+    for mesh in meshes:
+        problem = size_problem(mesh)
+        if problem:
+            problems.append(problem)
+            continue
+        mass += mesh.mass(material)
+        cost += mesh.material_cost(material)
+    return mass, cost, problems
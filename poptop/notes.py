@@ -0,0 +1,72 @@
+"""
+PopTop meeting notes
+Index of the meeting-notes folder by meeting date. Notes are named
+YYYY-MM-DD-<what>.md; the index maps each date to its files and only
+rescans when the folder itself changes (a file added, removed or renamed).
+"""
+
+import os
+import re
+from datetime import date
+
+from . import ROOT
+
+NOTES_DIR = ROOT / '10-Team-Docs' / 'meeting-notes'
+
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+def note_date(name):
+    """Meeting date in a notes filename, None if it has none"""
+    match = _DATE_RE.search(name)
+    if not match:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+def is_email_draft(name):
+    return 'email-draft' in name
+
+class NotesIndex:
+    """Meeting-notes files by date, refreshed when the folder's mtime changes"""
+    def __init__(self, notes_dir=NOTES_DIR):
+        self.notes_dir = str(notes_dir)
+        self.by_date = {}
+        self._mtime = None
+
+    def refresh(self):
+        try:
+            mtime = os.stat(self.notes_dir).st_mtime_ns
+        except FileNotFoundError:
+            self.by_date, self._mtime = {}, None
+            return
+        if mtime == self._mtime:
+            return
+        by_date = {}
+        with os.scandir(self.notes_dir) as entries:
+            for entry in entries:
+                day = note_date(entry.name)
+                if day and entry.name.endswith('.md') and entry.is_file():
+                    by_date.setdefault(day, []).append(entry.path)
+        for paths in by_date.values():
+            paths.sort()
+        self.by_date, self._mtime = by_date, mtime
+
+    def files(self, day):
+        """Every notes file for one meeting date"""
+        self.refresh()
+        return list(self.by_date.get(day, ()))
+
+    def dates(self, start=None, end=None):
+        """Meeting dates with notes, oldest first, optionally within [start, end]"""
+        self.refresh()
+        return sorted(d for d in self.by_date
+                      if (start is None or d >= start) and (end is None or d <= end))
+
+    def find(self, day, kind):
+        """First notes file for day whose name contains kind (e.g. 'agenda')"""
+        for path in self.files(day):
+            if kind in os.path.basename(path):
+                return path
+        return None
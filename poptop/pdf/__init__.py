@@ -0,0 +1,46 @@
+"""
+PopTop PDF rendering core
+Palette, cached styles and flowable factories used by every document generator
+
+Names are imported from their submodule on first use, so a command that
+only needs the definition parser, the optimizer or the stamper does not
+load ReportLab's layout engine.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    **dict.fromkeys((
+        'PRIMARY', 'SECONDARY', 'ACCENT', 'LIGHT', 'TEXT', 'TEXT_LIGHT', 'SUCCESS', 'WARNING', 'DANGER',
+        'PAGE_SIZE', 'MARGIN', 'CONTENT_WIDTH',
+        'get_styles', 'get_table_styles',
+    ), 'theme'),
+    **dict.fromkeys((
+        'ColoredBox', 'MetricCard',
+        'create_document', 'add_page_number', 'add_page_number_after_cover',
+        'create_data_table', 'create_table', 'create_titled_box', 'create_highlight_box',
+        'create_warning_box', 'create_metrics_row', 'create_panel_table', 'create_meta_table',
+        'create_section_title', 'create_image_grid',
+    ), 'flowables'),
+    **dict.fromkeys(('Document', 'render', 'render_if_changed'), 'document'),
+    **dict.fromkeys(('document_hash', 'fingerprint', 'read_build_stamp'), 'cache'),
+    **dict.fromkeys(('split_sections', 'render_sections'), 'sections'),
+    **dict.fromkeys(('PlanDiff', 'diff_definitions'), 'diff'),
+    **dict.fromkeys(('LayoutProfiler', 'profile_document'), 'profile'),
+    **dict.fromkeys(('StampBase', 'stamp_copies'), 'stamp'),
+    **dict.fromkeys(('DefinitionError', 'load_definition', 'load_document', 'compile_story'), 'definitions'),
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,135 @@
+"""
+PopTop build cache
+Fingerprints everything that feeds a document (story, styles, generator
+source, ReportLab version) and stamps the digest into the PDF's keywords,
+so an unchanged document can be skipped without laying it out again.
+"""
+
+import hashlib
+import os
+import re
+import sys
+import types
+from functools import lru_cache
+from pathlib import Path
+
+import reportlab
+from reportlab.platypus import Paragraph
+
+from .. import ROOT
+from .theme import embedded_fonts, get_styles, get_table_styles
+
+STAMP_PREFIX = 'poptop-build:'
+# pypdf writes punctuation in PDF strings as octal escapes (\055 for '-')
+_STAMP_RE = re.compile(rb'poptop(?:-|\\055)build(?::|\\072)([0-9a-f]{64})')
+_PAGE_RE = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+# Source of the shared rendering core; a change here affects every document
+_CORE_SOURCES = sorted(Path(__file__).resolve().parent.glob('*.py'))
+
+_ROOT_PREFIX = str(ROOT) + os.sep
+_FUNCTION_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.MethodType, type)
+
+def _origin(obj):
+    """
+    Where a function or class is defined, independent of how it was loaded.
+    A generator's functions are in module '__main__' when the script runs
+    directly and 'poptop_generator_*' under poptop build, so project code is
+    named by its file (relative to the project root) instead.
+    """
+    code = getattr(obj, '__code__', None)
+    path = code.co_filename if code is not None else getattr(sys.modules.get(obj.__module__), '__file__', None)
+    if path:
+        path = os.path.abspath(path)
+        if path.startswith(_ROOT_PREFIX):
+            return Path(os.path.relpath(path, ROOT)).as_posix()
+    return getattr(obj, '__module__', '') or ''
+
+def _feed(h, obj, seen):
+    """Write a stable, address-free encoding of obj into hash h"""
+    if isinstance(obj, str) and obj.startswith(_ROOT_PREFIX):
+        # Project files (thumbnails, images) by their path in the project, not the checkout
+        h.update(f'<root>/{obj[len(_ROOT_PREFIX):]};'.encode())
+    elif obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        h.update(repr(obj).encode())
+        h.update(b';')
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[')
+        for item in obj:
+            _feed(h, item, seen)
+        h.update(b']')
+    elif isinstance(obj, dict):
+        h.update(b'{')
+        for key in sorted(obj, key=repr):
+            _feed(h, key, seen)
+            _feed(h, obj[key], seen)
+        h.update(b'}')
+    elif isinstance(obj, (set, frozenset)):
+        _feed(h, sorted(obj, key=repr), seen)
+    elif isinstance(obj, _FUNCTION_TYPES):
+        func = getattr(obj, '__func__', obj)
+        h.update(f'<{_origin(func)}:{func.__qualname__}>'.encode())
+    elif id(obj) in seen:
+        # Shared objects (styles, colors) are hashed once, then by visit order
+        h.update(f'<ref {seen[id(obj)]}>'.encode())
+    else:
+        seen[id(obj)] = len(seen)
+        h.update(f'<{_origin(type(obj))}:{type(obj).__qualname__}>'.encode())
+        attrs = getattr(obj, '__dict__', None)
+        if isinstance(obj, Paragraph):
+            # frags are parsed from text + style; hashing the source is enough
+            _feed(h, [obj.text, obj.style, obj.bulletText, obj.caseSensitive], seen)
+        elif attrs is None:
+            h.update(repr(obj).encode())
+        else:
+            _feed(h, attrs, seen)
+
+def fingerprint(obj):
+    """Stable SHA-256 of an arbitrary flowable/style structure"""
+    h = hashlib.sha256()
+    _feed(h, obj, {})
+    return h.hexdigest()
+
+@lru_cache(maxsize=None)
+def core_digest():
+    """Digest of the ReportLab version and the shared rendering core sources"""
+    h = hashlib.sha256()
+    h.update(f'reportlab {reportlab.Version}\n'.encode())
+    for path in _CORE_SOURCES:
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+def document_hash(document, story, options=None):
+    """
+    Digest of every input that can change the rendered document, plus any
+    output options (e.g. the optimizer level) that change the file.
+    The story must be hashed before it is laid out, while it still only
+    carries what the generator put there.
+    """
+    h = hashlib.sha256()
+    h.update(core_digest().encode())
+    if document.source:
+        h.update(Path(document.source).read_bytes())
+    seen = {}
+    _feed(h, get_styles().byName, seen)
+    _feed(h, get_table_styles(), seen)
+    _feed(h, [document.on_first_page, document.on_later_pages], seen)
+    _feed(h, story, seen)
+    _feed(h, [embedded_fonts(), options], seen)
+    return h.hexdigest()
+
+def build_stamp(digest):
+    """Keywords value recording the inputs a PDF was built from"""
+    return STAMP_PREFIX + digest
+
+def read_build_stamp(path):
+    """Return (digest, page_count) recorded in an existing PDF, or None"""
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    match = _STAMP_RE.search(data)
+    if not match:
+        return None
+    return match.group(1).decode(), len(_PAGE_RE.findall(data))
@@ -0,0 +1,364 @@
+"""
+PopTop document definitions
+Documents written as Markdown with YAML front matter instead of Python.
+A definition is parsed and validated once into plain data, cached by the
+file's mtime (in memory and under .poptop-cache/definitions/), and
+compiled into flowables with the shared factories at build time.
+
+    ---
+    name: execution-plan-v2.1
+    output: PopTop-Execution-Plan-v2.1.pdf     # relative to this file
+    title: PopTop Execution Plan
+    subtitle: "NPI to RTM: Aggressive Reset Roadmap v2.1"
+    meta:                                      # two-column block under the title
+      Version: "2.1"
+      Date: February 2026
+    bullet: "•"                                # prefix for "- " list items
+    sectioned: true
+    ---
+
+    # Section heading                          (SectionHeader)
+    ## Subsection heading                      (SubSection)
+    Body text with **bold** and *italic*.
+    - Bullet item
+
+    <!-- widths: 3.5 1.5 1.5 -->               column widths in inches for the next table
+    | Task | Owner | Target |
+    |------|-------|--------|
+    | ...  | ...   | ...    |
+
+    > Highlight box text
+    > [!WARNING]
+    > Warning box text
+
+    ```metrics
+    - ["$100K", "Seed Round"]
+    ```
+
+    <!-- space: 15 -->                          vertical space in points
+    <!-- pagebreak -->
+
+Needs PyYAML (pip3 install pyyaml).
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from .. import ROOT
+
+CACHE_DIR = ROOT / '.poptop-cache' / 'definitions'
+
+FRONT_MATTER_KEYS = {'name', 'output', 'title', 'subtitle', 'meta', 'bullet', 'sectioned'}
+HEADING_STYLES = {1: 'SectionHeader', 2: 'SubSection'}
+
+_DIRECTIVE_RE = re.compile(r'<!--\s*([a-z]+)\s*(?::\s*(.*?))?\s*-->$')
+_HEADING_RE = re.compile(r'(#+)\s+(.*)$')
+_SEPARATOR_RE = re.compile(r'\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'(?<![\*\w])\*(?!\s)(.+?)(?<!\s)\*(?![\*\w])')
+
+# path -> ((mtime_ns, size), definition)
+_loaded = {}
+
+class DefinitionError(ValueError):
+    """A document definition that cannot be parsed or fails validation"""
+
+def inline(text):
+    """Convert Markdown emphasis to ReportLab paragraph markup"""
+    return _ITALIC_RE.sub(r'<i>\1</i>', _BOLD_RE.sub(r'<b>\1</b>', text))
+
+def _plain(text):
+    """Table cells are drawn as plain strings, so emphasis markers are dropped"""
+    return _ITALIC_RE.sub(r'\1', _BOLD_RE.sub(r'\1', text))
+
+def _cells(line):
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', line)]
+
+def _split_front_matter(text, path):
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != '---':
+        raise DefinitionError(f"{path}:1: definition must start with '---' front matter")
+    for end in range(1, len(lines)):
+        if lines[end].strip() == '---':
+            return '\n'.join(lines[1:end]), lines[end + 1:], end + 2
+    raise DefinitionError(f"{path}:1: front matter is not closed with '---'")
+
+def _parse_front_matter(source, path):
+    try:
+        front = yaml.safe_load(source) or {}
+    except yaml.YAMLError as e:
+        raise DefinitionError(f"{path}: invalid front matter: {e}") from None
+    if not isinstance(front, dict):
+        raise DefinitionError(f"{path}: front matter must be a mapping")
+    unknown = sorted(set(front) - FRONT_MATTER_KEYS)
+    if unknown:
+        raise DefinitionError(f"{path}: unknown front matter key(s): {', '.join(unknown)}")
+    for key in ('name', 'output'):
+        if not isinstance(front.get(key), str) or not front[key]:
+            raise DefinitionError(f"{path}: front matter is missing '{key}'")
+    meta = front.get('meta') or {}
+    if not isinstance(meta, dict):
+        raise DefinitionError(f"{path}: 'meta' must be a mapping of label: value")
+    front['meta'] = [f"{label}: {value}" for label, value in meta.items()]
+    front['bullet'] = str(front.get('bullet') or '')
+    front['sectioned'] = bool(front.get('sectioned', False))
+    return front
+
+def _parse_metrics(source, path, number):
+    try:
+        items = yaml.safe_load(source) or []
+    except yaml.YAMLError as e:
+        raise DefinitionError(f"{path}:{number}: invalid metrics block: {e}") from None
+    metrics = []
+    for item in items if isinstance(items, list) else [items]:
+        if isinstance(item, dict):
+            item = [item.get('value'), item.get('label')]
+        if not isinstance(item, list) or len(item) != 2 or None in item:
+            raise DefinitionError(f"{path}:{number}: each metric needs a value and a label")
+        metrics.append([str(item[0]), str(item[1])])
+    if not metrics:
+        raise DefinitionError(f"{path}:{number}: empty metrics block")
+    return metrics
+
+def parse_definition(text, path='<definition>'):
+    """
+    Parse and validate a definition into plain data:
+    {'front': {...}, 'blocks': [[kind, ...], ...]}
+    """
+    if yaml is None:
+        raise DefinitionError("Document definitions need PyYAML: pip3 install pyyaml")
+    front_source, lines, first = _split_front_matter(text, path)
+    front = _parse_front_matter(front_source, path)
+
+    blocks = []
+    widths = None
+    i = 0
+    while i < len(lines):
+        number = first + i
+        line = lines[i].rstrip()
+        stripped = line.strip()
+        i += 1
+
+        if not stripped:
+            continue
+
+        directive = _DIRECTIVE_RE.match(stripped)
+        if directive:
+            name, value = directive.groups()
+            if name == 'pagebreak':
+                blocks.append(['pagebreak'])
+            elif name == 'space':
+                try:
+                    points = float(value)
+                except (TypeError, ValueError):
+                    raise DefinitionError(f"{path}:{number}: space needs a number of points") from None
+                blocks.append(['space', int(points) if points.is_integer() else points])
+            elif name == 'widths':
+                try:
+                    widths = [float(w) for w in (value or '').split()]
+                except ValueError:
+                    raise DefinitionError(f"{path}:{number}: widths must be numbers (inches)") from None
+                if not lines[i:] or not lines[i].lstrip().startswith('|'):
+                    raise DefinitionError(f"{path}:{number}: widths must be followed by a table")
+            else:
+                raise DefinitionError(f"{path}:{number}: unknown directive '{name}'")
+            continue
+
+        heading = _HEADING_RE.match(stripped)
+        if heading:
+            level = len(heading.group(1))
+            if level not in HEADING_STYLES:
+                raise DefinitionError(f"{path}:{number}: only '#' and '##' headings are supported")
+            blocks.append(['heading', level, inline(heading.group(2))])
+            continue
+
+        if stripped.startswith('|'):
+            rows = [stripped]
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                rows.append(lines[i].strip())
+                i += 1
+            if len(rows) < 2 or not _SEPARATOR_RE.match(rows[1]):
+                raise DefinitionError(f"{path}:{number}: table needs a header row and a '|---|' separator")
+            headers = [_plain(c) for c in _cells(rows[0])]
+            body = []
+            for offset, row in enumerate(rows[2:], start=2):
+                cells = [_plain(c) for c in _cells(row)]
+                if len(cells) != len(headers):
+                    raise DefinitionError(f"{path}:{number + offset}: row has {len(cells)} cells, "
+                                          f"header has {len(headers)}")
+                body.append(cells)
+            if widths is not None and len(widths) != len(headers):
+                raise DefinitionError(f"{path}:{number}: {len(widths)} widths for {len(headers)} columns")
+            blocks.append(['table', headers, body, widths])
+            widths = None
+            continue
+
+        if stripped.startswith('>'):
+            quoted = [stripped]
+            while i < len(lines) and lines[i].strip().startswith('>'):
+                quoted.append(lines[i].strip())
+                i += 1
+            quoted = [q[1:].strip() for q in quoted]
+            kind = 'highlight'
+            if quoted[0].upper() == '[!WARNING]':
+                kind = 'warning'
+                quoted = quoted[1:]
+            # A blank '>' line starts a new paragraph, a trailing '\' breaks the line
+            text, joined = '', False
+            for q in quoted:
+                if not q:
+                    text, joined = text + '<br/><br/>', False
+                elif q.endswith('\\'):
+                    text, joined = text + (' ' if joined else '') + q[:-1].rstrip() + '<br/>', False
+                else:
+                    text, joined = text + (' ' if joined else '') + q, True
+            blocks.append(['box', kind, inline(text)])
+            continue
+
+        if stripped.startswith('```'):
+            kind = stripped[3:].strip()
+            if kind != 'metrics':
+                raise DefinitionError(f"{path}:{number}: unknown fenced block '{kind}'")
+            body = []
+            while i < len(lines) and lines[i].strip() != '```':
+                body.append(lines[i])
+                i += 1
+            if i == len(lines):
+                raise DefinitionError(f"{path}:{number}: fenced block is not closed")
+            i += 1
+            blocks.append(['metrics', _parse_metrics('\n'.join(body), path, number)])
+            continue
+
+        if stripped.startswith(('- ', '* ')):
+            blocks.append(['bullet', inline(stripped[2:].strip())])
+            continue
+
+        # Paragraph: consecutive plain lines joined as in Markdown
+        text = [stripped]
+        while i < len(lines):
+            following = lines[i].strip()
+            if (not following or following.startswith(('#', '|', '>', '```', '- ', '* ', '<!--'))):
+                break
+            text.append(following)
+            i += 1
+        blocks.append(['paragraph', inline(' '.join(text))])
+
+    if widths is not None:
+        raise DefinitionError(f"{path}: widths directive at the end of the file")
+    return {'front': front, 'blocks': blocks}
+
+def _cache_path(path):
+    try:
+        relative = path.relative_to(ROOT)
+    except ValueError:
+        relative = Path(*path.parts[1:])
+    return CACHE_DIR / ('__'.join(relative.parts) + '.json')
+
+@lru_cache(maxsize=None)
+def _parser_digest():
+    """Digest of this module's source; parsing needs nothing from the rendering core"""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+def load_definition(path):
+    """Parsed definition for path, reparsed only when the file's mtime or size changes"""
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    cache_file = _cache_path(path)
+    stamp = [*key, _parser_digest()]
+    try:
+        saved = json.loads(cache_file.read_text())
+        definition = saved['definition'] if saved['stamp'] == stamp else None
+    except (OSError, ValueError, KeyError):
+        definition = None
+    if definition is None:
+        definition = parse_definition(path.read_text(encoding='utf-8'), path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        partial = cache_file.with_suffix('.tmp')
+        partial.write_text(json.dumps({'stamp': stamp, 'definition': definition}))
+        partial.replace(cache_file)
+
+    _loaded[path] = (key, definition)
+    return definition
+
+def compile_story(definition, styles):
+    """Turn a parsed definition into a list of flowables"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import PageBreak, Paragraph, Spacer
+
+    from .flowables import (
+        create_highlight_box, create_meta_table, create_metrics_row, create_table,
+        create_warning_box,
+    )
+
+    front = definition['front']
+    story = []
+    if front.get('title'):
+        story.append(Paragraph(inline(front['title']), styles['DocTitle']))
+    if front.get('subtitle'):
+        story.append(Paragraph(inline(front['subtitle']), styles['DocSubtitle']))
+    if front['meta']:
+        cells = front['meta'] + [''] * (len(front['meta']) % 2)
+        story.append(create_meta_table([cells[i:i + 2] for i in range(0, len(cells), 2)]))
+
+    bullet = front['bullet'] + ' ' if front['bullet'] else ''
+    for block in definition['blocks']:
+        kind = block[0]
+        if kind == 'heading':
+            story.append(Paragraph(block[2], styles[HEADING_STYLES[block[1]]]))
+        elif kind == 'paragraph':
+            story.append(Paragraph(block[1], styles['Body']))
+        elif kind == 'bullet':
+            story.append(Paragraph(bullet + block[1], styles['BulletItem']))
+        elif kind == 'table':
+            _, headers, rows, widths = block
+            story.append(create_table(headers, rows, widths and [w*inch for w in widths]))
+        elif kind == 'box':
+            factory = create_warning_box if block[1] == 'warning' else create_highlight_box
+            story.append(factory(block[2]))
+        elif kind == 'metrics':
+            story.append(create_metrics_row(block[1]))
+        elif kind == 'space':
+            story.append(Spacer(1, block[1]))
+        elif kind == 'pagebreak':
+            story.append(PageBreak())
+    return story
+
+class _DefinitionStory:
+    """build_story callable that picks up edits to the definition file"""
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, styles):
+        return compile_story(load_definition(self.path), styles)
+
+def load_document(path):
+    """Document for a Markdown definition file"""
+    from .document import Document
+
+    path = Path(path).resolve()
+    front = load_definition(path)['front']
+    return Document(
+        name=front['name'],
+        output_path=path.parent / front['output'],
+        build_story=_DefinitionStory(path),
+        source=path,
+        sectioned=front['sectioned'],
+    )
@@ -0,0 +1,395 @@
+"""
+PopTop plan diff
+Compares two document definitions (e.g. execution-plan-v1 and
+execution-plan-v2.1) on their parsed structure instead of rendered text:
+sections are aligned by heading, text blocks and table rows inside each
+section are compared with a linear-space (Myers middle-snake) diff, and
+rows that changed in place are reported cell by cell, keyed by their
+first column. The result renders as a changelog story for a PDF page or
+as a standalone HTML report.
+"""
+
+import html
+import re
+from difflib import SequenceMatcher
+
+from .definitions import load_definition
+
+SIMILAR = 0.6  # SequenceMatcher ratio above which two headings or blocks are "the same thing, edited"
+
+# ── Linear-space diff ──
+
+def _middle_snake(a, a0, a1, b, b0, b1):
+    """(x, y, u, v): the middle snake of the shortest edit script, relative to a0/b0"""
+    n, m = a1 - a0, b1 - b0
+    delta = n - m
+    offset = n + m + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+    for d in range((n + m + 1) // 2 + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            start = x, y
+            while x < n and y < m and a[a0 + x] == b[b0 + y]:
+                x, y = x + 1, y + 1
+            forward[offset + k] = x
+            if delta % 2 and -(d - 1) <= delta - k <= d - 1 and x + backward[offset + delta - k] >= n:
+                return start[0], start[1], x, y
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            start = x, y
+            while x < n and y < m and a[a1 - 1 - x] == b[b1 - 1 - y]:
+                x, y = x + 1, y + 1
+            backward[offset + k] = x
+            if not delta % 2 and -d <= delta - k <= d and x + forward[offset + delta - k] >= n:
+                return n - x, m - y, n - start[0], m - start[1]
+    raise AssertionError("no middle snake")
+
+def _matches(a, a0, a1, b, b0, b1, out):
+    """Append the (i, j) pairs of a longest common subsequence of a[a0:a1] and b[b0:b1]"""
+    while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+        out.append((a0, b0))
+        a0, b0 = a0 + 1, b0 + 1
+    tail = []
+    while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+        a1, b1 = a1 - 1, b1 - 1
+        tail.append((a1, b1))
+    if a0 < a1 and b0 < b1:
+        x, y, u, v = _middle_snake(a, a0, a1, b, b0, b1)
+        _matches(a, a0, a0 + x, b, b0, b0 + y, out)
+        out.extend((a0 + x + i, b0 + y + i) for i in range(u - x))
+        _matches(a, a0 + u, a1, b, b0 + v, b1, out)
+    out.extend(reversed(tail))
+
+def diff_sequences(a, b):
+    """
+    difflib-style opcodes [(tag, i1, i2, j1, j2)] turning a into b, from
+    Myers' O(ND) diff in linear space. Items only need ==.
+    """
+    matches = []
+    _matches(a, 0, len(a), b, 0, len(b), matches)
+    opcodes = []
+    i = j = 0
+    for mi, mj in matches + [(len(a), len(b))]:
+        if i < mi or j < mj:
+            tag = 'replace' if i < mi and j < mj else 'delete' if i < mi else 'insert'
+            opcodes.append((tag, i, mi, j, mj))
+        if mi < len(a):
+            if opcodes and opcodes[-1][0] == 'equal':
+                tag, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(('equal', i1, mi + 1, j1, mj + 1))
+            else:
+                opcodes.append(('equal', mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    return opcodes
+
+# ── Document structure ──
+
+def plain(text):
+    """Heading/paragraph markup reduced to comparable text"""
+    return re.sub(r'\s+', ' ', html.unescape(re.sub(r'<[^>]+>', '', text))).strip()
+
+def _heading_key(title):
+    # "Phase 1: Design & Prototyping (Weeks 1-8)" and "... (Feb 9 - Apr 24)" are the same section
+    return re.sub(r'\s*\([^)]*\)\s*$', '', plain(title)).lower()
+
+def _label(title):
+    return _heading_key(title).split(':')[0]
+
+def _similar(a, b, threshold=0.0):
+    """Similarity ratio of two strings; 0 when the cheap upper bounds already fall below threshold"""
+    if a and b and (a.startswith(b) or b.startswith(a)):
+        return 1.0  # an edit that only appended text
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
+
+class Section:
+    """One '#' section of a definition: its heading and the blocks under it"""
+    def __init__(self, title):
+        self.title = title
+        self.key = _heading_key(title)
+        self.items = []   # (subsection, text) for paragraphs, bullets, boxes, metrics
+        self.tables = []  # (subsection, headers, rows)
+
+    def __repr__(self):
+        return f"Section({self.title!r})"
+
+def sections(definition):
+    """Sections of a parsed definition; the front matter and any text before the first heading come first"""
+    front = definition['front']
+    document = Section('Document')
+    for label in ('title', 'subtitle'):
+        if front.get(label):
+            document.items.append(('', f"{label.title()}: {plain(front[label])}"))
+    document.items.extend(('', item) for item in front['meta'])
+    result = [document]
+    subsection = ''
+    for block in definition['blocks']:
+        kind = block[0]
+        if kind == 'heading' and block[1] == 1:
+            result.append(Section(plain(block[2])))
+            subsection = ''
+            continue
+        section = result[-1]
+        if kind == 'heading':
+            subsection = plain(block[2])
+            section.items.append((subsection, f"## {subsection}"))
+        elif kind == 'table':
+            section.tables.append((subsection, block[1], block[2]))
+        elif kind in ('paragraph', 'bullet'):
+            section.items.append((subsection, plain(block[1])))
+        elif kind == 'box':
+            section.items.append((subsection, f"[{block[1]}] {plain(block[2])}"))
+        elif kind == 'metrics':
+            section.items.append((subsection, 'Metrics: ' + ', '.join(f"{value} {label}" for value, label in block[1])))
+    return result
+
+def align_sections(old, new):
+    """[(old section or None, new section or None)] in new-document order, removed sections after"""
+    pairs = {}
+    unmatched_old = []
+    by_key = {}
+    for section in new:
+        by_key.setdefault(section.key, []).append(section)
+    for section in old:
+        candidates = by_key.get(section.key)
+        if candidates:
+            pairs[id(candidates.pop(0))] = section
+        else:
+            unmatched_old.append(section)
+    # Renamed sections: same "Phase 3:" label, or a similar enough heading
+    unmatched_new = [section for section in new if id(section) not in pairs]
+    for section in list(unmatched_old):
+        best, score = None, SIMILAR
+        for candidate in unmatched_new:
+            ratio = 1.0 if ':' in candidate.key and _label(candidate.key) == _label(section.key) \
+                else _similar(candidate.key, section.key, score)
+            if ratio >= score:
+                best, score = candidate, ratio
+        if best is not None:
+            pairs[id(best)] = section
+            unmatched_new.remove(best)
+            unmatched_old.remove(section)
+    return [(pairs.get(id(section)), section) for section in new] + [(section, None) for section in unmatched_old]
+
+# ── Comparing ──
+
+class Change:
+    """One added, removed or changed item in a section"""
+    def __init__(self, action, kind, where, old=None, new=None, cells=None):
+        self.action = action  # 'added', 'removed', 'changed'
+        self.kind = kind      # 'section', 'heading', 'text', 'row', 'table'
+        self.where = where    # subsection and/or table the change sits in
+        self.old = old
+        self.new = new
+        self.cells = cells or []  # (column, old value, new value) for changed rows
+
+    def __repr__(self):
+        return f"Change({self.action!r}, {self.kind!r}, {self.old or self.new!r})"
+
+def _pair_replaced(old, new, key):
+    """Split a replaced run into (changed pairs, removed, added), pairing items by key then similarity"""
+    pairs, removed, added = [], list(old), list(new)
+    for exact in (True, False):
+        for item in list(removed):
+            if exact:
+                match = next((candidate for candidate in added if key(candidate) == key(item)), None)
+            else:
+                scored = [(_similar(key(candidate), key(item), SIMILAR), n) for n, candidate in enumerate(added)]
+                best = max(scored, default=(0, None))
+                match = added[best[1]] if best[0] >= SIMILAR else None
+            if match is not None:
+                pairs.append((item, match))
+                removed.remove(item)
+                added.remove(match)
+    pairs.sort(key=lambda pair: new.index(pair[1]))
+    return pairs, removed, added
+
+def _diff_items(old, new):
+    changes = []
+    for tag, i1, i2, j1, j2 in diff_sequences(old, new):
+        if tag == 'equal':
+            continue
+        pairs, removed, added = _pair_replaced(old[i1:i2], new[j1:j2], key=lambda item: item[1])
+        changes += [Change('changed', 'text', b[0], a[1], b[1]) for a, b in pairs]
+        changes += [Change('removed', 'text', a[0], a[1]) for a in removed]
+        changes += [Change('added', 'text', b[0], None, b[1]) for b in added]
+    return changes
+
+def _table_name(table):
+    subsection, headers, _ = table
+    return f"{subsection + ' / ' if subsection else ''}{' | '.join(headers)}"
+
+def _diff_rows(old, new):
+    """Row changes between two versions of one table"""
+    _, old_headers, old_rows = old
+    _, headers, rows = new
+    where = _table_name(new)
+    changes = []
+    if old_headers != headers:
+        changes.append(Change('changed', 'table', where, ' | '.join(old_headers), ' | '.join(headers)))
+    a, b = [tuple(row) for row in old_rows], [tuple(row) for row in rows]
+    for tag, i1, i2, j1, j2 in diff_sequences(a, b):
+        if tag == 'equal':
+            continue
+        pairs, removed, added = _pair_replaced(a[i1:i2], b[j1:j2], key=lambda row: row[0])
+        for before, after in pairs:
+            columns = headers if len(headers) >= max(len(before), len(after)) else range(max(len(before), len(after)))
+            cells = [(column, x, y) for column, x, y in zip(columns, before, after) if x != y]
+            changes.append(Change('changed', 'row', where, ' | '.join(before), ' | '.join(after), cells))
+        changes += [Change('removed', 'row', where, ' | '.join(row)) for row in removed]
+        changes += [Change('added', 'row', where, None, ' | '.join(row)) for row in added]
+    return changes
+
+def _diff_tables(old, new):
+    """Match tables by subsection and header, then diff their rows"""
+    changes = []
+    remaining = list(old)
+    for table in new:
+        match = next((t for t in remaining if t[:2] == table[:2]), None) \
+            or next((t for t in remaining if t[0] == table[0] and len(t[1]) == len(table[1])), None) \
+            or next((t for t in remaining if t[1] == table[1]), None)
+        if match is None:
+            changes.append(Change('added', 'table', _table_name(table), None, f"{len(table[2])} row(s)"))
+            continue
+        remaining.remove(match)
+        changes += _diff_rows(match, table)
+    changes += [Change('removed', 'table', _table_name(table), f"{len(table[2])} row(s)") for table in remaining]
+    return changes
+
+class SectionDiff:
+    """The changes within one aligned pair of sections"""
+    def __init__(self, old, new):
+        self.old = old
+        self.new = new
+        self.changes = []
+        if old is None or new is None:
+            return
+        if old.title != new.title:
+            self.changes.append(Change('changed', 'heading', '', old.title, new.title))
+        self.changes += _diff_items(old.items, new.items)
+        self.changes += _diff_tables(old.tables, new.tables)
+
+    @property
+    def title(self):
+        return (self.new or self.old).title
+
+    @property
+    def status(self):
+        if self.old is None:
+            return 'added'
+        if self.new is None:
+            return 'removed'
+        return 'changed' if self.changes else 'unchanged'
+
+class PlanDiff:
+    """Structural diff between two parsed definitions"""
+    def __init__(self, old, new, old_name='old', new_name='new'):
+        self.old_name = old_name
+        self.new_name = new_name
+        self.sections = [SectionDiff(a, b) for a, b in align_sections(sections(old), sections(new))]
+
+    def count(self, status):
+        return sum(1 for section in self.sections if section.status == status)
+
+    def rows(self, action):
+        return sum(1 for section in self.sections for change in section.changes
+                   if change.kind == 'row' and change.action == action)
+
+    def summary(self):
+        return (f"{self.old_name} -> {self.new_name}: {self.count('added')} section(s) added, "
+                f"{self.count('removed')} removed, {self.count('changed')} changed, "
+                f"{self.count('unchanged')} unchanged; rows {self.rows('added')} added, "
+                f"{self.rows('removed')} removed, {self.rows('changed')} changed")
+
+def diff_definitions(old_path, new_path):
+    """PlanDiff between two definition files, named after their front matter"""
+    old, new = load_definition(old_path), load_definition(new_path)
+    return PlanDiff(old, new, old['front']['name'], new['front']['name'])
+
+# ── Reports ──
+
+def _describe(change):
+    """(what, old, new) text for one change"""
+    what = f"{change.action.title()} {change.kind}"
+    if change.cells:
+        return what, change.new.split(' | ')[0], '; '.join(f"{column}: {x} -> {y}" for column, x, y in change.cells)
+    return what, change.old or '', change.new or ''
+
+def changelog_story(plan_diff, styles):
+    """Flowables for a changelog page (or pages) summarizing the diff"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
+
+    from .flowables import create_metrics_row, create_table
+
+    cell = styles['BodySmall']
+
+    def p(text):
+        return Paragraph(html.escape(text), cell)
+
+    story = [
+        Paragraph(f"Changelog: {html.escape(plan_diff.old_name)} to {html.escape(plan_diff.new_name)}",
+                  styles['SectionHeader']),
+        create_metrics_row([
+            (str(plan_diff.count('added')), "Sections Added"), (str(plan_diff.count('removed')), "Sections Removed"),
+            (str(plan_diff.count('changed')), "Sections Changed"), (str(plan_diff.rows('changed')), "Rows Changed"),
+        ]),
+        Spacer(1, 12),
+    ]
+    for section in plan_diff.sections:
+        if section.status == 'unchanged':
+            continue
+        story.append(Paragraph(f"{html.escape(section.title)} ({section.status})", styles['SubSection']))
+        if section.status != 'changed':
+            continue
+        rows = []
+        for change in section.changes:
+            what, old, new = _describe(change)
+            where = f"{change.where}: " if change.where and change.kind == 'row' else ''
+            rows.append([p(what), p(where + old), p(new)])
+        story.append(create_table(["Change", "Before", "After"], rows, [1.1*inch, 2.7*inch, 2.7*inch]))
+        story.append(Spacer(1, 8))
+    return story
+
+def html_report(plan_diff):
+    """Standalone HTML page for the diff"""
+    colors = {'added': '#38a169', 'removed': '#e53e3e', 'changed': '#d69e2e', 'unchanged': '#718096'}
+    out = [
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<style>\n'
+        '  body { font-family: Arial, sans-serif; max-width: 960px; margin: 20px auto; color: #2d3748; }\n'
+        '  h1 { color: #1a365d; border-bottom: 2px solid #c9a227; padding-bottom: 8px; }\n'
+        '  h2 { color: #1a365d; font-size: 16px; margin-top: 24px; }\n'
+        '  table { border-collapse: collapse; width: 100%; font-size: 13px; }\n'
+        '  th { background: #1a365d; color: white; text-align: left; padding: 6px; }\n'
+        '  td { border-bottom: 1px solid #e2e8f0; padding: 6px; vertical-align: top; }\n'
+        '  del { background: #fed7d7; text-decoration: none; } ins { background: #c6f6d5; text-decoration: none; }\n'
+        '  .status { font-size: 12px; font-weight: bold; }\n'
+        '</style>\n</head>\n<body>\n',
+        f"<h1>{html.escape(plan_diff.old_name)} &rarr; {html.escape(plan_diff.new_name)}</h1>\n",
+        f"<p>{html.escape(plan_diff.summary())}</p>\n",
+    ]
+    for section in plan_diff.sections:
+        out.append(f'<h2>{html.escape(section.title)} <span class="status" style="color: '
+                   f'{colors[section.status]}">{section.status}</span></h2>\n')
+        if not section.changes:
+            continue
+        out.append('<table>\n<tr><th>Change</th><th>Where</th><th>Before</th><th>After</th></tr>\n')
+        for change in section.changes:
+            what, old, new = _describe(change)
+            out.append(f"<tr><td>{what}</td><td>{html.escape(change.where)}</td>"
+                       f"<td>{'<del>' + html.escape(old) + '</del>' if old else ''}</td>"
+                       f"<td>{'<ins>' + html.escape(new) + '</ins>' if new else ''}</td></tr>\n")
+        out.append('</table>\n')
+    out.append('</body>\n</html>\n')
+    return ''.join(out)
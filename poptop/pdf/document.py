@@ -0,0 +1,56 @@
+"""
+PopTop document definitions
+A Document bundles everything needed to render one PDF, so any caller
+(a generator script, the batch builder) can render it the same way.
+"""
+
+from .cache import build_stamp, document_hash, read_build_stamp
+from .flowables import add_page_number, create_document
+from .sections import available as sections_available, render_sections
+from .theme import get_styles
+
+class Document:
+    """One renderable PDF: where it goes, how its story is built, how pages are decorated"""
+    def __init__(self, name, output_path, build_story, on_first_page=add_page_number,
+                 on_later_pages=add_page_number, source=None, sectioned=False, warnings=None):
+        self.name = name
+        self.output_path = output_path
+        self.build_story = build_story
+        self.on_first_page = on_first_page
+        self.on_later_pages = on_later_pages
+        self.source = source
+        # Lay out page-break-delimited sections separately and cache them
+        self.sectioned = sectioned
+        # Callable returning messages about the inputs (figures left out, ...);
+        # the caller reports them once when the document is rendered
+        self.warnings = warnings
+
+    def __repr__(self):
+        return f"Document({self.name!r})"
+
+def render(document, output_path=None, story=None, **doc_options):
+    """Lay out and write the document; returns the number of pages written"""
+    doc = create_document(output_path or document.output_path, **doc_options)
+    if story is None:
+        story = document.build_story(get_styles())
+    doc.build(story, onFirstPage=document.on_first_page, onLaterPages=document.on_later_pages)
+    return doc.page
+
+def render_if_changed(document, output_path=None, force=False, options=None):
+    """
+    Render only if the inputs (and output options, such as the optimizer
+    level applied afterwards) differ from the ones stamped into the
+    existing output. Returns (pages, rendered).
+    """
+    output_path = output_path or document.output_path
+    story = document.build_story(get_styles())
+    digest = document_hash(document, story, options)
+    if not force:
+        stamp = read_build_stamp(output_path)
+        if stamp is not None and stamp[0] == digest:
+            return stamp[1], False
+    if document.sectioned and sections_available():
+        pages, _ = render_sections(document, output_path, story, keywords=build_stamp(digest))
+    else:
+        pages = render(document, output_path, story=story, keywords=build_stamp(digest))
+    return pages, True
@@ -0,0 +1,182 @@
+"""
+PopTop flowable factories
+Tables, boxes and page decorations shared by all PDF generators
+"""
+
+from reportlab.lib.colors import white
+from reportlab.lib.units import inch
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table
+from reportlab.platypus.flowables import Flowable
+
+from .theme import (
+    CONTENT_WIDTH, LIGHT, MARGIN, PAGE_SIZE, PRIMARY, SECONDARY, TEXT_LIGHT,
+    get_styles, get_table_styles,
+)
+
+_SECONDARY_HEX = SECONDARY.hexval()[2:]
+_PRIMARY_HEX = PRIMARY.hexval()[2:]
+_TEXT_LIGHT_HEX = TEXT_LIGHT.hexval()[2:]
+
+class ColoredBox(Flowable):
+    """A colored box with text inside"""
+    def __init__(self, width, height, color, text="", text_color=white):
+        Flowable.__init__(self)
+        self.width = width
+        self.height = height
+        self.color = color
+        self.text = text
+        self.text_color = text_color
+
+    def draw(self):
+        self.canv.setFillColor(self.color)
+        self.canv.roundRect(0, 0, self.width, self.height, 5, fill=1, stroke=0)
+
+class MetricCard(Flowable):
+    """A metric card with value and label"""
+    def __init__(self, value, label, width=1.5*inch, height=0.8*inch):
+        Flowable.__init__(self)
+        self.width = width
+        self.height = height
+        self.value = value
+        self.label = label
+
+    def draw(self):
+        # Background
+        self.canv.setFillColor(LIGHT)
+        self.canv.roundRect(0, 0, self.width, self.height, 3, fill=1, stroke=0)
+        # Left border
+        self.canv.setFillColor(SECONDARY)
+        self.canv.rect(0, 0, 3, self.height, fill=1, stroke=0)
+        # Value
+        self.canv.setFillColor(PRIMARY)
+        self.canv.setFont("Helvetica-Bold", 14)
+        self.canv.drawCentredString(self.width/2, self.height - 25, self.value)
+        # Label
+        self.canv.setFillColor(TEXT_LIGHT)
+        self.canv.setFont("Helvetica", 7)
+        self.canv.drawCentredString(self.width/2, 8, self.label.upper())
+
+def create_document(output_path, **kwargs):
+    """Create a letter-size document template with the standard PopTop margins"""
+    return SimpleDocTemplate(
+        str(output_path),
+        pagesize=PAGE_SIZE,
+        rightMargin=MARGIN,
+        leftMargin=MARGIN,
+        topMargin=MARGIN,
+        bottomMargin=MARGIN,
+        **kwargs
+    )
+
+def _draw_page_number(canvas, number):
+    canvas.saveState()
+    canvas.setFont("Helvetica", 9)
+    canvas.setFillColor(TEXT_LIGHT)
+    canvas.drawCentredString(PAGE_SIZE[0]/2, 0.5*inch, str(number))
+    canvas.restoreState()
+
+def add_page_number(canvas, doc):
+    """Add page number to each page"""
+    _draw_page_number(canvas, doc.page)
+
+def add_page_number_after_cover(canvas, doc):
+    """Add page number to each page, leaving the cover unnumbered"""
+    if doc.page > 1:
+        _draw_page_number(canvas, doc.page - 1)
+
+def create_data_table(headers, rows, col_widths=None):
+    """Create a styled data table (business plan spacing)"""
+    return _styled_table([headers] + rows, col_widths, get_table_styles()['data'])
+
+def create_table(headers, rows, col_widths=None):
+    """Create a styled data table (compact execution plan spacing)"""
+    return _styled_table([headers] + rows, col_widths, get_table_styles()['compact'])
+
+def _styled_table(data, col_widths, style):
+    if col_widths is None:
+        col_widths = [CONTENT_WIDTH / len(data[0])] * len(data[0])
+    t = Table(data, colWidths=col_widths)
+    t.setStyle(style)
+    return t
+
+def create_titled_box(title, content):
+    """Create a highlighted box with title and content"""
+    styles = get_styles()
+    data = [[
+        Paragraph(f'<font color="#{_SECONDARY_HEX}">{title}</font>', styles['HighlightTitle']),
+    ], [
+        Paragraph(content, styles['HighlightBody'])
+    ]]
+    t = Table(data, colWidths=[CONTENT_WIDTH])
+    t.setStyle(get_table_styles()['titled_box'])
+    return t
+
+def create_highlight_box(content):
+    """Create a solid highlight box with white text"""
+    t = Table([[Paragraph(content, get_styles()['BoxText'])]], colWidths=[CONTENT_WIDTH])
+    t.setStyle(get_table_styles()['highlight_box'])
+    return t
+
+def create_warning_box(content):
+    """Create an outlined warning box"""
+    t = Table([[Paragraph(content, get_styles()['Body'])]], colWidths=[CONTENT_WIDTH])
+    t.setStyle(get_table_styles()['warning_box'])
+    return t
+
+def create_metrics_row(metrics):
+    """Create a row of metric cards"""
+    body = get_styles()['BodyText']
+    data = [[]]
+    for value, label in metrics:
+        cell_content = f'''<para align="center">
+            <font size="16" color="#{_PRIMARY_HEX}"><b>{value}</b></font><br/>
+            <font size="7" color="#{_TEXT_LIGHT_HEX}">{label.upper()}</font>
+        </para>'''
+        data[0].append(Paragraph(cell_content, body))
+
+    t = Table(data, colWidths=[min(1.625*inch, CONTENT_WIDTH / len(metrics))] * len(metrics))
+    t.setStyle(get_table_styles()['metrics'])
+    return t
+
+def create_panel_table(columns, shaded=False):
+    """Create side-by-side bullet panels from (heading, body) pairs"""
+    styles = get_styles()
+    data = [
+        [Paragraph(f"<b>{heading}</b>", styles['BodyText']) for heading, _ in columns],
+        [Paragraph(body, styles['BulletText']) for _, body in columns],
+    ]
+    t = Table(data, colWidths=[round(CONTENT_WIDTH / len(columns) / inch, 2)*inch] * len(columns))
+    t.setStyle(get_table_styles()['shaded_panel' if shaded else 'panel'])
+    return t
+
+def create_image_grid(items, columns=3):
+    """Create a grid of square images with a caption under each, from (path, caption) pairs"""
+    body = get_styles()['BodyText']
+    width = CONTENT_WIDTH / columns
+    side = width - 0.2*inch
+    cells = [[
+        Image(path, width=side, height=side),
+        Paragraph(f'<para align="center"><font size="8" color="#{_TEXT_LIGHT_HEX}">{caption}</font></para>', body),
+    ] for path, caption in items]
+    data = [cells[i:i + columns] for i in range(0, len(cells), columns)]
+    data[-1] += [''] * (columns - len(data[-1]))
+    t = Table(data, colWidths=[width] * columns)
+    t.setStyle(get_table_styles()['image_grid'])
+    return t
+
+def create_meta_table(rows):
+    """Create the two-column document meta block under a title"""
+    t = Table(rows, colWidths=[CONTENT_WIDTH/2] * 2)
+    t.setStyle(get_table_styles()['meta'])
+    return t
+
+def create_section_title(title):
+    """Section heading with the gold rule underneath"""
+    rule = Table([['']], colWidths=[CONTENT_WIDTH], rowHeights=[3])
+    rule.setStyle(get_table_styles()['rule'])
+    return [
+        Paragraph(title, get_styles()['SectionTitle']),
+        Spacer(1, 5),
+        rule,
+        Spacer(1, 15),
+    ]
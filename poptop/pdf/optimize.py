@@ -0,0 +1,70 @@
+"""
+PopTop PDF output optimizer
+A post-processing stage for rendered PDFs. Every stream is recompressed
+with Flate at a chosen level, dropping the ASCII85 wrapping ReportLab puts
+around each one (a quarter more bytes for nothing in a binary file), and
+identical streams and resources are stored once however many pages or
+stitched sections use them. Metadata is kept, including the build stamp,
+so the build cache still recognizes the file.
+
+Needs pypdf 5 or 6 (pip3 install 'pypdf>=5,<7'): recompressed streams are
+swapped into the writer's object table, which pypdf has no public API for.
+"""
+
+import os
+
+try:
+    import pypdf
+    from pypdf.generic import ArrayObject, DecodedStreamObject, NameObject, StreamObject
+except ImportError:
+    pypdf = None
+
+PYPDF_REQUIREMENT = 'pypdf>=5,<7'
+PYPDF_MAJORS = range(5, 7)  # versions optimize_pdf is known to work with
+LEVEL = 9
+# Filter chains that can be decoded and written back as plain Flate
+_RECODABLE = ((), ('/FlateDecode',), ('/ASCII85Decode', '/FlateDecode'), ('/ASCII85Decode',))
+
+def available():
+    """True when optimizing is possible in this environment"""
+    return pypdf is not None and int(pypdf.__version__.split('.')[0]) in PYPDF_MAJORS
+
+def _filters(stream):
+    value = stream.get('/Filter')
+    if value is None:
+        return ()
+    value = value.get_object()
+    return tuple(value) if isinstance(value, ArrayObject) else (value,)
+
+def recompress(stream, level=LEVEL):
+    """A copy of stream Flate-compressed at level (0: stored uncompressed), or None if it cannot be"""
+    if _filters(stream) not in _RECODABLE or '/DecodeParms' in stream:
+        return None
+    result = DecodedStreamObject()
+    for key, value in stream.items():
+        if key not in ('/Filter', '/Length', '/DecodeParms'):
+            result[NameObject(key)] = value
+    result.set_data(stream.get_data())
+    return result.flate_encode(level) if level else result
+
+def optimize_pdf(path, level=LEVEL, output_path=None):
+    """
+    Write an optimized copy of the PDF at path to output_path (default: in
+    place). Returns (bytes before, bytes after).
+    """
+    output_path = output_path or path
+    before = os.path.getsize(path)
+    writer = pypdf.PdfWriter(clone_from=pypdf.PdfReader(path))
+    # The object table is private; PYPDF_REQUIREMENT pins the versions it has this shape in
+    for index, obj in enumerate(writer._objects):
+        if isinstance(obj, StreamObject):
+            replacement = recompress(obj, level)
+            if replacement is not None:
+                replacement.indirect_reference = obj.indirect_reference
+                writer._objects[index] = replacement
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+    partial = f'{output_path}.tmp'
+    with open(partial, 'wb') as f:
+        writer.write(f)
+    os.replace(partial, output_path)
+    return before, os.path.getsize(output_path)
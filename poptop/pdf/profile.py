@@ -0,0 +1,218 @@
+"""
+PopTop layout profiler
+Times every flowable's wrap, split and draw during a document build, so a
+slow Table, Paragraph or KeepTogether block shows up by name instead of
+by guesswork.
+
+While profiling, the wrap/split/draw methods of every loaded Flowable
+class are wrapped, which also catches table cells, the contents of
+KeepTogether blocks and the pieces a flowable is split into (counted
+against the flowable they came from). Each call records inclusive and
+self time under its section (the last SectionTitle/SectionHeader before
+it) and the page being laid out. The result exports as folded stacks for
+flamegraph.pl or speedscope, and as a per-page timing table.
+"""
+
+import csv
+import os
+import re
+import time
+
+from reportlab.platypus import Image, KeepTogether, Paragraph, Table
+from reportlab.platypus.flowables import Flowable
+
+from .. import ROOT
+from .flowables import create_document
+from .sections import HEADING_STYLES, _slug
+from .theme import get_styles
+
+PROFILE_DIR = ROOT / '.poptop-cache' / 'profiles'
+OPERATIONS = ('wrap', 'split', 'draw')
+
+def describe(flowable):
+    """A short, readable label for a flowable"""
+    name = type(flowable).__name__
+    if isinstance(flowable, Paragraph):
+        text = re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', '', flowable.text)).strip()
+        return f"{name} {flowable.style.name}: {text[:40]}"
+    if isinstance(flowable, Table):
+        return f"{name} {flowable._nrows}x{flowable._ncols}"
+    if isinstance(flowable, Image):
+        return f"{name} {os.path.basename(str(flowable.filename))}"
+    if isinstance(flowable, KeepTogether):
+        return f"{name} ({len(flowable._content)})"
+    return name
+
+def _flowable_classes():
+    classes, pending = [], [Flowable]
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return classes
+
+class FlowableStats:
+    """Calls and time for one flowable, including the pieces it was split into"""
+    def __init__(self, label, section, page):
+        self.label = label
+        self.section = section
+        self.page = page  # page it was first laid out on, once it has been
+        self.calls = dict.fromkeys(OPERATIONS, 0)
+        self.seconds = dict.fromkeys(OPERATIONS, 0.0)  # inclusive, per operation
+        self.total = 0.0       # inclusive, not counting its own nested operations twice
+        self.self_seconds = 0.0
+
+class LayoutProfiler:
+    """Collects flowable timings while installed; see profile_document"""
+    def __init__(self, name='document'):
+        self.name = name
+        self.doc = None
+        self.stats = []
+        self.stacks = {}    # folded stack -> self seconds
+        self.sections = {}  # section -> seconds in top-level flowables
+        self.pages = {}     # page -> seconds in top-level flowables
+        self.page_starts = []
+        self.seconds = 0.0
+        self._section = 'start'
+        self._stack = []    # [flowable, operation, stats, child seconds]
+        self._active = {}   # stats -> open frames
+        self._patched = []
+
+    def assign_sections(self, story):
+        """Give every top-level flowable the section it falls under"""
+        for flowable in story:
+            if isinstance(flowable, Paragraph) and flowable.style.name in HEADING_STYLES:
+                self._section = _slug(flowable.text)
+            self._stats_for(flowable)
+        self._section = 'start'
+
+    def _stats_for(self, flowable):
+        stats = flowable.__dict__.get('_profile')
+        if stats is None:
+            section = self._stack[0][2].section if self._stack else self._section
+            stats = FlowableStats(describe(flowable), section, None)
+            flowable._profile = stats
+            self.stats.append(stats)
+        return stats
+
+    def install(self):
+        for cls in _flowable_classes():
+            for operation in OPERATIONS:
+                if operation in cls.__dict__:
+                    function = cls.__dict__[operation]
+                    self._patched.append((cls, operation, function))
+                    setattr(cls, operation, self._timed(operation, function))
+
+    def remove(self):
+        for cls, operation, function in reversed(self._patched):
+            setattr(cls, operation, function)
+        self._patched = []
+
+    def _timed(self, operation, function):
+        profiler = self
+
+        def timed(flowable, *args, **kwargs):
+            return profiler.call(flowable, operation, function, args, kwargs)
+        timed.__wrapped__ = function
+        return timed
+
+    def call(self, flowable, operation, function, args, kwargs):
+        """Run one wrap/split/draw and account for its time"""
+        if self._stack and self._stack[-1][0] is flowable and self._stack[-1][1] == operation:
+            # A subclass calling its base class's method: one call, not two
+            return function(flowable, *args, **kwargs)
+        stats = self._stats_for(flowable)
+        frame = [flowable, operation, stats, 0.0]
+        self._stack.append(frame)
+        self._active[stats] = self._active.get(stats, 0) + 1
+        page = getattr(self.doc, 'page', 0)
+        if stats.page is None:
+            stats.page = page
+        started = time.perf_counter()
+        try:
+            result = function(flowable, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            key = ';'.join([self.name, stats.section]
+                           + [f"{s.label.replace(';', ',')} {op}" for _, op, s, _ in self._stack])
+            self.stacks[key] = self.stacks.get(key, 0.0) + elapsed - frame[3]
+            self._stack.pop()
+            self._active[stats] -= 1
+            stats.calls[operation] += 1
+            stats.seconds[operation] += elapsed
+            stats.self_seconds += elapsed - frame[3]
+            if not self._active[stats]:
+                stats.total += elapsed
+            if self._stack:
+                self._stack[-1][3] += elapsed
+            else:
+                self.sections[stats.section] = self.sections.get(stats.section, 0.0) + elapsed
+                self.pages[page] = self.pages.get(page, 0.0) + elapsed
+        if operation == 'split' and result:
+            for part in result:
+                if isinstance(part, Flowable) and '_profile' not in part.__dict__:
+                    part._profile = stats
+        return result
+
+    def watch(self, doc):
+        """Time page starts of doc's build for the per-page wall times"""
+        self.doc = doc
+        begin = doc.handle_pageBegin
+
+        def page_begin():
+            self.page_starts.append(time.perf_counter())
+            return begin()
+        doc.handle_pageBegin = page_begin
+
+    # ── Reports ──
+
+    def slowest(self, count=15):
+        return sorted(self.stats, key=lambda s: s.total, reverse=True)[:count]
+
+    def page_times(self, finished):
+        """[(page, wall seconds, seconds in flowables)]"""
+        ends = self.page_starts[1:] + [finished]
+        return [(page, end - start, self.pages.get(page, 0.0))
+                for page, (start, end) in enumerate(zip(self.page_starts, ends), 1)]
+
+    def write_folded(self, path):
+        """Folded stacks in microseconds (flamegraph.pl, speedscope, inferno)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for key, seconds in sorted(self.stacks.items()):
+                micros = round(seconds * 1e6)
+                if micros:
+                    f.write(f"{key} {micros}\n")
+
+    def write_pages(self, path, page_times):
+        sections = {}
+        for stats in self.stats:
+            sections.setdefault(stats.page, [])
+            if stats.section not in sections[stats.page]:
+                sections[stats.page].append(stats.section)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+            writer.writerow(['Page', 'Wall (s)', 'Flowables (s)', 'Sections'])
+            for page, wall, flowables in page_times:
+                writer.writerow([page, f'{wall:.4f}', f'{flowables:.4f}', ', '.join(sections.get(page, []))])
+
+def profile_document(document, output_path, story=None):
+    """
+    Build the document to output_path with every flowable timed.
+    Returns (profiler, pages, page_times).
+    """
+    if story is None:
+        story = document.build_story(get_styles())
+    profiler = LayoutProfiler(document.name)
+    doc = create_document(output_path)
+    profiler.watch(doc)
+    profiler.assign_sections(story)
+    profiler.install()
+    started = time.perf_counter()
+    try:
+        doc.build(story, onFirstPage=document.on_first_page, onLaterPages=document.on_later_pages)
+    finally:
+        profiler.remove()
+    finished = time.perf_counter()
+    profiler.seconds = finished - started
+    return profiler, doc.page, profiler.page_times(finished)
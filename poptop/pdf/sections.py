@@ -0,0 +1,129 @@
+"""
+PopTop section layout cache
+Splits a story at its page breaks into named sections, lays each section
+out as its own cached PDF and stitches them back together. Editing one
+section only re-lays-out that section; page decorations (cover, page
+numbers) are drawn in a separate cheap pass so they stay correct when a
+section grows or shrinks.
+
+Stitching needs pypdf (pip3 install pypdf); without it documents are
+rendered in one pass as before.
+"""
+
+import io
+import re
+from types import SimpleNamespace
+
+import reportlab
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak, Paragraph
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+from .. import ROOT
+from .cache import core_digest, fingerprint
+from .flowables import create_document
+from .theme import PAGE_SIZE, embedded_fonts
+
+CACHE_DIR = ROOT / '.poptop-cache' / 'sections'
+
+# Paragraph styles that open a section and name it
+HEADING_STYLES = ('SectionTitle', 'SectionHeader', 'DocTitle')
+
+def available():
+    """True when section stitching is possible in this environment"""
+    return pypdf is not None
+
+def _slug(text):
+    text = re.sub(r'<[^>]+>', '', text)
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'section'
+
+def _section_name(index, flowables):
+    for flowable in flowables:
+        if isinstance(flowable, Paragraph) and flowable.style.name in HEADING_STYLES:
+            return _slug(flowable.text)
+    return 'cover' if index == 0 and not flowables else f'section-{index}'
+
+def split_sections(story):
+    """
+    Split a story at top-level PageBreaks into [(name, flowables)].
+    Every section starts on a fresh page, so it lays out exactly as it would
+    inside the full document. An empty section stands for a blank page.
+    """
+    chunks = [[]]
+    for flowable in story:
+        if isinstance(flowable, PageBreak):
+            chunks.append([])
+        else:
+            chunks[-1].append(flowable)
+    if len(chunks) > 1 and not chunks[-1]:
+        chunks.pop()  # a trailing page break does not start a new page
+    return [(_section_name(i, chunk), chunk) for i, chunk in enumerate(chunks)]
+
+def _section_pdf(cache_dir, index, name, flowables, core):
+    """Return (path, relaid) for a section's cached PDF, laying it out if needed"""
+    digest = fingerprint([core, flowables])[:16]
+    path = cache_dir / f'{index:02d}-{name}-{digest}.pdf'
+    if path.exists():
+        return path, False
+    if flowables:
+        partial = path.with_suffix('.tmp')
+        create_document(partial).build(list(flowables))
+        partial.replace(path)
+    else:
+        canvas = Canvas(str(path), pagesize=PAGE_SIZE)
+        canvas.showPage()
+        canvas.save()
+    return path, True
+
+def _decorations(document, page_count):
+    """Draw the document's page callbacks onto blank pages"""
+    buffer = io.BytesIO()
+    canvas = Canvas(buffer, pagesize=PAGE_SIZE)
+    for page in range(1, page_count + 1):
+        doc = SimpleNamespace(page=page, pagesize=PAGE_SIZE)
+        callback = document.on_first_page if page == 1 else document.on_later_pages
+        callback(canvas, doc)
+        canvas.showPage()
+    canvas.save()
+    buffer.seek(0)
+    return pypdf.PdfReader(buffer)
+
+def render_sections(document, output_path, story, keywords=None):
+    """
+    Render the story section by section, reusing cached section layouts.
+    Returns (pages, relaid) where relaid lists the sections laid out again.
+    """
+    cache_dir = CACHE_DIR / document.name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    core = [core_digest(), embedded_fonts()]
+
+    used, relaid, pages, info = set(), [], [], None
+    for index, (name, flowables) in enumerate(split_sections(story)):
+        path, was_relaid = _section_pdf(cache_dir, index, name, flowables, core)
+        used.add(path)
+        if was_relaid:
+            relaid.append(name)
+        reader = pypdf.PdfReader(path)
+        if info is None:
+            info = dict(reader.metadata or {})
+        pages.extend(reader.pages)
+
+    writer = pypdf.PdfWriter()
+    for page, decoration in zip(pages, _decorations(document, len(pages)).pages):
+        # Decorations go underneath, as onPage callbacks do in a normal build
+        writer.add_page(page).merge_page(decoration, over=False)
+    # The document info ReportLab wrote (Title, Author, CreationDate, ...), as an unsectioned build has it
+    writer.add_metadata(info or {})
+    writer.add_metadata({'/Producer': f'ReportLab {reportlab.Version} + pypdf', '/Keywords': keywords or ''})
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+
+    # Drop layouts of sections that no longer exist in this form
+    for stale in cache_dir.glob('*.pdf'):
+        if stale not in used:
+            stale.unlink()
+    return len(pages), relaid
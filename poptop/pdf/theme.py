@@ -0,0 +1,264 @@
+"""
+PopTop document theme
+Palette, paragraph styles and table styles shared by all PDF generators.
+Everything here is built once per process and reused across documents.
+"""
+
+import os
+from functools import lru_cache
+
+import reportlab
+
+from reportlab.lib.colors import HexColor, white
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+# Color scheme
+PRIMARY = HexColor('#1a365d')
+SECONDARY = HexColor('#c9a227')
+ACCENT = HexColor('#2d3748')
+LIGHT = HexColor('#f7fafc')
+TEXT = HexColor('#2d3748')
+TEXT_LIGHT = HexColor('#718096')
+SUCCESS = HexColor('#38a169')
+WARNING = HexColor('#d69e2e')
+DANGER = HexColor('#e53e3e')
+RULE = HexColor('#e2e8f0')
+WARNING_LIGHT = HexColor('#FFFBEB')
+
+# Page geometry
+PAGE_SIZE = letter
+MARGIN = 0.75*inch
+CONTENT_WIDTH = 6.5*inch
+
+# Fonts: base-14 Helvetica (not embedded) unless embed_fonts() swaps in TrueType
+FONT_FACES = ('Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique', 'Helvetica-BoldOblique')
+BUNDLED_FONTS = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')  # Bitstream Vera
+# File name endings that identify a face, most specific first
+_FACE_SUFFIXES = (
+    ('Helvetica-BoldOblique', ('bolditalic', 'boldoblique', 'bi')),
+    ('Helvetica-Bold', ('bold', 'bd')),
+    ('Helvetica-Oblique', ('italic', 'oblique', 'it')),
+)
+_embedded = {}  # face -> TrueType file
+
+def font_files(directory):
+    """{face: path} for one font family's .ttf files (Regular, Bold, Italic, BoldItalic) in directory"""
+    faces = {}
+    for name in sorted(os.listdir(directory), key=len):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() != '.ttf':
+            continue
+        face = next((face for face, suffixes in _FACE_SUFFIXES
+                     if stem.lower().replace('-', '').endswith(suffixes)), 'Helvetica')
+        faces.setdefault(face, os.path.join(directory, name))
+    return faces
+
+def embed_fonts(directory=None):
+    """
+    Draw the Helvetica faces with a TrueType family from directory
+    (default: the Vera fonts bundled with ReportLab), subset-embedded in
+    every PDF rendered afterwards in this process. Faces the directory
+    lacks fall back to its regular face. Text re-flows with the new metrics.
+    """
+    faces = font_files(directory or BUNDLED_FONTS)
+    if 'Helvetica' not in faces:
+        raise ValueError(f"No regular .ttf font in {directory}")
+    for face in FONT_FACES:
+        path = faces.get(face, faces['Helvetica'])
+        if _embedded.get(face) != path:
+            pdfmetrics.registerFont(TTFont(face, path))
+            _embedded[face] = path
+    return dict(_embedded)
+
+def embedded_fonts():
+    """{face: TrueType file} currently standing in for the base-14 faces"""
+    return dict(_embedded)
+
+@lru_cache(maxsize=None)
+def get_styles():
+    """Paragraph styles for every PopTop document (built once, then cached)"""
+    styles = getSampleStyleSheet()
+
+    # ---- Business plan ----
+    styles.add(ParagraphStyle(
+        name='SectionTitle', fontName='Helvetica-Bold', fontSize=24,
+        textColor=PRIMARY, spaceBefore=20, spaceAfter=12, borderPadding=(0, 0, 5, 0),
+    ))
+    styles.add(ParagraphStyle(
+        name='SubsectionTitle', fontName='Helvetica-Bold', fontSize=12,
+        textColor=PRIMARY, spaceBefore=15, spaceAfter=8, textTransform='uppercase',
+    ))
+    styles.add(ParagraphStyle(
+        name='CustomBody', fontName='Helvetica', fontSize=10,
+        textColor=TEXT, spaceBefore=6, spaceAfter=6, leading=14, alignment=TA_JUSTIFY,
+    ))
+
+    # Override default BodyText
+    styles['BodyText'].fontName = 'Helvetica'
+    styles['BodyText'].fontSize = 10
+    styles['BodyText'].textColor = TEXT
+    styles['BodyText'].leading = 14
+
+    styles.add(ParagraphStyle(
+        name='HighlightTitle', fontName='Helvetica-Bold', fontSize=12,
+        textColor=SECONDARY, spaceBefore=0, spaceAfter=8,
+    ))
+    styles.add(ParagraphStyle(
+        name='HighlightBody', fontName='Helvetica', fontSize=10,
+        textColor=white, leading=14,
+    ))
+    styles.add(ParagraphStyle(
+        name='BulletText', fontName='Helvetica', fontSize=10,
+        textColor=TEXT, leftIndent=20, spaceBefore=3, spaceAfter=3,
+    ))
+    styles.add(ParagraphStyle(
+        name='TableHeader', fontName='Helvetica-Bold', fontSize=9, textColor=white,
+    ))
+    styles.add(ParagraphStyle(
+        name='TableCell', fontName='Helvetica', fontSize=9, textColor=TEXT,
+    ))
+    styles.add(ParagraphStyle(
+        name='CenteredQuote', fontName='Helvetica-Oblique', fontSize=14,
+        textColor=PRIMARY, alignment=TA_CENTER, spaceBefore=10, spaceAfter=10,
+    ))
+    styles.add(ParagraphStyle(
+        name='Footer', parent=styles['BodyText'], alignment=TA_CENTER,
+        textColor=TEXT_LIGHT, fontSize=9,
+    ))
+
+    # ---- Execution plans ----
+    styles.add(ParagraphStyle(
+        name='DocTitle', fontName='Helvetica-Bold', fontSize=28,
+        textColor=PRIMARY, alignment=TA_CENTER, spaceBefore=0, spaceAfter=15, leading=34,
+    ))
+    styles.add(ParagraphStyle(
+        name='DocSubtitle', fontName='Helvetica', fontSize=14,
+        textColor=TEXT_LIGHT, alignment=TA_CENTER, spaceBefore=10, spaceAfter=25, leading=18,
+    ))
+    styles.add(ParagraphStyle(
+        name='SectionHeader', fontName='Helvetica-Bold', fontSize=16,
+        textColor=PRIMARY, spaceBefore=20, spaceAfter=10,
+    ))
+    styles.add(ParagraphStyle(
+        name='SubSection', fontName='Helvetica-Bold', fontSize=12,
+        textColor=SECONDARY, spaceBefore=15, spaceAfter=8,
+    ))
+    styles.add(ParagraphStyle(
+        name='Body', fontName='Helvetica', fontSize=10,
+        textColor=TEXT, spaceBefore=4, spaceAfter=4, leading=14,
+    ))
+    styles.add(ParagraphStyle(
+        name='BodySmall', fontName='Helvetica', fontSize=9,
+        textColor=TEXT, spaceBefore=2, spaceAfter=2, leading=12,
+    ))
+    styles.add(ParagraphStyle(
+        name='BulletItem', fontName='Helvetica', fontSize=10,
+        textColor=TEXT, leftIndent=20, spaceBefore=2, spaceAfter=2,
+    ))
+    styles.add(ParagraphStyle(
+        name='AlertText', fontName='Helvetica-Bold', fontSize=10,
+        textColor=DANGER, spaceBefore=4, spaceAfter=4, leading=14,
+    ))
+    styles.add(ParagraphStyle(
+        name='BoxText', parent=styles['Body'], textColor=white,
+    ))
+
+    return styles
+
+def _data_table_style(padding):
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY),
+        ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('TEXTCOLOR', (0, 1), (-1, -1), TEXT),
+        ('TOPPADDING', (0, 0), (-1, -1), padding),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ('LEFTPADDING', (0, 0), (-1, -1), padding),
+        ('RIGHTPADDING', (0, 0), (-1, -1), padding),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, LIGHT]),
+        ('LINEBELOW', (0, 0), (-1, -2), 0.5, RULE),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ])
+
+@lru_cache(maxsize=None)
+def get_table_styles():
+    """Named TableStyle objects shared by every table of the same kind"""
+    from reportlab.platypus import TableStyle
+
+    return {
+        # Business plan tables are a little airier than the execution plan ones
+        'data': _data_table_style(8),
+        'compact': _data_table_style(6),
+        'titled_box': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PRIMARY),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('LEFTPADDING', (0, 0), (-1, -1), 15),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+            ('ROUNDEDCORNERS', [5, 5, 5, 5]),
+        ]),
+        'highlight_box': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), PRIMARY),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('LEFTPADDING', (0, 0), (-1, -1), 15),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+        ]),
+        'warning_box': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), WARNING_LIGHT),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('LEFTPADDING', (0, 0), (-1, -1), 15),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+            ('BOX', (0, 0), (-1, -1), 1, WARNING),
+        ]),
+        'metrics': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), LIGHT),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('LEFTPADDING', (0, 0), (-1, -1), 5),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+            ('LINEBEFORESTARTPADDING', (0, 0), (-1, -1), 0),
+            ('LINEBEFORE', (0, 0), (0, -1), 3, SECONDARY),
+            ('LINEBEFORE', (1, 0), (1, -1), 3, SECONDARY),
+            ('LINEBEFORE', (2, 0), (2, -1), 3, SECONDARY),
+            ('LINEBEFORE', (3, 0), (3, -1), 3, SECONDARY),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+        'panel': TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+        'shaded_panel': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), LIGHT),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+        'rule': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), SECONDARY),
+        ]),
+        'image_grid': TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ]),
+        'meta': TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (-1, -1), TEXT_LIGHT),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ]),
+    }
@@ -0,0 +1,169 @@
+"""
+PopTop schedule engine
+Builds a dependency graph over the task IDs once and runs a critical-path
+(CPM) pass over it in topological order, linear in tasks + dependencies.
+
+Dates drive the schedule: a task lasts from its Start Date to its Due
+Date, cannot start before that start date or before every dependency has
+finished (finish-to-start), and must finish by its own due date and in
+time for its dependents. Slack is how many days a task can slip without
+breaking any of that; negative slack means the plan already cannot hold.
+
+Moving a due date recomputes only the tasks downstream (earliest dates)
+and upstream (latest dates) of the one that moved.
+"""
+
+import heapq
+from datetime import timedelta
+
+class ScheduleEntry:
+    """CPM dates for one task"""
+    __slots__ = ('task', 'duration', 'earliest_start', 'earliest_finish',
+                 'latest_start', 'latest_finish', 'driver')
+
+    def __init__(self, task, duration):
+        self.task = task
+        self.duration = duration
+        self.earliest_start = None
+        self.earliest_finish = None
+        self.latest_start = None
+        self.latest_finish = None
+        self.driver = None  # dependency whose finish sets earliest_start
+
+    @property
+    def slack(self):
+        """Days the task can slip, or None when it has no earliest or no latest start"""
+        if self.earliest_start is None or self.latest_start is None:
+            return None
+        return (self.latest_start - self.earliest_start).days
+
+    def __repr__(self):
+        return f"ScheduleEntry({self.task.id}, slack={self.slack})"
+
+def _duration(task):
+    if task.start_date is None or task.due_date is None:
+        return timedelta(0)
+    return max(task.due_date - task.start_date, timedelta(0))
+
+class Schedule:
+    """Dependency graph plus CPM dates for a set of tasks"""
+    def __init__(self, tasks):
+        self.entries = {task.id: ScheduleEntry(task, _duration(task)) for task in tasks}
+        self.predecessors = {task_id: [] for task_id in self.entries}
+        self.successors = {task_id: [] for task_id in self.entries}
+        self.missing = []  # (task id, unknown dependency id)
+        for task_id, entry in self.entries.items():
+            for dep in entry.task.dependencies:
+                if dep not in self.entries:
+                    self.missing.append((task_id, dep))
+                    continue
+                self.predecessors[task_id].append(dep)
+                self.successors[dep].append(task_id)
+
+        self.order = self._topological_order()
+        self.position = {task_id: i for i, task_id in enumerate(self.order)}
+        for task_id in self.order:
+            self._forward(task_id)
+        for task_id in reversed(self.order):
+            self._backward(task_id)
+
+    def _topological_order(self):
+        """Kahn's algorithm; raises ValueError naming the tasks on a cycle"""
+        waiting = {task_id: len(preds) for task_id, preds in self.predecessors.items()}
+        ready = [task_id for task_id, count in waiting.items() if count == 0]
+        order = []
+        while ready:
+            task_id = ready.pop()
+            order.append(task_id)
+            for succ in self.successors[task_id]:
+                waiting[succ] -= 1
+                if waiting[succ] == 0:
+                    ready.append(succ)
+        if len(order) != len(self.entries):
+            cycle = sorted(task_id for task_id, count in waiting.items() if count)
+            raise ValueError(f"Dependency cycle among tasks {cycle}")
+        return order
+
+    def _forward(self, task_id):
+        """Recompute earliest dates from the predecessors; True if they changed"""
+        entry = self.entries[task_id]
+        start, driver = entry.task.start_date, None
+        for dep in self.predecessors[task_id]:
+            finish = self.entries[dep].earliest_finish
+            if finish is not None and (start is None or finish > start):
+                start, driver = finish, dep
+        finish = start + entry.duration if start is not None else None
+        changed = (start, finish) != (entry.earliest_start, entry.earliest_finish)
+        entry.earliest_start, entry.earliest_finish, entry.driver = start, finish, driver
+        return changed
+
+    def _backward(self, task_id):
+        """Recompute latest dates from the successors; True if they changed"""
+        entry = self.entries[task_id]
+        finish = entry.task.due_date
+        for succ in self.successors[task_id]:
+            start = self.entries[succ].latest_start
+            if start is not None and (finish is None or start < finish):
+                finish = start
+        start = finish - entry.duration if finish is not None else None
+        changed = (start, finish) != (entry.latest_start, entry.latest_finish)
+        entry.latest_start, entry.latest_finish = start, finish
+        return changed
+
+    def _propagate(self, task_id, step, neighbours, reverse):
+        """Re-run step over the affected part of the graph in topological order"""
+        sign = -1 if reverse else 1
+        heap = [(sign * self.position[task_id], task_id)]
+        queued = {task_id}
+        while heap:
+            _, current = heapq.heappop(heap)
+            if step(current) or current == task_id:
+                for nxt in neighbours[current]:
+                    if nxt not in queued:
+                        queued.add(nxt)
+                        heapq.heappush(heap, (sign * self.position[nxt], nxt))
+
+    def update_task(self, task):
+        """
+        Replace a task whose dates changed (same ID and dependencies) and
+        recompute only the tasks it can affect.
+        """
+        entry = self.entries[task.id]
+        if tuple(task.dependencies) != tuple(entry.task.dependencies):
+            raise ValueError(f"Task {task.id} changed its dependencies; rebuild the Schedule")
+        entry.task = task
+        entry.duration = _duration(task)
+        self._propagate(task.id, self._forward, self.successors, reverse=False)
+        self._propagate(task.id, self._backward, self.predecessors, reverse=True)
+
+    def move_due_date(self, task_id, due_date):
+        """Move one task's due date and recompute the affected tasks"""
+        from .tasks import edit_task
+
+        task = self.entries[task_id].task
+        self.update_task(edit_task(task, 'Due Date', f"{due_date.month}/{due_date.day}/{due_date.year}"))
+
+    def __getitem__(self, task_id):
+        return self.entries[task_id]
+
+    def finish_date(self):
+        """Earliest date every task can be finished"""
+        return max((e.earliest_finish for e in self.entries.values() if e.earliest_finish), default=None)
+
+    def critical_path(self):
+        """Tasks (first to last) on the chain of dependencies that sets the finish date"""
+        # A task with no due date and no dated successors has no slack to rank by
+        candidates = [e for e in self.entries.values() if e.earliest_finish is not None and e.slack is not None]
+        if not candidates:
+            return []
+        entry = max(candidates, key=lambda e: (e.earliest_finish, -e.slack, -e.task.id))
+        path = [entry]
+        while entry.driver is not None:
+            entry = self.entries[entry.driver]
+            path.append(entry)
+        return [e.task for e in reversed(path)]
+
+    def at_risk(self, threshold=0):
+        """Entries with slack below threshold (default: already infeasible), tightest first"""
+        risky = [e for e in self.entries.values() if e.slack is not None and e.slack < threshold]
+        return sorted(risky, key=lambda e: (e.slack, e.task.id))
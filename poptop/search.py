@@ -0,0 +1,330 @@
+"""
+PopTop search index
+A persistent inverted index over the project's Markdown (plans, meeting
+notes, dashboard docs) and the text inside the PDF generators. Every line
+(a Markdown line, or one string literal in a generator) is a passage; the
+index keeps the position of each word in its passage, so phrases are
+checked against the postings without rescanning files.
+
+Besides words, passages carry field terms:
+    date:  every date mentioned ('2026-02-13', '2/13/2026', 'Feb 13', 'Feb
+           10-14', 'Feb 2026'), normalized to ISO; a query date matches by
+           prefix, so date:2026-02 finds the whole month
+    phase: 'Phase 3' mentions, and the Phase heading a line sits under
+    owner: names in Owner/Lead table columns, '**Owner: ...**' / 'Lead:'
+           labels (for the rest of that section) and ==Name== highlights
+
+The index is stored in .poptop-cache/search-index.json and refreshed per
+file whenever a file's mtime or size changes.
+"""
+
+import ast
+import json
+import os
+import re
+from datetime import date
+
+from . import ROOT
+from .build import GENERATOR_GLOB
+
+INDEX_FILE = ROOT / '.poptop-cache' / 'search-index.json'
+INDEX_VERSION = 1
+SOURCE_GLOBS = ('*.md', '[0-9][0-9]-*/**/*.md', 'dashboard/**/*.md', GENERATOR_GLOB)
+FIELDS = ('date', 'phase', 'owner')
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_MONTHS = {name: i for i, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1)}
+_MONTH = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?'
+_ISO_RE = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
+_US_RE = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+_MONTH_DAY_RE = re.compile(_MONTH + r'\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*-\s*(\d{1,2}))?(?:,?\s+(\d{4}))?\b(?!:)')
+_MONTH_YEAR_RE = re.compile(_MONTH + r'\s+(\d{4})\b')
+_YEAR_RE = re.compile(r'\b(20\d\d)\b')
+_PHASE_RE = re.compile(r'\bPhase\s+(\d+)\b', re.IGNORECASE)
+_OWNER_LABEL_RE = re.compile(r'\b(?:Owner|Lead|Assignee)s?:\**\s*([^|*\n]+)', re.IGNORECASE)
+_HIGHLIGHT_RE = re.compile(r'==([^=\n]+?)==')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*)')
+_MARKUP_RE = re.compile(r'<[^>]+>')
+# Query clauses: whitespace-separated, with "double quotes" grouping a phrase
+# (owner:"Paul G" included). Apostrophes are just letters: "don't", "Paul's".
+_CLAUSE_RE = re.compile(r'(?:[^\s"]+|"[^"]*"?)+')
+_OWNER_COLUMNS = ('owner', 'lead', 'assignee')
+_NOT_NAMES = {'tbd', 'all', 'team', 'and', 'none', 'n', 'a'}
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+def split_query(query):
+    """Query clauses with their quotes removed; an unclosed quote runs to the end"""
+    return [clause.replace('"', '') for clause in _CLAUSE_RE.findall(query)]
+
+def _iso(year, month, day):
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return None
+
+def dates_in(text, year):
+    """ISO dates (or YYYY-MM months) mentioned in text; year fills in 'Feb 13'"""
+    found = set()
+    for y, m, d in _ISO_RE.findall(text):
+        found.add(_iso(y, m, d))
+    for m, d, y in _US_RE.findall(text):
+        found.add(_iso(y, m, d))
+    for month, day, end, y in _MONTH_DAY_RE.findall(text):
+        month = _MONTHS[month.lower()[:3]]
+        found.add(_iso(y or year, month, day))
+        if end:
+            found.add(_iso(y or year, month, end))
+    for month, y in _MONTH_YEAR_RE.findall(text):
+        found.add(f'{int(y):04d}-{_MONTHS[month.lower()[:3]]:02d}')
+    found.discard(None)
+    return found
+
+def _names(text):
+    return {token for token in tokenize(_HIGHLIGHT_RE.sub(r'\1', text))
+            if token not in _NOT_NAMES and not token.isdigit()}
+
+def _cells(line):
+    return [cell.strip() for cell in line.strip().strip('|').split('|')]
+
+def markdown_passages(text):
+    """(line number, text, field terms) for every non-empty Markdown line"""
+    lines = text.split('\n')
+    match = _YEAR_RE.search(text)
+    year = int(match.group(1)) if match else date.today().year
+    sections = []  # (heading level, field terms the heading gives its section)
+    owner_columns = None
+    for number, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if not stripped:
+            owner_columns = None
+            continue
+        heading = _HEADING_RE.match(stripped)
+        if heading:
+            level = len(heading.group(1))
+            sections = [s for s in sections if s[0] < level]
+            sections.append((level, {f'phase:{n}' for n in _PHASE_RE.findall(heading.group(2))}))
+            owner_columns = None
+
+        fields = {f'date:{d}' for d in dates_in(stripped, year)}
+        fields.update(f'phase:{n}' for n in _PHASE_RE.findall(stripped))
+        fields.update(f'owner:{name}' for name in _names(' '.join(_HIGHLIGHT_RE.findall(stripped))))
+        label = _OWNER_LABEL_RE.search(stripped)
+        if label and sections and not stripped.startswith('|'):
+            owners = {f'owner:{name}' for name in _names(label.group(1))}
+            sections[-1][1].update(owners)  # the label speaks for its whole section
+
+        if stripped.startswith('|'):
+            cells = _cells(stripped)
+            if owner_columns is None:
+                owner_columns = [i for i, cell in enumerate(cells)
+                                 if cell.strip('*').lower() in _OWNER_COLUMNS]
+            elif not set(stripped) <= set('|-: '):
+                for i in owner_columns:
+                    if i < len(cells):
+                        fields.update(f'owner:{name}' for name in _names(cells[i]))
+        for _, section_fields in sections:
+            fields |= section_fields
+        yield number, stripped, fields
+
+def python_passages(text):
+    """(line number, text, field terms) for every string literal in a generator"""
+    match = _YEAR_RE.search(text)
+    year = int(match.group(1)) if match else date.today().year
+    tree = ast.parse(text)
+    docstrings = {id(node.body[0].value) for node in ast.walk(tree)
+                  if isinstance(node, (ast.Module, ast.FunctionDef, ast.ClassDef)) and ast.get_docstring(node)}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings:
+            value = ' '.join(_MARKUP_RE.sub(' ', node.value).split())
+            fields = {f'date:{d}' for d in dates_in(value, year)}
+            fields.update(f'phase:{n}' for n in _PHASE_RE.findall(value))
+            label = _OWNER_LABEL_RE.search(value)
+            if label:
+                fields.update(f'owner:{name}' for name in _names(label.group(1)))
+            yield node.lineno, value, fields
+
+def index_text(path, text):
+    """Per-file index record: passages plus term -> flat [passage, position, ...] postings"""
+    passages = python_passages(text) if path.endswith('.py') else markdown_passages(text)
+    record = {'passages': [], 'terms': {}}
+    terms = record['terms']
+    for number, line, fields in sorted(passages, key=lambda p: p[0]):
+        tokens = tokenize(line)
+        if not tokens:
+            continue  # rules, table separators
+        p = len(record['passages'])
+        record['passages'].append([number, line])
+        for position, token in enumerate(tokens):
+            terms.setdefault(token, []).extend((p, position))
+        for field in fields:
+            terms.setdefault(field, []).extend((p, -1))
+    return record
+
+class SearchIndex:
+    """Inverted index over the project's text, loaded from and saved to INDEX_FILE"""
+    def __init__(self, root=ROOT, index_file=INDEX_FILE):
+        self.root = root
+        self.index_file = index_file
+        self.files = {}     # relative path -> {'mtime', 'size', 'passages', 'terms'}
+        self.postings = {}  # term -> {relative path: flat [passage, position, ...]}
+        self.dirty = False
+
+    def load(self):
+        try:
+            saved = json.loads(self.index_file.read_text(encoding='utf-8'))
+            if saved.get('version') == INDEX_VERSION:
+                for path, record in saved['files'].items():
+                    self._add(path, record)
+        except (OSError, ValueError, KeyError):
+            self.files, self.postings = {}, {}
+        return self
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.index_file.with_suffix('.tmp')
+        partial.write_text(json.dumps({'version': INDEX_VERSION, 'files': self.files}), encoding='utf-8')
+        partial.replace(self.index_file)
+        self.dirty = False
+
+    def sources(self):
+        found = set()
+        for pattern in SOURCE_GLOBS:
+            for path in self.root.glob(pattern):
+                if path.is_file() and '.poptop-cache' not in path.parts:
+                    found.add(path.relative_to(self.root).as_posix())
+        return found
+
+    def _add(self, path, record):
+        self.files[path] = record
+        for term, flat in record['terms'].items():
+            self.postings.setdefault(term, {})[path] = flat
+
+    def _remove(self, path):
+        record = self.files.pop(path)
+        for term in record['terms']:
+            paths = self.postings[term]
+            del paths[path]
+            if not paths:
+                del self.postings[term]
+
+    def refresh(self):
+        """Reindex files whose mtime/size changed; returns the number of files touched"""
+        touched = 0
+        current = self.sources()
+        for path in set(self.files) - current:
+            self._remove(path)
+            touched += 1
+        for path in sorted(current):
+            stat = os.stat(self.root / path)
+            record = self.files.get(path)
+            if record and (record['mtime'], record['size']) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                text = (self.root / path).read_text(encoding='utf-8')
+                new = index_text(path, text)
+            except (UnicodeDecodeError, SyntaxError):
+                new = {'passages': [], 'terms': {}}
+            new['mtime'], new['size'] = stat.st_mtime_ns, stat.st_size
+            if record:
+                self._remove(path)
+            self._add(path, new)
+            touched += 1
+        self.dirty |= bool(touched)
+        return touched
+
+    # ── Queries ──
+
+    def _term(self, term):
+        """{(path, passage)} containing term"""
+        return {(path, flat[i]) for path, flat in self.postings.get(term, {}).items()
+                for i in range(0, len(flat), 2)}
+
+    def _phrase(self, tokens):
+        if len(tokens) == 1:
+            return self._term(tokens[0])
+        candidates = set.intersection(*(self._term(token) for token in tokens))
+        matches = set()
+        for path in {path for path, _ in candidates}:
+            positions = []
+            for token in tokens:
+                flat = self.postings[token][path]
+                by_passage = {}
+                for i in range(0, len(flat), 2):
+                    by_passage.setdefault(flat[i], set()).add(flat[i + 1])
+                positions.append(by_passage)
+            for p in {p for candidate_path, p in candidates if candidate_path == path}:
+                if any(all(start + i in positions[i][p] for i in range(1, len(tokens)))
+                       for start in positions[0][p]):
+                    matches.add((path, p))
+        return matches
+
+    def _field(self, field, value):
+        if field == 'date':
+            prefix = f'date:{normalize_date(value)}'
+            terms = [term for term in self.postings if term.startswith(prefix)]
+            return set().union(*(self._term(term) for term in terms)) if terms else set()
+        if field == 'phase':
+            return self._term(f'phase:{value.lower().removeprefix("phase").strip()}')
+        tokens = tokenize(value)
+        if not tokens:
+            return set()
+        return set.intersection(*(self._term(f'owner:{token}') for token in tokens))
+
+    def search(self, query, limit=None):
+        """
+        [(path, line number, text)] for passages matching every clause of
+        query: words, "quoted phrases", field:value filters (date, phase,
+        owner) and in:PATH-SUBSTRING; in file and line order.
+        """
+        matches = None
+        path_filters = []
+        for clause in split_query(query):
+            field, _, value = clause.partition(':')
+            if value and field.lower() == 'in':
+                path_filters.append(value.lower())
+                continue
+            if value and field.lower() in FIELDS:
+                found = self._field(field.lower(), value)
+            else:
+                tokens = tokenize(clause)
+                if not tokens:
+                    continue
+                found = self._phrase(tokens)
+            matches = found if matches is None else matches & found
+            if not matches:
+                return []
+        if matches is None:
+            if not path_filters:
+                return []
+            matches = {(path, p) for path, record in self.files.items() for p in range(len(record['passages']))}
+        hits = sorted((path, p) for path, p in matches
+                      if all(f in path.lower() for f in path_filters))
+        if limit:
+            hits = hits[:limit]
+        return [(path, *self.files[path]['passages'][p]) for path, p in hits]
+
+def normalize_date(text):
+    """Query date to an ISO prefix: '2026', '2026-02', '2026-02-13', '2/13/2026', 'Feb 13 2026'"""
+    text = text.strip()
+    if re.fullmatch(r'\d{4}(-\d{1,2}(-\d{1,2})?)?', text):
+        parts = text.split('-')
+        return '-'.join([parts[0]] + [f'{int(part):02d}' for part in parts[1:]])
+    found = dates_in(text, date.today().year)
+    if len(found) == 1:
+        return found.pop()
+    raise ValueError(f"Unrecognized date: {text!r}")
+
+def open_index(rebuild=False):
+    """Loaded, refreshed index (saved back if anything changed)"""
+    index = SearchIndex()
+    if not rebuild:
+        index.load()
+    index.dirty |= rebuild
+    index.refresh()
+    index.save()
+    return index
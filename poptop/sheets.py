@@ -0,0 +1,369 @@
+"""
+PopTop sheet sync
+Pushes the dashboard TSVs (Tasks, Phases, Risks, Action Items) to the
+Google Sheet. Each table is diffed cell by cell against a snapshot of what
+was last synced, and only the data cells that changed are sent: runs of
+adjacent changed cells become one range, rows past the old end are
+appended and rows that disappeared are blanked. The header and the
+computed columns (the sheet's own formulas, e.g. Days Left) are never
+written over. Every range of every table goes out in a single request
+(applySheetRows in Code.gs) instead of one setValue call per cell.
+
+A table with no snapshot yet is diffed against what the sheet holds now,
+and cells the team has already filled in are kept and reported as
+conflicts rather than overwritten.
+
+The web app only accepts writes carrying the shared secret stored in its
+SYNC_TOKEN script property ($SHEETS_WEBHOOK_TOKEN here).
+
+Backends: WebhookBackend POSTs to the Apps Script web app (or the local
+`poptop webhook` stand-in); MockBackend keeps the sheets in a JSON file,
+so syncs can be checked and benchmarked offline.
+"""
+
+import csv
+import json
+import os
+import random
+import time
+
+from . import ROOT
+from .actions import ACTION_ITEMS_FILE
+from .tasks import DASHBOARD_DIR, TASK_FILES, sheet_row
+
+SNAPSHOT_FILE = ROOT / '.poptop-cache' / 'sheets-snapshot.json'
+MOCK_FILE = ROOT / '.poptop-cache' / 'mock-sheets.json'
+
+def _pad(row, header):
+    return list(row) + [''] * (len(header) - len(row))
+
+# Sheet name -> (the TSVs that fill it, in order, header from the first; (row, file header) -> sheet row)
+TABLES = {
+    'Tasks': (TASK_FILES, sheet_row),
+    'Phases': ((DASHBOARD_DIR / 'initial-phases-data.tsv',), _pad),
+    'Risks': ((DASHBOARD_DIR / 'initial-risks-data.tsv',), _pad),
+    'Action Items': ((ACTION_ITEMS_FILE,), _pad),
+}
+
+# Columns the sheet computes with formulas (sheets-template.md); never written
+COMPUTED_COLUMNS = {
+    'Tasks': ('Days Left',),
+    'Phases': ('% Complete', 'Total Tasks', 'Completed Tasks'),
+    'Risks': ('Score',),
+}
+
+def column_name(index):
+    """Sheet column letters for a 0-based index: 0 -> A, 26 -> AA"""
+    name = ''
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        name = chr(ord('A') + rest) + name
+    return name
+
+def parse_range(text):
+    """(first row, last row, first column, last column), 0-based, for 'A5:M7'"""
+    def cell(ref):
+        letters = ref.rstrip('0123456789')
+        column = 0
+        for letter in letters:
+            column = column * 26 + ord(letter) - ord('A') + 1
+        return int(ref[len(letters):]) - 1, column - 1
+    start, _, end = text.partition(':')
+    (top, left), (bottom, right) = cell(start), cell(end or start)
+    return top, bottom, left, right
+
+def read_table(paths, normalize=_pad):
+    """Header plus data rows of one sheet's TSVs, each row as normalize(row, its file's header) makes it"""
+    rows = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f, delimiter='\t')
+            header = next(reader, None)
+            if header is None:
+                continue
+            if not rows:
+                rows.append(header)
+            rows.extend(normalize(row, header) for row in reader if any(cell.strip() for cell in row))
+    return rows
+
+def load_tables(tables=TABLES):
+    """{sheet: rows} for every table, as the sheets should hold them"""
+    return {sheet: read_table(paths, normalize) for sheet, (paths, normalize) in tables.items()}
+
+def diff_table(sheet, old, new, computed=(), conflicts=None):
+    """
+    Range updates turning the sheet rows old into new, covering only the
+    cells that differ. The header row is only written to an empty sheet and
+    columns named in computed never are. With a conflicts list, a changed
+    cell that already holds a value in old is left alone and recorded there
+    ('Tasks!E5') instead.
+    """
+    if not new:
+        return []
+    skip = {column for column, name in enumerate(new[0]) if name in computed}
+    runs = []  # (row index, first column, last column)
+    for index in range(1 if old else 0, max(len(old), len(new))):
+        before = old[index] if index < len(old) else []
+        after = new[index] if index < len(new) else []
+        changed = []
+        for column in range(max(len(before), len(after))):
+            if index and column in skip:
+                continue
+            was = before[column] if column < len(before) else ''
+            now = after[column] if column < len(after) else ''
+            if was == now:
+                continue
+            if conflicts is not None and was.strip():
+                conflicts.append(f"{sheet}!{column_name(column)}{index + 1}")
+                continue
+            changed.append(column)
+        for column in changed:
+            if runs and runs[-1][0] == index and runs[-1][2] == column - 1:
+                runs[-1] = (index, runs[-1][1], column)
+            else:
+                runs.append((index, column, column))
+
+    # The same span of columns on adjacent rows becomes one range
+    updates, open_spans = [], {}
+    for index, first, last in runs:
+        row = new[index] if index < len(new) else []
+        values = [row[column] if column < len(row) else '' for column in range(first, last + 1)]
+        update = open_spans.get((first, last))
+        if update and update['end'] == index - 1:
+            update['values'].append(values)
+            update['end'] = index
+        else:
+            update = {'sheet': sheet, 'start': index, 'end': index, 'first': first, 'values': [values]}
+            open_spans[(first, last)] = update
+            updates.append(update)
+    for update in updates:
+        start, end, first = update.pop('start'), update.pop('end'), update.pop('first')
+        last = first + len(update['values'][0]) - 1
+        update['range'] = f"{column_name(first)}{start + 1}:{column_name(last)}{end + 1}"
+    return updates
+
+def without_computed(sheet, rows):
+    """rows with the computed columns blanked below the header, as a sync leaves them in a plain sheet"""
+    if not rows:
+        return rows
+    skip = {column for column, name in enumerate(rows[0]) if name in COMPUTED_COLUMNS.get(sheet, ())}
+    return [rows[0]] + [['' if column in skip else cell for column, cell in enumerate(row)] for row in rows[1:]]
+
+def changed_cells(old, new):
+    """How many cells differ between two versions of a sheet's rows"""
+    count = 0
+    for index in range(max(len(old), len(new))):
+        before = old[index] if index < len(old) else []
+        after = new[index] if index < len(new) else []
+        count += sum(1 for column in range(max(len(before), len(after)))
+                     if (before[column] if column < len(before) else '')
+                     != (after[column] if column < len(after) else ''))
+    return count
+
+class SyncResult:
+    """What one sync sent"""
+    def __init__(self, updates, seconds, round_trips, changed=0, conflicts=()):
+        self.updates = updates
+        self.conflicts = list(conflicts)  # cells kept as the sheet has them
+        self.seconds = seconds
+        self.round_trips = round_trips
+        self.changed = changed  # cells that differ: the calls a setValue per cell would make
+        self.rows = sum(len(update['values']) for update in updates)
+        self.cells = sum(len(row) for update in updates for row in update['values'])
+
+    def __repr__(self):
+        return (f"SyncResult({len(self.updates)} range(s), {self.rows} row(s), {self.cells} cell(s), "
+                f"{self.round_trips} round trip(s), {self.seconds:.3f}s)")
+
+class SheetSync:
+    """Diffs the local tables against the last synced snapshot and sends the changes in one batch"""
+    def __init__(self, backend, tables=TABLES, snapshot_path=SNAPSHOT_FILE):
+        self.backend = backend
+        self.tables = tables
+        self.snapshot_path = snapshot_path
+        self.snapshot = self._load_snapshot()
+
+    def _load_snapshot(self):
+        if not self.snapshot_path:
+            return {}
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_snapshot(self):
+        if not self.snapshot_path:
+            return
+        os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        partial = f'{self.snapshot_path}.tmp'
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot, f, ensure_ascii=False)
+        os.replace(partial, self.snapshot_path)
+
+    def changes(self, current, remote=None, conflicts=None):
+        """
+        Range updates for every table that differs from the snapshot.
+        Tables not in the snapshot are diffed against remote (what the
+        sheet holds), keeping its filled cells and listing them in conflicts.
+        """
+        updates = []
+        for sheet, rows in current.items():
+            computed = COMPUTED_COLUMNS.get(sheet, ())
+            if sheet in self.snapshot:
+                updates.extend(diff_table(sheet, self.snapshot[sheet], rows, computed))
+            else:
+                updates.extend(diff_table(sheet, (remote or {}).get(sheet, []), rows, computed, conflicts))
+        return updates
+
+    def sync(self, current=None, dry_run=False):
+        """
+        Send every change in one batch_update. The snapshot only moves
+        forward once the backend has taken the batch. A first sync of a
+        table reads the sheet first (one more round trip).
+        """
+        current = load_tables(self.tables) if current is None else current
+        started = time.perf_counter()
+        round_trips = 0
+        fresh = [sheet for sheet in current if sheet not in self.snapshot]
+        remote = {}
+        if fresh:
+            remote = self.backend.read_sheets(fresh)
+            round_trips += 1
+        conflicts = []
+        updates = self.changes(current, remote, conflicts)
+        changed = sum(changed_cells(self.snapshot.get(sheet, remote.get(sheet, [])), rows)
+                      for sheet, rows in current.items())
+        if updates and not dry_run:
+            self.backend.batch_update(updates)
+            round_trips += 1
+        if not dry_run and (updates or fresh):
+            self.snapshot.update({sheet: [list(row) for row in rows] for sheet, rows in current.items()})
+            self._save_snapshot()
+        return SyncResult(updates, time.perf_counter() - started, round_trips, changed, conflicts)
+
+# ── Backends ──
+
+class MockBackend:
+    """
+    Sheets kept as {sheet: rows} in a JSON file. Every batch_update is one
+    round trip: the file is read, updated and written back, after an
+    optional simulated network latency.
+    """
+    def __init__(self, path=MOCK_FILE, latency=0.0):
+        self.path = path
+        self.latency = latency
+        self.round_trips = 0
+
+    def read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def read_sheets(self, names):
+        """{sheet: rows} for the named sheets, as they are now"""
+        self.round_trips += 1
+        sheets = self.read()
+        return {name: sheets.get(name, []) for name in names}
+
+    def batch_update(self, updates):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+        sheets = self.read()
+        apply_updates(sheets, updates)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        partial = f'{self.path}.tmp'
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(sheets, f, ensure_ascii=False)
+        os.replace(partial, self.path)
+        return len(updates)
+
+def apply_updates(sheets, updates):
+    """Write range updates into {sheet: rows}, as applySheetRows does; trailing blank rows are dropped"""
+    for update in updates:
+        rows = sheets.setdefault(update['sheet'], [])
+        top, bottom, left, right = parse_range(update['range'])
+        if bottom - top + 1 != len(update['values']):
+            raise ValueError(f"{update['range']}: {len(update['values'])} row(s) of values")
+        for index, values in zip(range(top, bottom + 1), update['values']):
+            while len(rows) <= index:
+                rows.append([])
+            row = rows[index]
+            row += [''] * (right + 1 - len(row))
+            row[left:right + 1] = values
+        while rows and not any(rows[-1]):
+            rows.pop()
+    return sheets
+
+class WebhookBackend:
+    """POSTs to the Apps Script web app (doPost's sheet_values and sheet_rows events)"""
+    def __init__(self, url, token=None, timeout=30):
+        self.url = url
+        self.token = token or os.environ.get('SHEETS_WEBHOOK_TOKEN')
+        self.timeout = timeout
+        self.round_trips = 0
+
+    def _post(self, data):
+        import urllib.request  # only real syncs need it, so mock syncs start faster
+
+        self.round_trips += 1
+        body = json.dumps(dict(data, token=self.token), ensure_ascii=False).encode()
+        request = urllib.request.Request(self.url, body, {'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            reply = json.load(response)
+        if reply.get('status') != 'success':
+            raise RuntimeError(f"Sheet sync failed: {reply.get('message', reply)}")
+        return reply
+
+    def read_sheets(self, names):
+        return self._post({'event': 'sheet_values', 'sheets': list(names)})['sheets']
+
+    def batch_update(self, updates):
+        self._post({'event': 'sheet_rows', 'updates': updates})
+        return len(updates)
+
+# ── Benchmark ──
+
+def benchmark(edits=50, latency=0.0, path=None, seed=0):
+    """
+    Offline sync benchmark against a fresh MockBackend: seed the sheets,
+    then edit one task cell at a time and sync after each, then make
+    edits changes and sync once. Returns [(scenario, SyncResult list)].
+    Per-cell round trips are what cell-by-cell setValue writes would cost.
+    """
+    path = path or ROOT / '.poptop-cache' / 'mock-sheets-bench.json'
+    if os.path.exists(path):
+        os.remove(path)
+    backend = MockBackend(path, latency)
+    sync = SheetSync(backend, snapshot_path=None)
+    tables = load_tables()
+    tasks = tables['Tasks']
+    status = tasks[0].index('Status')
+    rng = random.Random(seed)
+
+    def edit():
+        row = tasks[rng.randrange(1, len(tasks))]
+        row[status] = rng.choice(['Not Started', 'In Progress', 'Complete', 'Blocked'])
+
+    results = [('seed', [sync.sync(tables)])]
+    single = []
+    for _ in range(edits):
+        edit()
+        single.append(sync.sync(tables))
+    results.append(('single edits', single))
+    for _ in range(edits):
+        edit()
+    results.append(('bulk edit', [sync.sync(tables)]))
+
+    def trimmed(sheets):
+        # Blank cells are never sent, so a mock row can end early
+        return {sheet: [list(row[:max([i + 1 for i, cell in enumerate(row) if cell] or [0])]) for row in rows]
+                for sheet, rows in sheets.items()}
+
+    if trimmed(backend.read()) != trimmed({sheet: without_computed(sheet, rows) for sheet, rows in tables.items()}):
+        raise RuntimeError("Mock sheets differ from the local tables after syncing")
+    return results
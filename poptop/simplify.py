@@ -0,0 +1,286 @@
+"""
+PopTop mesh simplification
+Turns an STL triangle soup into a compact indexed mesh for previews. An STL
+repeats every shared corner once per triangle (about six times per vertex
+in the CAD exports), so corners are first welded on a spatial grid into
+shared vertices, then quadric error decimation collapses edges until the
+mesh fits a triangle budget.
+
+Decimation runs in vectorized rounds instead of one heap-ordered collapse
+at a time: each round scores every edge by its quadric error, collapses the
+cheapest edges that share no vertex (skipping any that would flip a face)
+and drops the faces that became degenerate.
+
+Previews are written as binary PLY and cached in .poptop-cache/previews by
+the STL's content hash and the budget.
+Needs NumPy (pip3 install numpy).
+"""
+
+import os
+
+import numpy as np
+
+from . import ROOT
+from .mesh import Mesh, file_hash
+
+CACHE_DIR = ROOT / '.poptop-cache' / 'previews'
+PREVIEW_VERSION = 1  # bump when decimation output changes
+
+WELD_TOLERANCE = 1e-4    # mm; corners in the same grid cell become one vertex
+PREVIEW_TRIANGLES = 5000
+BOUNDARY_WEIGHT = 1000.0  # keeps open edges from eroding
+_ROUND_FRACTION = 0.25    # a round only collapses edges among the cheapest quarter
+_MAX_ROUNDS = 500
+
+# PLY face records: a uchar vertex count and three int indices, packed
+_PLY_FACE = np.dtype([('count', 'u1'), ('indices', '<i4', (3,))])
+
+class IndexedMesh:
+    """Shared vertices plus the faces that index them"""
+    def __init__(self, vertices, faces, name=''):
+        self.vertices = vertices  # (n, 3) float32
+        self.faces = faces        # (m, 3) int32
+        self.name = name
+
+    @classmethod
+    def from_mesh(cls, mesh, tolerance=WELD_TOLERANCE):
+        vertices, faces = weld(mesh.triangles, tolerance)
+        return cls(vertices, faces, mesh.name)
+
+    @property
+    def triangles(self):
+        """(m, 3, 3) float32 corners, as an STL would store them"""
+        return self.vertices[self.faces]
+
+    def __len__(self):
+        return len(self.faces)
+
+    def __repr__(self):
+        return f"IndexedMesh({self.name!r}, {len(self.vertices)} vertices, {len(self)} faces)"
+
+    def to_mesh(self):
+        return Mesh.from_triangles(self.triangles, self.name)
+
+def _proper(faces):
+    """Mask of faces with three distinct vertices"""
+    return (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+
+def _compact(vertices, faces):
+    """Drop vertices no face uses and renumber the rest"""
+    used, faces = np.unique(faces, return_inverse=True)
+    return vertices[used], faces.reshape(-1, 3).astype(np.int32)
+
+def weld(triangles, tolerance=WELD_TOLERANCE):
+    """
+    (vertices, faces) for (n, 3, 3) triangles. Corners are snapped to a grid
+    of tolerance-sized cells, each occupied cell becomes one vertex (at its
+    first corner) and triangles left with fewer than three vertices are dropped.
+    """
+    points = np.asarray(triangles, dtype=np.float32).reshape(-1, 3)
+    if not len(points):
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.int32)
+    cells = np.floor(points / tolerance + 0.5).astype(np.int64)
+    cells -= cells.min(axis=0)
+    spans = cells.max(axis=0) + 1
+    if np.prod(spans.astype(np.float64)) < 2.0 ** 62:
+        # The cell's index in the grid is a perfect hash: one int64 sort
+        keys = (cells[:, 0] * spans[1] + cells[:, 1]) * spans[2] + cells[:, 2]
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(cells, axis=0, return_index=True, return_inverse=True)
+    faces = inverse.reshape(-1, 3).astype(np.int32)
+    return _compact(points[first], faces[_proper(faces)])
+
+def _planes(vertices, faces):
+    """(unit normals, offsets, areas) of the faces' planes, in float64"""
+    v0, v1, v2 = (vertices[faces[:, i]].astype(np.float64) for i in range(3))
+    normals = np.cross(v1 - v0, v2 - v0)
+    double_area = np.linalg.norm(normals, axis=1)
+    normals /= np.where(double_area > 0, double_area, 1)[:, None]
+    return normals, -np.einsum('ij,ij->i', normals, v0), double_area / 2
+
+def _quadric(normals, offsets, weights):
+    """(k, 4, 4) weighted fundamental error quadrics of k planes"""
+    p = np.concatenate([normals, offsets[:, None]], axis=1)
+    return p[:, :, None] * p[:, None, :] * weights[:, None, None]
+
+def vertex_quadrics(vertices, faces):
+    """
+    (n, 4, 4) error quadric of each vertex: its faces' planes weighted by
+    area, plus heavily weighted planes through open edges, perpendicular to
+    their face, so boundaries keep their shape.
+    """
+    normals, offsets, areas = _planes(vertices, faces)
+    face_q = _quadric(normals, offsets, areas)
+    quadrics = np.zeros((len(vertices), 4, 4))
+    for corner in range(3):
+        np.add.at(quadrics, faces[:, corner], face_q)
+
+    pairs = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    owner = np.tile(np.arange(len(faces)), 3)
+    keys = np.sort(pairs, axis=1).astype(np.int64) @ np.array([len(vertices), 1])
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    open_edges = counts[inverse.reshape(-1)] == 1
+    if open_edges.any():
+        a, b = pairs[open_edges, 0], pairs[open_edges, 1]
+        along = vertices[b].astype(np.float64) - vertices[a]
+        length = np.linalg.norm(along, axis=1)
+        side = np.cross(along, normals[owner[open_edges]])
+        side /= np.maximum(np.linalg.norm(side, axis=1), 1e-12)[:, None]
+        edge_q = _quadric(side, -np.einsum('ij,ij->i', side, vertices[a]), BOUNDARY_WEIGHT * length ** 2)
+        np.add.at(quadrics, a, edge_q)
+        np.add.at(quadrics, b, edge_q)
+    return quadrics
+
+def _edges(faces, count):
+    """(a, b) vertex arrays of every distinct edge, a < b"""
+    pairs = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    keys = np.unique(np.sort(pairs, axis=1).astype(np.int64) @ np.array([count, 1]))
+    return keys // count, keys % count
+
+def _error(quadrics, points):
+    homogeneous = np.concatenate([points, np.ones((len(points), 1))], axis=1)
+    return np.einsum('ei,eij,ej->e', homogeneous, quadrics, homogeneous)
+
+def _collapse_targets(vertices, quadrics, a, b):
+    """(position, cost) of collapsing each edge to the point of least error"""
+    q = quadrics[a] + quadrics[b]
+    va, vb = vertices[a].astype(np.float64), vertices[b].astype(np.float64)
+    candidates = [va, vb, (va + vb) / 2]
+
+    # The error minimum solves A x = -c; only trusted when A is well conditioned
+    # and the point stays near the edge
+    system = q[:, :3, :3]
+    scale = np.einsum('ijj->i', system) ** 3
+    solvable = np.abs(np.linalg.det(system)) > 1e-9 * np.maximum(scale, 1e-300)
+    optimal = candidates[2].copy()
+    if solvable.any():
+        optimal[solvable] = np.linalg.solve(system[solvable], -q[solvable, :3, 3:])[:, :, 0]
+    near = np.linalg.norm(optimal - candidates[2], axis=1) <= np.linalg.norm(vb - va, axis=1)
+    optimal[~near] = candidates[2][~near]
+    candidates.append(optimal)
+
+    costs = np.stack([_error(q, point) for point in candidates], axis=1)
+    best = np.argmin(costs, axis=1)
+    rows = np.arange(len(a))
+    return np.stack(candidates, axis=1)[rows, best], costs[rows, best]
+
+def _flipped_faces(vertices, faces, new_vertices, new_faces, touched):
+    """Mask of touched faces whose normal turns over in the collapse"""
+    def normals(v, f):
+        v0, v1, v2 = (v[f[:, i]].astype(np.float64) for i in range(3))
+        return np.cross(v1 - v0, v2 - v0)
+    flipped = np.zeros(len(faces), dtype=bool)
+    flipped[touched] = np.einsum('ij,ij->i', normals(vertices, faces[touched]),
+                                 normals(new_vertices, new_faces[touched])) < 0
+    return flipped
+
+def decimate(mesh, budget=PREVIEW_TRIANGLES):
+    """
+    IndexedMesh with at most budget faces (where the shape allows), made by
+    quadric error edge collapses. Meshes already within budget are returned
+    as they are.
+    """
+    vertices, faces = mesh.vertices.copy(), mesh.faces
+    if len(faces) <= budget:
+        return mesh
+    quadrics = vertex_quadrics(vertices, faces)
+    blocked = np.zeros(len(vertices), dtype=bool)  # vertices whose collapse flipped a face
+    for _ in range(_MAX_ROUNDS):
+        if len(faces) <= budget:
+            break
+        a, b = _edges(faces, len(vertices))
+        points, costs = _collapse_targets(vertices, quadrics, a, b)
+        costs[blocked[a] | blocked[b]] = np.inf
+
+        # Collapse edges that are the cheapest at both their ends: no two
+        # share a vertex, so they can all happen at once
+        rank = np.empty(len(a), dtype=np.int64)
+        rank[np.argsort(costs, kind='stable')] = np.arange(len(a))
+        lowest = np.full(len(vertices), len(a), dtype=np.int64)
+        np.minimum.at(lowest, a, rank)
+        np.minimum.at(lowest, b, rank)
+        chosen = ((lowest[a] == rank) & (lowest[b] == rank) & np.isfinite(costs)
+                  & (rank <= len(a) * _ROUND_FRACTION))
+        chosen = np.flatnonzero(chosen)
+        # Each collapse removes about two faces; stop at the budget
+        chosen = chosen[np.argsort(rank[chosen])][:max(1, (len(faces) - budget + 1) // 2)]
+
+        owner = np.full(len(vertices), -1, dtype=np.int64)
+        owner[a[chosen]] = chosen
+        owner[b[chosen]] = chosen
+        touched = (owner[faces] >= 0).any(axis=1)
+        while len(chosen):
+            target = np.arange(len(vertices))
+            target[b[chosen]] = a[chosen]
+            new_vertices = vertices.copy()
+            new_vertices[a[chosen]] = points[chosen]
+            new_faces = target[faces]
+            flipped = _flipped_faces(vertices, faces, new_vertices, new_faces, touched & _proper(new_faces))
+            if not flipped.any():
+                break
+            # Drop every collapse next to a flipped face and try the rest again
+            rejected = owner[faces[flipped]]
+            blocked[a[rejected[rejected >= 0]]] = blocked[b[rejected[rejected >= 0]]] = True
+            owner[np.isin(owner, rejected)] = -1
+            chosen = np.setdiff1d(chosen, rejected)
+            touched = (owner[faces] >= 0).any(axis=1)
+        if not len(chosen):
+            break
+
+        quadrics[a[chosen]] += quadrics[b[chosen]]
+        vertices = new_vertices
+        faces = new_faces[_proper(new_faces)]
+        # Two faces folded onto the same three vertices are one face now
+        _, unique = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+        faces = faces[np.sort(unique)].astype(np.int32)
+    vertices, faces = _compact(vertices, faces)
+    return IndexedMesh(vertices, faces, mesh.name)
+
+def write_ply(mesh, path):
+    """Write an IndexedMesh as binary little-endian PLY"""
+    header = (f"ply\nformat binary_little_endian 1.0\ncomment {mesh.name}\n"
+              f"element vertex {len(mesh.vertices)}\n"
+              "property float x\nproperty float y\nproperty float z\n"
+              f"element face {len(mesh.faces)}\n"
+              "property list uchar int vertex_indices\nend_header\n")
+    records = np.empty(len(mesh.faces), dtype=_PLY_FACE)
+    records['count'] = 3
+    records['indices'] = mesh.faces
+    partial = f'{path}.tmp'
+    with open(partial, 'wb') as f:
+        f.write(header.encode('utf-8'))
+        f.write(np.ascontiguousarray(mesh.vertices, dtype='<f4').tobytes())
+        f.write(records.tobytes())
+    os.replace(partial, path)
+
+def read_ply(path):
+    """IndexedMesh from a PLY written by write_ply"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    end = data.find(b'end_header\n')
+    if not data.startswith(b'ply\n') or end < 0:
+        raise ValueError(f"{path}: not a PLY file")
+    counts, name = {}, ''
+    for line in data[:end].decode('utf-8').split('\n'):
+        if line.startswith('format ') and line != 'format binary_little_endian 1.0':
+            raise ValueError(f"{path}: unsupported PLY {line!r}")
+        if line.startswith('comment '):
+            name = line[len('comment '):]
+        elif line.startswith('element '):
+            _, element, count = line.split()
+            counts[element] = int(count)
+    start = end + len(b'end_header\n')
+    vertices = np.frombuffer(data, dtype='<f4', count=counts['vertex'] * 3, offset=start).reshape(-1, 3)
+    records = np.frombuffer(data, dtype=_PLY_FACE, count=counts['face'], offset=start + vertices.nbytes)
+    return IndexedMesh(vertices, records['indices'].astype(np.int32), name)
+
+def preview_mesh(path, budget=PREVIEW_TRIANGLES):
+    """Welded and decimated IndexedMesh of an STL, from the preview cache when it is there"""
+    cached = CACHE_DIR / f"{file_hash(path, f'{PREVIEW_VERSION}:{WELD_TOLERANCE}:{budget}')}.ply"
+    if cached.exists():
+        return read_ply(cached)
+    mesh = decimate(IndexedMesh.from_mesh(Mesh.from_file(path)), budget)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_ply(mesh, cached)
+    return mesh
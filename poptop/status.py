@@ -0,0 +1,142 @@
+"""
+PopTop automation status
+What `poptop status` reports: whether the notes watcher is running, the
+repo's git state, which optional dependencies are installed, and (with
+--imports) how long each command takes to start.
+
+The import report runs every command's module in a fresh interpreter
+under -X importtime, so it measures a cold start the way a shell sees it,
+and names any heavy library (ReportLab's layout engine, numpy, ...) a
+command pulls in before it has done anything. Commands that never render
+should stay under START_BUDGET_MS.
+"""
+
+import importlib.util
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from . import ROOT
+
+START_BUDGET_MS = 100
+RUNS = 3  # cold starts per command; the fastest is reported
+
+# (module, what it is for, install hint); found with find_spec, never imported
+DEPENDENCIES = [
+    ('reportlab', 'PDF rendering', 'pip3 install reportlab'),
+    ('markdown', 'meeting emails', 'pip3 install markdown'),
+    ('pypdf', 'optimize, stamp', "pip3 install 'pypdf>=5,<7'"),
+    ('numpy', 'mesh, preview, thumbnails', 'pip3 install numpy'),
+    ('PIL', 'thumbnails', 'pip3 install pillow'),
+]
+
+# Command -> the module its cmd_* function imports first
+COMMAND_MODULES = {
+    'status': 'poptop.status',
+    'search': 'poptop.search',
+    'dashboard': 'poptop.dashboard',
+    'schedule': 'poptop.schedule',
+    'actions': 'poptop.actions',
+    'email': 'poptop.emails',
+    'watch': 'poptop.watcher',
+    'sync': 'poptop.sheets',
+    'webhook': 'poptop.webhook',
+    'build': 'poptop.build',
+    'diff': 'poptop.pdf.diff',
+    'optimize': 'poptop.pdf.optimize',
+    'stamp': 'poptop.pdf.stamp',
+    'profile': 'poptop.pdf.profile',
+    'bench': 'poptop.bench',
+    'mesh': 'poptop.mesh',
+    'preview': 'poptop.simplify',
+    'thumbnails': 'poptop.thumbnails',
+}
+# One-shot commands that never render, held to the budget (diff only
+# renders with --pdf). Rendering commands (email's Markdown included) and
+# mesh commands load their libraries by design, and watch/webhook are
+# long-running, so their startup is reported but not gated.
+QUICK_COMMANDS = {'status', 'search', 'dashboard', 'schedule', 'actions', 'sync', 'diff'}
+
+# Libraries worth naming when a command imports them at startup
+HEAVY_MODULES = ('reportlab.platypus', 'reportlab.pdfgen.canvas', 'pypdf', 'numpy', 'PIL.Image', 'markdown',
+                 'asyncio', 'concurrent.futures.process', 'urllib.request')
+
+def watcher_running():
+    """True/False, or None when there is no pgrep to ask"""
+    if not shutil.which('pgrep'):
+        return None
+    return subprocess.run(['pgrep', '-f', r'python[0-9.]* -m poptop watch'], stdout=subprocess.DEVNULL).returncode == 0
+
+def git(*args):
+    result = subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.rstrip('\n') if result.returncode == 0 else f"(git {args[0]} failed)"
+
+def dependencies():
+    """[(module, purpose, install hint, installed)]"""
+    return [(module, purpose, hint, importlib.util.find_spec(module) is not None)
+            for module, purpose, hint in DEPENDENCIES]
+
+def import_profile(module, runs=RUNS):
+    """
+    Import module (after the CLI itself) in a fresh interpreter, best of
+    runs. Returns (wall ms for the whole process, ms importing the CLI and
+    module, heavy modules imported), or None when the import fails.
+    """
+    code = f"import poptop.__main__, {module}"
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                cwd=Path(__file__).resolve().parent.parent,
+                                capture_output=True, text=True)
+        wall = (time.perf_counter() - started) * 1000
+        if result.returncode != 0:
+            return None
+        if best is None or wall < best[0]:
+            best = wall, result
+    wall, result = best
+    cumulative, heavy = 0, []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line.split('|')
+        if not total.strip().isdigit():
+            continue  # header
+        indent = len(name) - len(name.lstrip())
+        name = name.strip()
+        if indent == 1 and name.split('.')[0] == 'poptop':
+            cumulative += int(total)
+        if name in HEAVY_MODULES:
+            heavy.append(name)
+    return wall, cumulative / 1000, heavy
+
+def interpreter_ms():
+    """Wall ms for a bare interpreter start, the floor under every command"""
+    times = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'])
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times)
+
+def import_report(commands=None, report=print):
+    """Print startup time per command; returns the commands over budget"""
+    floor = interpreter_ms()
+    report(f"{'Command':<11} {'Start ms':>8} {'Import ms':>9}  Heavy imports")
+    slow = []
+    for command in commands or COMMAND_MODULES:
+        profile = import_profile(COMMAND_MODULES[command])
+        if profile is None:
+            report(f"{command:<11} {'-':>8} {'-':>9}  (import failed: missing dependency?)")
+            continue
+        wall, imports, heavy = profile
+        over = command in QUICK_COMMANDS and wall > START_BUDGET_MS
+        if over:
+            slow.append(command)
+        report(f"{command:<11} {wall:>8.0f} {imports:>9.1f}  {', '.join(heavy) or '-'}"
+               + ("  OVER BUDGET" if over else ''))
+    report(f"Interpreter alone: {floor:.0f} ms; budget for {', '.join(sorted(QUICK_COMMANDS))}: "
+           f"{START_BUDGET_MS} ms")
+    return slow
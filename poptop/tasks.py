@@ -0,0 +1,255 @@
+"""
+PopTop task store
+Streams the dashboard task TSVs into typed records: dates parsed once,
+status and priority as enums, dependencies as tuples of task IDs. The
+store keeps status/owner/phase indexes so queries never touch strings.
+
+A TSV's header says which columns its rows carry: a file exported
+without the Blocker column has every row read with an empty Blocker cell,
+which is how the sheet stores them.
+"""
+
+import csv
+import sys
+from datetime import date
+from enum import Enum
+from functools import lru_cache
+
+from . import ROOT
+
+DASHBOARD_DIR = ROOT / 'dashboard'
+TASK_FILES = (
+    DASHBOARD_DIR / 'initial-task-data.tsv',
+    DASHBOARD_DIR / 'expanded-tasks-v2.tsv',
+)
+
+# Matches CONFIG.STATUS in dashboard/apps-script/Code.gs
+class Status(Enum):
+    NOT_STARTED = 'Not Started'
+    IN_PROGRESS = 'In Progress'
+    COMPLETE = 'Complete'
+    BLOCKED = 'Blocked'
+    ON_HOLD = 'On Hold'
+
+class Priority(Enum):
+    HIGH = 'High'
+    MEDIUM = 'Medium'
+    LOW = 'Low'
+
+COLUMNS = ('ID', 'Phase', 'Task Name', 'Owner', 'Status', 'Priority', 'Start Date',
+           'Due Date', 'Completed', 'Days Left', 'Blocker', 'Notes', 'Dependencies')
+_BLOCKER = COLUMNS.index('Blocker')
+
+class Task:
+    """One row of the Tasks sheet"""
+    __slots__ = ('id', 'phase', 'name', 'owner', 'status', 'priority', 'start_date',
+                 'due_date', 'completed_date', 'blocker', 'notes', 'dependencies')
+
+    def __init__(self, id, phase, name, owner, status, priority, start_date=None,
+                 due_date=None, completed_date=None, blocker='', notes='', dependencies=()):
+        self.id = id
+        self.phase = phase
+        self.name = name
+        self.owner = owner
+        self.status = status
+        self.priority = priority
+        self.start_date = start_date
+        self.due_date = due_date
+        self.completed_date = completed_date
+        self.blocker = blocker
+        self.notes = notes
+        self.dependencies = dependencies
+
+    def __repr__(self):
+        return f"Task({self.id}, {self.name!r}, {self.status.value!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Task):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def days_left(self, today=None):
+        """Days until the due date (negative when overdue), None without one"""
+        if self.due_date is None:
+            return None
+        return (self.due_date - (today or date.today())).days
+
+    def is_overdue(self, today=None):
+        days = self.days_left(today)
+        return days is not None and days < 0 and self.status is not Status.COMPLETE
+
+@lru_cache(maxsize=None)
+def parse_date(text):
+    """Parse the sheet's M/D/YYYY dates (cached: the same dates repeat a lot)"""
+    if not text:
+        return None
+    month, day, year = text.split('/')
+    return date(int(year), int(month), int(day))
+
+def _dependencies(text):
+    return tuple(int(part) for part in text.replace(';', ',').split(',') if part.strip())
+
+def sheet_row(row, header=COLUMNS):
+    """
+    A row of a TSV with this header as the sheet stores it: an empty Blocker
+    cell added when the header has no Blocker column, padded to full width
+    """
+    row = list(row)
+    width = len(header)
+    if 'Blocker' not in header:
+        if len(row) > _BLOCKER:
+            row.insert(_BLOCKER, '')
+        width += 1
+    return row + [''] * (width - len(row))
+
+def parse_row(row, header=COLUMNS):
+    """Task from one sheet/TSV row (a list of strings); raises ValueError on bad values"""
+    row = sheet_row(row, header)
+    return Task(
+        id=int(row[0]),
+        phase=sys.intern(row[1]),
+        name=row[2],
+        owner=sys.intern(row[3]),
+        status=Status(row[4] or Status.NOT_STARTED.value),
+        priority=Priority(row[5] or Priority.MEDIUM.value),
+        start_date=parse_date(row[6]),
+        due_date=parse_date(row[7]),
+        completed_date=parse_date(row[8]),
+        blocker=row[10],
+        notes=row[11],
+        dependencies=_dependencies(row[12]),
+    )
+
+def iter_tasks(path):
+    """Yield a Task for every non-empty row of a task TSV, one line at a time"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = csv.reader(f, delimiter='\t')
+        header = next(rows, None)
+        if header is None:
+            return
+        for line, row in enumerate(rows, start=2):
+            if len(row) < 3 or not row[2]:
+                continue  # no task name, as getTasksData skips them
+            try:
+                yield parse_row(row, header)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line}: {e}") from None
+
+# Sheet column -> (Task attribute, parser) for single-cell edits
+_EDITABLE = {
+    'Phase': ('phase', sys.intern),
+    'Task Name': ('name', str),
+    'Owner': ('owner', sys.intern),
+    'Status': ('status', lambda v: Status(v or Status.NOT_STARTED.value)),
+    'Priority': ('priority', lambda v: Priority(v or Priority.MEDIUM.value)),
+    'Start Date': ('start_date', parse_date),
+    'Due Date': ('due_date', parse_date),
+    'Completed': ('completed_date', parse_date),
+    'Blocker': ('blocker', str),
+    'Notes': ('notes', str),
+    'Dependencies': ('dependencies', _dependencies),
+}
+
+def edit_task(task, column, value):
+    """
+    Copy of task with one sheet cell changed. column is a header name or a
+    1-based sheet column number, as in an onEdit event. Returns task itself
+    for columns that do not feed the store (e.g. Days Left).
+    """
+    if isinstance(column, int):
+        column = COLUMNS[column - 1]
+    if column not in _EDITABLE:
+        return task
+    attr, parse = _EDITABLE[column]
+    edited = Task(**{name: getattr(task, name) for name in Task.__slots__})
+    setattr(edited, attr, parse(value))
+    return edited
+
+def diff_tasks(old, new):
+    """
+    Row-level diff between two task collections keyed by ID.
+    Returns (changed, removed_ids): tasks added or modified in new, and IDs
+    that disappeared.
+    """
+    old = {task.id: task for task in old}
+    changed = []
+    seen = set()
+    for task in new:
+        seen.add(task.id)
+        if old.get(task.id) != task:
+            changed.append(task)
+    return changed, [task_id for task_id in old if task_id not in seen]
+
+class TaskStore:
+    """Tasks plus status/owner/phase indexes for fast filtering"""
+    def __init__(self, tasks=()):
+        self.tasks = []
+        self.by_id = {}
+        self.by_status = {}
+        self.by_owner = {}
+        self.by_phase = {}
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task):
+        if task.id in self.by_id:
+            raise ValueError(f"Duplicate task ID {task.id}: {task.name!r}")
+        self.tasks.append(task)
+        self.by_id[task.id] = task
+        self.by_status.setdefault(task.status, []).append(task)
+        self.by_owner.setdefault(task.owner, []).append(task)
+        self.by_phase.setdefault(task.phase, []).append(task)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def get(self, task_id):
+        return self.by_id.get(task_id)
+
+    @property
+    def owners(self):
+        return list(self.by_owner)
+
+    @property
+    def phases(self):
+        return sorted(self.by_phase)
+
+    def query(self, status=None, owner=None, phase=None):
+        """Tasks matching every given filter, in file order"""
+        candidates = []
+        if status is not None:
+            candidates.append(self.by_status.get(Status(status), []))
+        if owner is not None:
+            candidates.append(self.by_owner.get(owner, []))
+        if phase is not None:
+            candidates.append(self.by_phase.get(phase, []))
+        if not candidates:
+            return list(self.tasks)
+        # Start from the smallest index and check the rest by identity
+        candidates.sort(key=len)
+        result = candidates[0]
+        for other in candidates[1:]:
+            keep = set(map(id, other))
+            result = [task for task in result if id(task) in keep]
+        return list(result)
+
+    def overdue(self, today=None):
+        today = today or date.today()
+        return [task for task in self.tasks if task.is_overdue(today)]
+
+    def dependents(self, task_id):
+        """Tasks that list task_id as a dependency"""
+        return [task for task in self.tasks if task_id in task.dependencies]
+
+def load_tasks(paths=TASK_FILES):
+    """Stream every task file into one TaskStore"""
+    store = TaskStore()
+    for path in paths:
+        for task in iter_tasks(path):
+            store.add(task)
+    return store
@@ -0,0 +1,170 @@
+"""
+PopTop part thumbnails
+Software-renders STL parts to PNG with NumPy: an orthographic camera
+(isometric by default), a z-buffer and flat shading in the brand navy.
+Triangles are rasterized in vectorized batches and the image is rendered
+at 2x and averaged down for smooth edges.
+
+Parts are drawn from their decimated previews (see simplify), so no
+render handles more than PREVIEW_TRIANGLES triangles. Thumbnails are cached
+in .poptop-cache/thumbnails by the STL's content hash and the render
+settings, and missing ones are rendered in parallel across parts, so a
+build only pays for parts that changed.
+Needs NumPy and Pillow (pip3 install numpy pillow).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from . import ROOT
+from .mesh import file_hash
+from .simplify import PREVIEW_TRIANGLES, PREVIEW_VERSION, preview_mesh
+
+CACHE_DIR = ROOT / '.poptop-cache' / 'thumbnails'
+RENDER_VERSION = 2  # bump when the renderer's output changes
+
+THUMBNAIL_SIZE = 480
+SUPERSAMPLE = 2
+ISOMETRIC = (1.0, -1.0, 0.8)  # camera direction, z up
+VIEWS = {
+    'iso': ISOMETRIC,
+    'front': (0.0, -1.0, 0.0),
+    'side': (1.0, 0.0, 0.0),
+    'top': (0.0, 0.0, 1.0),
+}
+
+_DARK = np.array([26, 54, 93], dtype=np.float64)      # PRIMARY #1a365d
+_LIGHT = np.array([214, 226, 240], dtype=np.float64)
+_AMBIENT = 0.18
+_SAMPLE_BUDGET = 1 << 19  # triangle x pixel tests per batch
+
+def _unit(v):
+    v = np.asarray(v, dtype=np.float64)
+    return v / np.linalg.norm(v)
+
+def _camera(direction):
+    """(right, up, towards camera) basis for looking along -direction"""
+    towards = _unit(direction)
+    world_up = np.array([0.0, 1.0, 0.0]) if abs(towards[2]) > 0.99 else np.array([0.0, 0.0, 1.0])
+    right = _unit(np.cross(world_up, towards))
+    return right, np.cross(towards, right), towards
+
+def rasterize(triangles, size=THUMBNAIL_SIZE, view='iso', margin=0.06):
+    """(size, size) float array of shading in [0, 1], NaN where nothing was drawn"""
+    right, up, towards = _camera(VIEWS.get(view, view))
+    tri = np.asarray(triangles, dtype=np.float64)
+    if not len(tri):
+        return np.full((size, size), np.nan)
+    tri = tri - tri.reshape(-1, 3).mean(axis=0)
+
+    # Flat shading from the face normals (two-sided: STL winding is not trusted)
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    normals /= np.where(lengths > 0, lengths, 1)[:, None]
+    light = _unit(towards + 0.6 * up - 0.4 * right)
+    shade = _AMBIENT + (1 - _AMBIENT) * np.abs(normals @ light)
+
+    # Orthographic projection, scaled to fit with a margin; y grows downward
+    xs, ys, depth = tri @ right, tri @ up, -(tri @ towards)
+    extent = max(np.ptp(xs), np.ptp(ys)) or 1.0
+    scale = size * (1 - 2 * margin) / extent
+    xs = (xs - (xs.min() + xs.max()) / 2) * scale + size / 2
+    ys = size / 2 - (ys - (ys.min() + ys.max()) / 2) * scale
+
+    left = np.clip(np.floor(xs.min(axis=1)), 0, size - 1).astype(np.int64)
+    top = np.clip(np.floor(ys.min(axis=1)), 0, size - 1).astype(np.int64)
+    widths = np.clip(np.ceil(xs.max(axis=1)), 0, size - 1).astype(np.int64) - left + 1
+    heights = np.clip(np.ceil(ys.max(axis=1)), 0, size - 1).astype(np.int64) - top + 1
+
+    # Per-pixel tests run in float32: plenty for screen coordinates
+    xs, ys, depth = xs.astype(np.float32), ys.astype(np.float32), depth.astype(np.float32)
+    zbuffer = np.full(size * size, np.inf, dtype=np.float32)
+    image = np.full(size * size, np.nan)
+    # Batch triangles of similar box shape so one offset grid covers them all
+    order = np.lexsort((heights, widths))
+    start = 0
+    while start < len(order):
+        bw, bh = widths[order[start]], heights[order[start]]
+        end = start + 1
+        while end < len(order):
+            w, h = max(bw, widths[order[end]]), max(bh, heights[order[end]])
+            if w * h * (end - start + 1) > _SAMPLE_BUDGET:
+                break
+            bw, bh = w, h
+            end += 1
+        batch = order[start:end]
+        start = end
+
+        oy, ox = np.divmod(np.arange(bw * bh, dtype=np.int32), bw)
+        px = left[batch, None] + ox[None, :]
+        py = top[batch, None] + oy[None, :]
+        cx, cy = px.astype(np.float32) + 0.5, py.astype(np.float32) + 0.5
+        x0, x1, x2 = (xs[batch, i, None] for i in range(3))
+        y0, y1, y2 = (ys[batch, i, None] for i in range(3))
+        area = (x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)
+        area = np.where(np.abs(area) > 1e-6, area, np.nan)
+        w0 = ((x1 - cx) * (y2 - cy) - (x2 - cx) * (y1 - cy)) / area
+        w1 = ((x2 - cx) * (y0 - cy) - (x0 - cx) * (y2 - cy)) / area
+        w2 = 1 - w0 - w1
+        inside = ((w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+                  & (ox[None, :] < widths[batch, None]) & (oy[None, :] < heights[batch, None])
+                  & (px < size) & (py < size))
+        rows, cols = np.nonzero(inside)
+        if not len(rows):
+            continue
+        z = (w0 * depth[batch, 0, None] + w1 * depth[batch, 1, None] + w2 * depth[batch, 2, None])[rows, cols]
+        pixel = py[rows, cols] * size + px[rows, cols]
+
+        # Nearest fragment per pixel, then test it against the z-buffer
+        nearest = np.lexsort((z, pixel))
+        pixel, z, tri_index = pixel[nearest], z[nearest], batch[rows[nearest]]
+        first = np.ones(len(pixel), dtype=bool)
+        first[1:] = pixel[1:] != pixel[:-1]
+        pixel, z, tri_index = pixel[first], z[first], tri_index[first]
+        closer = z < zbuffer[pixel]
+        zbuffer[pixel[closer]] = z[closer]
+        image[pixel[closer]] = shade[tri_index[closer]]
+    return image.reshape(size, size)
+
+def render_image(triangles, size=THUMBNAIL_SIZE, view='iso'):
+    """(size, size, 3) uint8 RGB render on white"""
+    shade = rasterize(triangles, size * SUPERSAMPLE, view)
+    drawn = ~np.isnan(shade)
+    rgb = np.full(shade.shape + (3,), 255.0)
+    rgb[drawn] = _DARK + (_LIGHT - _DARK) * shade[drawn, None]
+    rgb = rgb.reshape(size, SUPERSAMPLE, size, SUPERSAMPLE, 3).mean(axis=(1, 3))
+    return np.round(rgb).astype(np.uint8)
+
+def write_png(rgb, path):
+    partial = f'{path}.tmp'
+    Image.fromarray(rgb, 'RGB').save(partial, format='PNG', optimize=True)
+    os.replace(partial, path)
+
+def content_hash(path, size=THUMBNAIL_SIZE, view='iso'):
+    """Cache key: STL bytes plus everything that changes the picture"""
+    return file_hash(path, f'{RENDER_VERSION}:{size}:{view}:{PREVIEW_VERSION}:{PREVIEW_TRIANGLES}:')
+
+def _render_part(path, output, size, view):
+    write_png(render_image(preview_mesh(path).triangles, size, view), output)
+    return output
+
+def render_thumbnails(paths, size=THUMBNAIL_SIZE, view='iso', jobs=None):
+    """
+    {STL path: PNG path} for every part, rendering only the ones not cached
+    yet, in parallel worker processes.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    outputs = {path: str(CACHE_DIR / f'{content_hash(path, size, view)}.png') for path in paths}
+    missing = [(path, output) for path, output in outputs.items() if not os.path.exists(output)]
+    workers = min(len(missing), jobs or os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(_render_part, path, output, size, view) for path, output in missing]:
+                future.result()
+    else:
+        for path, output in missing:
+            _render_part(path, output, size, view)
+    return outputs
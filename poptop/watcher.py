@@ -0,0 +1,294 @@
+"""
+PopTop meeting notes watcher
+Watches the meeting-notes folder and commits + pushes changed notes.
+Saves are debounced: every change is queued per file, and once the folder
+has been quiet for a moment (or a change has waited too long) all queued
+notes go out in one commit and one push.
+
+Change events come from inotify on Linux, fswatch where it is installed
+(macOS), and mtime polling otherwise.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import shutil
+import signal
+import struct
+import sys
+import time
+from datetime import datetime
+
+from . import ROOT
+from .notes import NOTES_DIR, is_email_draft
+
+LOG_FILE = ROOT / 'scripts' / 'watcher.log'
+
+QUIET_SECONDS = 2.0     # commit once no note has changed for this long
+MAX_DELAY_SECONDS = 30.0  # ...but never hold a change longer than this
+POLL_SECONDS = 1.0
+
+def is_note(path):
+    """Markdown notes only; email drafts are generated, not edited"""
+    name = os.path.basename(path)
+    return name.endswith('.md') and not is_email_draft(name)
+
+# ── Event sources: async generators of changed paths ──
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_EVENT = struct.Struct('iIII')
+
+async def inotify_events(directory):
+    """Linux inotify through libc, read from the event loop without threads"""
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE | _IN_DELETE | _IN_MODIFY
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    loop.add_reader(fd, ready.set)
+    try:
+        while True:
+            await ready.wait()
+            ready.clear()
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _IN_EVENT.unpack_from(data, offset)
+                offset += _IN_EVENT.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name:
+                    yield os.path.join(directory, os.fsdecode(name))
+    finally:
+        loop.remove_reader(fd)
+        os.close(fd)
+
+async def fswatch_events(directory):
+    """macOS: stream NUL-separated paths from fswatch"""
+    process = await asyncio.create_subprocess_exec(
+        'fswatch', '-0', str(directory), stdout=asyncio.subprocess.PIPE)
+    buffer = b''
+    try:
+        while True:
+            chunk = await process.stdout.read(4096)
+            if not chunk:
+                return
+            buffer += chunk
+            *paths, buffer = buffer.split(b'\0')
+            for path in paths:
+                yield os.fsdecode(path)
+    finally:
+        if process.returncode is None:
+            process.terminate()
+            await process.wait()
+
+async def poll_events(directory, interval=POLL_SECONDS):
+    """Fallback: compare mtimes every interval seconds"""
+    def snapshot():
+        with os.scandir(directory) as entries:
+            return {e.path: e.stat().st_mtime_ns for e in entries if e.is_file()}
+
+    seen = snapshot()
+    while True:
+        await asyncio.sleep(interval)
+        current = snapshot()
+        for path in current.keys() | seen.keys():
+            if current.get(path) != seen.get(path):
+                yield path
+        seen = current
+
+def default_events(directory):
+    if sys.platform.startswith('linux'):
+        return inotify_events(directory)
+    if shutil.which('fswatch'):
+        return fswatch_events(directory)
+    return poll_events(directory)
+
+# ── Watcher ──
+
+class Metrics:
+    """Counters and latencies for the running watcher"""
+    def __init__(self):
+        self.events = 0
+        self.ignored = 0
+        self.batches = 0
+        self.files_committed = 0
+        self.commits = 0
+        self.pushes = 0
+        self.push_failures = 0
+        self.latencies = []  # first queued change -> pushed, per batch
+
+    def summary(self, queue_depth):
+        latency = ''
+        if self.latencies:
+            latency = (f", latency avg {sum(self.latencies) / len(self.latencies):.1f}s"
+                       f" max {max(self.latencies):.1f}s")
+        return (f"{self.events} events ({self.ignored} ignored) -> {self.commits} commit(s), "
+                f"{self.pushes} push(es), {self.push_failures} failed push(es), "
+                f"{self.files_committed} file(s); queue depth {queue_depth}{latency}")
+
+class NotesWatcher:
+    """Debounces note changes and commits/pushes them in batches"""
+    def __init__(self, notes_dir=NOTES_DIR, repo_dir=ROOT, quiet=QUIET_SECONDS,
+                 max_delay=MAX_DELAY_SECONDS, push=True, log_file=LOG_FILE, events=None):
+        self.notes_dir = str(notes_dir)
+        self.repo_dir = str(repo_dir)
+        self.quiet = quiet
+        self.max_delay = max_delay
+        self.push = push
+        self.log_file = log_file
+        self.events = events if events is not None else default_events(self.notes_dir)
+        self.metrics = Metrics()
+        self.pending = {}  # path -> time of its first queued change
+        self.last_change = 0.0
+        self._changed = asyncio.Event()
+        self._committing = None  # the batch commit in flight, if any
+
+    @property
+    def queue_depth(self):
+        return len(self.pending)
+
+    def log(self, message):
+        line = f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}"
+        print(line, flush=True)
+        if self.log_file:
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    def queue(self, path):
+        """Record one change event; repeated saves of a file coalesce"""
+        self.metrics.events += 1
+        if not is_note(path):
+            self.metrics.ignored += 1
+            return
+        now = time.monotonic()
+        self.pending.setdefault(path, now)
+        self.last_change = now
+        self._changed.set()
+
+    async def _git(self, *args):
+        process = await asyncio.create_subprocess_exec(
+            'git', *args, cwd=self.repo_dir,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        output, _ = await process.communicate()
+        # rstrip only: porcelain status lines start with a meaningful space
+        return process.returncode, output.decode(errors='replace').rstrip()
+
+    async def commit_batch(self, batch):
+        """One commit (and one push) for every note in batch that actually changed"""
+        self.metrics.batches += 1
+        paths = sorted(batch)
+        code, status = await self._git('status', '--porcelain', '-z', '--', *paths)
+        changed = []
+        entries = iter(status.split('\0'))
+        for entry in entries:
+            if entry:
+                changed.append(entry[3:])
+                if entry[0] in 'RC':
+                    next(entries, None)  # the rename's source path
+        if code != 0 or not changed:
+            self.log(f"No changes to commit ({len(paths)} file(s) touched)")
+            return
+
+        names = sorted({os.path.basename(path) for path in changed})
+        await self._git('add', '-A', '--', *changed)
+        # The pathspec keeps anything else already staged out of the commit
+        code, output = await self._git(
+            'commit', '-m', f"Update meeting notes: {', '.join(names)}",
+            '-m', 'Auto-committed by watcher script', '--', *changed)
+        if code != 0:
+            self.log(f"Commit failed: {output}")
+            return
+        self.metrics.commits += 1
+        self.metrics.files_committed += len(names)
+        self.log(f"Committed {len(names)} note(s): {', '.join(names)}")
+
+        if self.push:
+            started = time.monotonic()
+            code, output = await self._git('push')
+            if code == 0:
+                self.metrics.pushes += 1
+                self.log(f"Pushed in {time.monotonic() - started:.1f}s")
+            else:
+                # The commit stays local; the next batch's push carries it
+                self.metrics.push_failures += 1
+                self.log(f"Push failed: {output}")
+
+        latency = time.monotonic() - min(batch.values())
+        self.metrics.latencies.append(latency)
+        self.log(f"Batch done: latency {latency:.1f}s, queue depth {self.queue_depth}")
+        if shutil.which('afplay'):
+            await asyncio.create_subprocess_exec('afplay', '/System/Library/Sounds/Glass.aiff')
+
+    async def _flush_loop(self):
+        while True:
+            await self._changed.wait()
+            while True:
+                first = min(self.pending.values())
+                deadline = min(self.last_change + self.quiet, first + self.max_delay)
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            batch, self.pending = self.pending, {}
+            self._changed.clear()
+            # Shielded: stopping the loop must not drop a batch already taken off the queue
+            self._committing = asyncio.ensure_future(self.commit_batch(batch))
+            await asyncio.shield(self._committing)
+
+    async def flush(self):
+        """Commit whatever is queued right now"""
+        if self.pending:
+            batch, self.pending = self.pending, {}
+            self._changed.clear()
+            await self.commit_batch(batch)
+
+    async def run(self):
+        self.log(f"Watching: {self.notes_dir}")
+        flusher = asyncio.create_task(self._flush_loop())
+        try:
+            async for path in self.events:
+                self.queue(path)
+        finally:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            if self._committing is not None:
+                await self._committing
+            await self.flush()
+            self.log(self.metrics.summary(self.queue_depth))
+
+def watch(**options):
+    """Run the watcher until interrupted; SIGUSR1 logs the current metrics"""
+    async def main():
+        watcher = NotesWatcher(**options)
+        loop = asyncio.get_running_loop()
+        if hasattr(signal, 'SIGUSR1'):
+            loop.add_signal_handler(
+                signal.SIGUSR1, lambda: watcher.log(watcher.metrics.summary(watcher.queue_depth)))
+        task = asyncio.create_task(watcher.run())
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
@@ -0,0 +1,351 @@
+"""
+PopTop sync webhook
+A local stand-in for the Apps Script web app (doPost in Code.gs). It takes
+the same JSON POSTs the GitHub sync workflow sends,
+
+    {"event": "meeting_notes_updated", "repo": "...", "commit": "..."}
+
+and answers with doPost's {"status", "message"} JSON. Instead of a full
+dashboard refresh per event, events are queued per repo, and once a repo
+has been quiet for a moment (or its oldest event has waited too long) one
+refresh covers every commit in that window.
+
+A refresh re-reads only the task rows that changed (DashboardAggregator),
+writes the Dashboard payload to .poptop-cache/dashboard-payload.json and
+appends the sync log doPost writes to Config!A20:C20, plus queue and
+latency metrics, to .poptop-cache/webhook-sync.tsv. sheet_rows batches
+from `poptop sync` are written into the mock sheets (see sheets.py). GET
+returns the metrics and the last sync as JSON.
+
+As in doPost, events that read or write sheet data (WRITE_EVENTS) need the
+shared token; without one configured they are refused.
+"""
+
+import asyncio
+import csv
+import json
+import os
+import signal
+import threading
+import time
+from datetime import date, datetime
+
+from . import ROOT
+from .dashboard import DashboardAggregator, apply_payload_updates, load_phases
+from .sheets import MockBackend
+from .tasks import load_tasks
+
+CACHE_DIR = ROOT / '.poptop-cache'
+PAYLOAD_FILE = CACHE_DIR / 'dashboard-payload.json'
+SYNC_LOG = CACHE_DIR / 'webhook-sync.tsv'
+SYNC_LOG_COLUMNS = ('Last GitHub Sync', 'Repo', 'Commit', 'Events', 'Commits',
+                    'Queue Wait (s)', 'Refresh (s)', 'Queue Depth')
+
+HOST = '127.0.0.1'
+PORT = 8765
+QUIET_SECONDS = 2.0       # refresh once a repo has sent nothing for this long
+MAX_DELAY_SECONDS = 30.0  # ...but never hold an event longer than this
+MAX_BODY = 1 << 20
+
+WRITE_EVENTS = ('dashboard_payload', 'dashboard_update', 'sheet_rows', 'sheet_values')
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+class Window:
+    """Events from one repo waiting for the same refresh"""
+    def __init__(self, now):
+        self.first = now
+        self.last = now
+        self.events = 0
+        self.commits = []  # distinct commits, oldest first
+
+    def add(self, commit, now):
+        self.events += 1
+        self.last = now
+        if commit not in self.commits:
+            self.commits.append(commit)
+
+    def deadline(self, quiet, max_delay):
+        return min(self.last + quiet, self.first + max_delay)
+
+class Metrics:
+    """Counters and latencies for the running receiver"""
+    def __init__(self):
+        self.requests = 0
+        self.events = 0
+        self.ignored = 0
+        self.errors = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.max_queue_depth = 0
+        self.latencies = []     # first queued event -> refresh done, per window
+        self.refresh_times = []
+
+    def as_dict(self, queue_depth):
+        def stats(values):
+            return {'avg': round(sum(values) / len(values), 3), 'max': round(max(values), 3)} if values else None
+        return {
+            'requests': self.requests, 'events': self.events, 'ignored': self.ignored,
+            'errors': self.errors, 'refreshes': self.refreshes, 'refresh_failures': self.refresh_failures,
+            'queue_depth': queue_depth, 'max_queue_depth': self.max_queue_depth,
+            'latency': stats(self.latencies), 'refresh_time': stats(self.refresh_times),
+        }
+
+    def summary(self, queue_depth):
+        latency = ''
+        if self.latencies:
+            latency = (f", latency avg {sum(self.latencies) / len(self.latencies):.1f}s"
+                       f" max {max(self.latencies):.1f}s")
+        return (f"{self.events} sync event(s), {self.ignored} other, {self.errors} bad -> "
+                f"{self.refreshes} refresh(es), {self.refresh_failures} failed; "
+                f"queue depth {queue_depth} (max {self.max_queue_depth}){latency}")
+
+class DashboardRefresher:
+    """updateDashboard() for the local files: incremental stats, one payload per refresh"""
+    def __init__(self, payload_file=PAYLOAD_FILE):
+        self.payload_file = payload_file
+        self.aggregator = None
+        self._lock = threading.Lock()  # refreshes run in a worker thread
+
+    def refresh(self):
+        """
+        Bring the dashboard up to date; returns how many task rows changed.
+        Only the cells the refresh changed are written into the stored
+        payload, so cells pushed with dashboard_update since the last
+        refresh stay as they are unless the refresh changes them too.
+        """
+        if self.aggregator is None:
+            self.aggregator = DashboardAggregator(load_tasks(), load_phases())
+            changed = len(self.aggregator.tasks)
+        else:
+            changed = sum(self.aggregator.sync_files())
+        self.aggregator.set_today(date.today())
+        self.apply(self.aggregator.update(), fallback=self.aggregator.payload)
+        return changed
+
+    def _write(self, payload):
+        os.makedirs(os.path.dirname(self.payload_file), exist_ok=True)
+        partial = f'{self.payload_file}.tmp'
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(partial, self.payload_file)
+
+    def write(self, payload):
+        with self._lock:
+            self._write(payload)
+
+    def apply(self, change, fallback=None):
+        """
+        Apply a change ({'full': ...} or {'updates': [...]}) to the stored
+        payload, as applyDashboardUpdates does to the tab. The read, apply
+        and write happen under one lock so concurrent changes are not lost;
+        fallback is written whole if there is no stored payload to update.
+        """
+        with self._lock:
+            if 'updates' in change:
+                try:
+                    with open(self.payload_file, encoding='utf-8') as f:
+                        payload = json.load(f)
+                except FileNotFoundError:
+                    if fallback is None:
+                        raise
+                    self._write(fallback)
+                    return
+                self._write(apply_payload_updates(payload, change))
+            else:
+                self._write(apply_payload_updates(None, change))
+
+class WebhookReceiver:
+    """Queues sync events per repo and refreshes the dashboard once per window"""
+    def __init__(self, quiet=QUIET_SECONDS, max_delay=MAX_DELAY_SECONDS, refresher=None,
+                 sync_log=SYNC_LOG, sheets=None, token=None):
+        self.quiet = quiet
+        self.max_delay = max_delay
+        self.refresher = refresher or DashboardRefresher()
+        self.sheets = sheets or MockBackend()
+        self.sync_log = sync_log
+        self.token = token or os.environ.get('SHEETS_WEBHOOK_TOKEN')
+        self.metrics = Metrics()
+        self.pending = {}    # repo -> Window
+        self.last_sync = None  # Config!A20:C20 as doPost writes it
+        self._changed = asyncio.Event()
+        self._refreshing = asyncio.Lock()
+
+    @property
+    def queue_depth(self):
+        return sum(window.events for window in self.pending.values())
+
+    def log(self, message):
+        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+    def handle(self, data):
+        """doPost: the {'status', 'message', ...} reply for one decoded JSON body"""
+        event = data.get('event')
+        if event in WRITE_EVENTS and not (self.token and data.get('token') == self.token):
+            self.metrics.errors += 1
+            return {'status': 'error', 'message': 'Unauthorized'}
+        if event == 'meeting_notes_updated':
+            self.queue(data.get('repo') or 'unknown', data.get('commit') or 'unknown')
+            return {'status': 'success', 'message': 'Dashboard update queued'}
+        if event == 'dashboard_payload':
+            self.refresher.write(data['payload'])
+            return {'status': 'success', 'message': 'Dashboard written'}
+        if event == 'dashboard_update':
+            self.refresher.apply(data['change'])
+            return {'status': 'success', 'message': 'Dashboard cells updated'}
+        if event == 'sheet_rows':
+            return {'status': 'success', 'message': f"{self.sheets.batch_update(data['updates'])} range(s) written"}
+        if event == 'sheet_values':
+            sheets = self.sheets.read_sheets(data['sheets'])
+            return {'status': 'success', 'message': f"{len(sheets)} sheet(s) read", 'sheets': sheets}
+        self.metrics.ignored += 1
+        return {'status': 'ok', 'message': 'Event received'}
+
+    def queue(self, repo, commit):
+        """Record one sync event; events from the same repo coalesce"""
+        now = time.monotonic()
+        self.metrics.events += 1
+        window = self.pending.get(repo)
+        if window is None:
+            window = self.pending[repo] = Window(now)
+        window.add(commit, now)
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.queue_depth)
+        self._changed.set()
+
+    async def refresh_window(self, repo, window):
+        """One dashboard refresh for every event in window"""
+        async with self._refreshing:
+            started = time.monotonic()
+            try:
+                changed = await asyncio.to_thread(self.refresher.refresh)
+            except Exception as e:
+                self.metrics.refresh_failures += 1
+                self.log(f"Refresh failed for {repo}: {e}")
+                return
+            finished = time.monotonic()
+        self.metrics.refreshes += 1
+        self.metrics.refresh_times.append(finished - started)
+        self.metrics.latencies.append(finished - window.first)
+        commit = window.commits[-1]
+        synced = datetime.now()
+        self.last_sync = {'A20': 'Last GitHub Sync:', 'B20': synced.isoformat(timespec='seconds'), 'C20': commit}
+        self.record(synced, repo, commit, window, started - window.first, finished - started)
+        self.log(f"Refreshed dashboard for {repo} @ {commit[:12]}: {window.events} event(s), "
+                 f"{len(window.commits)} commit(s), {changed} task row(s) changed, "
+                 f"refresh {finished - started:.2f}s, queue depth {self.queue_depth}")
+
+    def record(self, synced, repo, commit, window, waited, took):
+        if not self.sync_log:
+            return
+        os.makedirs(os.path.dirname(self.sync_log), exist_ok=True)
+        new = not os.path.exists(self.sync_log)
+        with open(self.sync_log, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+            if new:
+                writer.writerow(SYNC_LOG_COLUMNS)
+            writer.writerow([synced.isoformat(timespec='seconds'), repo, commit, window.events,
+                             len(window.commits), f'{waited:.3f}', f'{took:.3f}', self.queue_depth])
+
+    async def _flush_loop(self):
+        while True:
+            if not self.pending:
+                self._changed.clear()
+                await self._changed.wait()
+                continue
+            repo = min(self.pending, key=lambda r: self.pending[r].deadline(self.quiet, self.max_delay))
+            delay = self.pending[repo].deadline(self.quiet, self.max_delay) - time.monotonic()
+            if delay > 0:
+                # Sleep until the earliest window is due, or a new event moves it
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self.refresh_window(repo, self.pending.pop(repo))
+
+    async def flush(self):
+        """Refresh every queued window right now"""
+        while self.pending:
+            repo = next(iter(self.pending))
+            await self.refresh_window(repo, self.pending.pop(repo))
+
+    # ── HTTP ──
+
+    async def _respond(self, writer, code, body):
+        data = json.dumps(body).encode()
+        writer.write(f"HTTP/1.1 {code} {_REASONS[code]}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data)
+        await writer.drain()
+
+    async def _serve(self, reader, writer):
+        try:
+            request = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            method = request.split(b' ', 1)[0].decode('latin-1')
+            self.metrics.requests += 1
+            if method == 'GET':
+                await self._respond(writer, 200, {'metrics': self.metrics.as_dict(self.queue_depth),
+                                                  'lastSync': self.last_sync})
+                return
+            if method != 'POST':
+                await self._respond(writer, 405, {'status': 'error', 'message': f'{method} not allowed'})
+                return
+            try:
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self.metrics.errors += 1
+                await self._respond(writer, 400, {'status': 'error', 'message': 'Bad Content-Length'})
+                return
+            if length > MAX_BODY:
+                await self._respond(writer, 413, {'status': 'error', 'message': 'Body too large'})
+                return
+            try:
+                reply = self.handle(json.loads(await reader.readexactly(length)))
+            except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+                # doPost answers errors with a 200 and status 'error'
+                self.metrics.errors += 1
+                reply = {'status': 'error', 'message': str(e)}
+            await self._respond(writer, 200, reply)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def run(self, host=HOST, port=PORT):
+        server = await asyncio.start_server(self._serve, host, port)
+        self.log(f"Listening on http://{host}:{port}/")
+        flusher = asyncio.create_task(self._flush_loop())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            flusher.cancel()
+            await self.flush()
+            self.log(self.metrics.summary(self.queue_depth))
+
+def serve(host=HOST, port=PORT, **options):
+    """Run the receiver until interrupted; SIGUSR1 logs the current metrics"""
+    async def main():
+        receiver = WebhookReceiver(**options)
+        loop = asyncio.get_running_loop()
+        if hasattr(signal, 'SIGUSR1'):
+            loop.add_signal_handler(
+                signal.SIGUSR1, lambda: receiver.log(receiver.metrics.summary(receiver.queue_depth)))
+        task = asyncio.create_task(receiver.run(host, port))
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
@@ -1,90 +1,31 @@
 #!/bin/bash
 # PopTop Automation Tools
-# Quick launcher for all PopTop scripts
+# Kept so existing `poptop` aliases keep working: every command now lives
+# in the Python CLI (python3 -m poptop), which only imports what the chosen
+# command needs. Run `poptop help` for the list.
 #
-# Usage: ./poptop-tools.sh [command]
+# Usage: ./poptop-tools.sh [command] [options]
 #
-# Commands:
-#   watch     - Start watching for meeting note changes (auto-commit/push)
-#   email     - Generate HTML email from today's meeting notes
-#   email [date] - Generate HTML email for specific date (YYYY-MM-DD)
-#   process   - Process meeting notes with Claude
-#   status    - Show automation status
-#   help      - Show this help
+# The old shell-only commands map to:
+#   process   - scripts/process-meeting-notes.sh (extract, commit and push)
+#   email     - python3 -m poptop email --open
+#   help      - python3 -m poptop --help
 
 POPTOP_DIR="${POPTOP_DIR:-$HOME/Projects/poptop}"
-SCRIPTS_DIR="$POPTOP_DIR/scripts"
 
 case "${1:-help}" in
-    watch)
-        echo "Starting meeting notes watcher..."
-        echo "Press Ctrl+C to stop"
-        "$SCRIPTS_DIR/watch-meeting-notes.sh"
+    process)
+        shift
+        exec "$POPTOP_DIR/scripts/process-meeting-notes.sh" "$@"
         ;;
-
     email)
-        DATE="${2:-$(date +%Y-%m-%d)}"
-        "$SCRIPTS_DIR/generate-email-html.sh" "$DATE"
-        ;;
-
-    process)
-        DATE="${2:-$(date +%Y-%m-%d)}"
-        "$SCRIPTS_DIR/process-meeting-notes.sh" "$DATE"
+        shift
+        cd "$POPTOP_DIR" && exec python3 -m poptop email --open "$@"
         ;;
-
-    status)
-        echo "=== PopTop Automation Status ==="
-        echo ""
-
-        # Check if watcher is running
-        if pgrep -f "watch-meeting-notes" > /dev/null; then
-            echo "File Watcher: RUNNING"
-        else
-            echo "File Watcher: NOT RUNNING (start with: poptop watch)"
-        fi
-
-        # Check git status
-        echo ""
-        echo "Git Status:"
-        cd "$POPTOP_DIR" && git status -s
-
-        # Check recent commits
-        echo ""
-        echo "Recent Commits:"
-        cd "$POPTOP_DIR" && git log --oneline -3
-
-        # Check if fswatch is installed
-        echo ""
-        echo "Dependencies:"
-        if command -v fswatch &> /dev/null; then
-            echo "  fswatch: installed"
-        else
-            echo "  fswatch: NOT INSTALLED (brew install fswatch)"
-        fi
-
-        if python3 -c "import markdown" 2>/dev/null; then
-            echo "  python markdown: installed"
-        else
-            echo "  python markdown: NOT INSTALLED (pip3 install markdown)"
-        fi
+    help|-h|--help)
+        cd "$POPTOP_DIR" && exec python3 -m poptop --help
         ;;
-
-    help|*)
-        echo "PopTop Automation Tools"
-        echo ""
-        echo "Usage: poptop [command]"
-        echo ""
-        echo "Commands:"
-        echo "  watch       Start file watcher (auto-commit on save)"
-        echo "  email       Generate HTML email from today's notes"
-        echo "  email DATE  Generate HTML email for specific date"
-        echo "  process     Process notes with Claude (extract ARs)"
-        echo "  status      Show automation status"
-        echo "  help        Show this help"
-        echo ""
-        echo "Examples:"
-        echo "  poptop watch"
-        echo "  poptop email 2026-02-06"
-        echo "  poptop status"
+    *)
+        cd "$POPTOP_DIR" && exec python3 -m poptop "$@"
         ;;
 esac
@@ -0,0 +1,109 @@
+from datetime import date
+
+from poptop.__main__ import main
+from poptop.actions import (
+    ACTION_ITEMS_FILE, TSV_COLUMNS, ActionItem, read_tsv, scan_notes, tsv_rows, update_tsv,
+)
+
+NOTES = """# Weekly Sync
+
+---
+
+Discussion
+- ==Brian== to send the deck (due Feb 20)
+- Reviewed AR-007 with the team
+
+| Part | Owner | Notes |
+|------|-------|-------|
+| Lid | ==Paul== | formatting, not an action |
+
+## Action Items
+
+| AR# | Owner | Action | Due | Status |
+|-----|-------|--------|-----|--------|
+| AR-012 | Paul | Quote a\\|b tooling | Feb 27 | Open |
+| AR-013 | Brian | Book the pilot run | Mar 6 | Done |
+
+## Next Meeting
+- ==Sam== will bring samples
+"""
+
+def scan(tmp_path, text=NOTES):
+    path = tmp_path / '2026-02-13-weekly-sync.md'
+    path.write_text(text, encoding='utf-8')
+    return scan_notes(str(path))
+
+def test_action_items_table_rows(tmp_path):
+    result = scan(tmp_path)
+    assert result.meeting_date == date(2026, 2, 13)
+    assert [(i.ar, i.owner, i.action, i.due, i.status) for i in result.items] == [
+        (12, 'Paul', 'Quote a|b tooling', 'Feb 27', 'Open'),
+        (13, 'Brian', 'Book the pilot run', 'Mar 6', 'Done'),
+    ]
+    assert result.max_ar == 13
+
+def test_table_bounds_and_alignment(tmp_path):
+    result = scan(tmp_path)
+    lines = NOTES.splitlines()
+    assert lines[result.table_start].startswith('| AR#')
+    assert lines[result.table_end - 1].startswith('| AR-013')
+    assert not result.table_aligned  # rows are single-spaced, not padded into columns
+
+def test_padded_table_is_aligned(tmp_path):
+    result = scan(tmp_path, NOTES.replace('| AR-013 | Brian |', '| AR-013 | Brian   |'))
+    assert result.table_aligned
+    assert result.items[1].owner == 'Brian'
+
+def test_highlights_outside_other_tables(tmp_path):
+    result = scan(tmp_path)
+    owners = [(owner, action, due) for _, owner, action, due in result.highlights]
+    assert owners == [('Brian', 'Send the deck', 'Feb 20'), ('Sam', 'Will bring samples', '')]
+
+def test_notes_without_a_table(tmp_path):
+    result = scan(tmp_path, "# Standup\n\n- ==Paul== to order resin\n")
+    assert result.items == []
+    assert result.table_start is None
+    assert [h[1] for h in result.highlights] == ['Paul']
+
+def write_tsv_file(path, *rows):
+    path.write_text('\n'.join('\t'.join(row) for row in [TSV_COLUMNS, *rows]) + '\n', encoding='utf-8')
+    return path
+
+def test_tsv_rows_keep_rows_the_notes_do_not_mention(tmp_path):
+    path = write_tsv_file(
+        tmp_path / 'items.tsv',
+        ('AR-002', '2026-02-06', 'Paul', 'Old wording', '', 'Open', '', 'from the sheet'),
+        ('AR-010', '2026-01-30', 'Sam', 'Added by hand', '', 'Open', '', ''),
+    )
+    items = [ActionItem(2, 'Paul', 'Send the deck', 'Feb 20', 'Open', date(2026, 2, 13)),
+             ActionItem(11, 'Brian', 'Book the pilot', '', 'Open', date(2026, 2, 13))]
+    rows = tsv_rows(items, read_tsv(path))
+    assert [row[0] for row in rows] == ['AR-002', 'AR-010', 'AR-011']
+    assert rows[0][3:5] == ['Send the deck', '2026-02-20']
+    assert rows[0][7] == 'from the sheet'
+    assert rows[1][3] == 'Added by hand'
+
+def test_update_tsv_skips_unchanged_and_dry_runs(tmp_path):
+    path = write_tsv_file(tmp_path / 'items.tsv', ('AR-001', '', 'Paul', 'Call', '', 'Open', '', ''))
+    before = path.read_text(encoding='utf-8')
+    rows = tsv_rows([], read_tsv(path))
+    assert not update_tsv(rows, path)
+    rows[0][5] = 'Complete'
+    assert update_tsv(rows, path, write=False)
+    assert path.read_text(encoding='utf-8') == before
+    assert update_tsv(rows, path)
+    assert read_tsv(path)['AR-001']['Status'] == 'Complete'
+
+def test_cmd_actions_merges_into_the_named_tsv_without_writing_on_dry_run(tmp_path, capsys):
+    sheet = read_tsv(ACTION_ITEMS_FILE)
+    first = min(sheet)
+    path = write_tsv_file(tmp_path / 'other.tsv', (first, '', '', '', '', 'Blocked', '', 'only in this file'))
+    before = path.read_text(encoding='utf-8')
+    assert main(['actions', '--dry-run', '--tsv', str(path)]) == 0
+    assert path.read_text(encoding='utf-8') == before
+    assert 'would be updated' in capsys.readouterr().err
+
+    assert main(['actions', '--dry-run', '--tsv', '-']) == 0
+    printed = capsys.readouterr().out
+    assert 'only in this file' not in printed
+    assert sheet[first]['Action'] in printed
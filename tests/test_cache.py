@@ -0,0 +1,55 @@
+import os
+import runpy
+import subprocess
+import sys
+
+from poptop import ROOT
+from poptop.build import load_generator
+from poptop.pdf.cache import document_hash, fingerprint
+from poptop.pdf.theme import get_styles
+
+BUSINESS_PLAN = ROOT / '01-Business-Plan' / 'drafts' / 'generate_pdf.py'
+
+HASH_SCRIPT = f"""
+import runpy
+from poptop.pdf.cache import document_hash
+from poptop.pdf.theme import get_styles
+document = runpy.run_path({str(BUSINESS_PLAN)!r}, run_name='generate_pdf')['DOCUMENT']
+print(document_hash(document, document.build_story(get_styles())))
+"""
+
+def business_plan_hash(document):
+    return document_hash(document, document.build_story(get_styles()))
+
+def test_same_hash_however_the_generator_is_loaded():
+    # poptop build imports the script as poptop_generator_*; running it makes it __main__
+    built = load_generator(BUSINESS_PLAN).DOCUMENT
+    script = runpy.run_path(str(BUSINESS_PLAN), run_name='generate_pdf')['DOCUMENT']
+    assert built.on_first_page.__module__ != script.on_first_page.__module__
+    assert business_plan_hash(built) == business_plan_hash(script)
+
+def test_same_hash_in_a_fresh_interpreter():
+    document = load_generator(BUSINESS_PLAN).DOCUMENT
+    env = dict(os.environ, PYTHONHASHSEED='12345')
+    result = subprocess.run([sys.executable, '-c', HASH_SCRIPT], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == business_plan_hash(document)
+
+def test_options_change_the_hash():
+    document = load_generator(BUSINESS_PLAN).DOCUMENT
+    story = document.build_story(get_styles())
+    assert document_hash(document, story) != document_hash(document, story, options={'optimize': 9})
+
+def test_fingerprint_ignores_identity_but_not_content():
+    styles = get_styles()
+    assert fingerprint([styles['Body'], {'a': 1}]) == fingerprint([styles['Body'], {'a': 1}])
+    assert fingerprint([styles['Body'], {'a': 1}]) != fingerprint([styles['Body'], {'a': 2}])
+    assert fingerprint(len) == fingerprint(len)
+    assert fingerprint(business_plan_hash) != fingerprint(test_options_change_the_hash)
+
+def test_project_paths_hash_the_same_in_any_checkout(monkeypatch):
+    from poptop.pdf import cache
+
+    here = fingerprint(str(ROOT / '.poptop-cache' / 'thumbnails' / 'part.png'))
+    monkeypatch.setattr(cache, '_ROOT_PREFIX', os.sep + 'elsewhere' + os.sep)
+    assert fingerprint(os.path.join(os.sep, 'elsewhere', '.poptop-cache', 'thumbnails', 'part.png')) == here
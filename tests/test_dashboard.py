@@ -0,0 +1,85 @@
+import copy
+import random
+from datetime import date, datetime
+
+from poptop.dashboard import (
+    DashboardAggregator, apply_payload_updates, compute_stats, dashboard_stats, load_phases, payload_updates,
+    sheet_payload,
+)
+from poptop.tasks import Status, edit_task, load_tasks
+
+UPDATED = datetime(2026, 3, 2, 9, 0)
+
+def payload(today=date(2026, 3, 2)):
+    return sheet_payload(dashboard_stats(today=today), updated=UPDATED)
+
+def test_no_changes_no_updates():
+    old = payload()
+    assert payload_updates(old, copy.deepcopy(old)) == {'updates': []}
+
+def test_cell_updates_round_trip():
+    old = payload()
+    new = copy.deepcopy(old)
+    new['values'][3][1] = 'edited'
+    new['values'][3][2] = 'also edited'
+    new['backgrounds'][5][0] = '#000000'
+    change = payload_updates(old, new)
+    assert [u['range'] for u in change['updates']] == ['B4:C4', 'A6:A6']
+    assert apply_payload_updates(old, change) == new
+
+def test_apply_leaves_the_old_payload_alone():
+    old = payload()
+    before = copy.deepcopy(old)
+    new = copy.deepcopy(old)
+    new['fontWeights'][0][0] = 'normal'
+    apply_payload_updates(old, payload_updates(old, new))
+    assert old == before
+
+def test_layout_change_sends_the_full_payload():
+    old = payload()
+    new = copy.deepcopy(old)
+    for grid in ('values', 'backgrounds', 'fontColors', 'fontWeights', 'fontSizes', 'horizontalAlignments'):
+        new[grid].append(list(new[grid][-1]))
+    change = payload_updates(old, new)
+    assert change == {'full': new}
+    assert apply_payload_updates(old, change) is new
+
+def test_later_day_round_trips():
+    old, new = payload(), payload(today=date(2026, 4, 15))
+    assert apply_payload_updates(old, payload_updates(old, new)) == new
+
+def snapshot(stats):
+    return (stats.quick_stats(), stats.workload(), stats.phase_progress(),
+            [t.id for t in stats.overdue], [t.id for t in stats.due_soon])
+
+def test_aggregator_matches_a_full_recompute_after_every_edit():
+    rng = random.Random(8)
+    today = date(2026, 3, 2)
+    phases = load_phases()
+    tasks = list(load_tasks())
+    aggregator = DashboardAggregator(tasks, phases, today=today)
+    owners = sorted({t.owner for t in tasks}) + ['New Hire']
+    phase_ids = sorted({t.phase for t in tasks})
+    next_id = max(t.id for t in tasks) + 1
+    for step in range(300):
+        action = rng.random()
+        if action < 0.1 and len(tasks) > 1:
+            removed = tasks.pop(rng.randrange(len(tasks)))
+            aggregator.remove(removed.id)
+        elif action < 0.2:
+            task = copy.copy(rng.choice(tasks))
+            task = edit_task(task, 'Owner', rng.choice(owners))
+            task.id, next_id = next_id, next_id + 1
+            tasks.append(task)
+            aggregator.upsert(task)
+        else:
+            index = rng.randrange(len(tasks))
+            column, value = rng.choice([
+                ('Owner', rng.choice(owners)),
+                ('Phase', rng.choice(phase_ids)),
+                ('Status', rng.choice([s.value for s in Status])),
+                ('Due Date', f"3/{rng.randint(1, 31)}/2026"),
+            ])
+            tasks[index] = edit_task(tasks[index], column, value)
+            aggregator.apply_edit(tasks[index].id, column, value)
+        assert snapshot(aggregator.stats()) == snapshot(compute_stats(tasks, phases, today=today)), step
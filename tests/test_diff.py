@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from poptop.pdf.diff import diff_sequences
+
+def lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+def check(a, b):
+    """The opcodes cover both sequences in order, rebuild b, and keep a longest common subsequence"""
+    opcodes = diff_sequences(a, b)
+    i = j = 0
+    rebuilt, kept = [], 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == 'equal':
+            assert a[i1:i2] == b[j1:j2]
+            kept += i2 - i1
+        rebuilt.extend(b[j1:j2] if tag != 'delete' else [])
+        assert tag != 'delete' or j1 == j2
+        assert tag != 'insert' or i1 == i2
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    assert rebuilt == list(b)
+    assert kept == lcs_length(a, b)
+    return opcodes
+
+@pytest.mark.parametrize('a, b', [
+    ('', ''),
+    ('abc', ''),
+    ('', 'abc'),
+    ('abc', 'abc'),
+    ('abcabba', 'cbabac'),
+    ('kitten', 'sitting'),
+    ('aaaa', 'aa'),
+])
+def test_small_cases(a, b):
+    check(list(a), list(b))
+
+def test_identical_is_one_equal_run():
+    assert diff_sequences([1, 2, 3], [1, 2, 3]) == [('equal', 0, 3, 0, 3)]
+
+def test_replace_between_matches():
+    assert diff_sequences(['a', 'x', 'c'], ['a', 'y', 'c']) == [
+        ('equal', 0, 1, 0, 1), ('replace', 1, 2, 1, 2), ('equal', 2, 3, 2, 3)]
+
+def test_random_sequences():
+    rng = random.Random(6)
+    for _ in range(200):
+        a = [rng.choice('abcd') for _ in range(rng.randrange(30))]
+        b = [rng.choice('abcd') for _ in range(rng.randrange(30))]
+        check(a, b)
+
+def test_items_only_need_equality():
+    rows = [['Task', 'Owner'], ['Tooling', 'Paul'], ['Pilot', 'Brian']]
+    edited = [['Task', 'Owner'], ['Tooling', 'Sam'], ['Pilot', 'Brian']]
+    assert [op[0] for op in check(rows, edited)] == ['equal', 'replace', 'equal']
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from poptop import mesh
+from poptop.mesh import STL_DTYPE, Mesh, is_binary_stl, open_stl
+
+def cube(size=10.0):
+    """12 outward-facing triangles of an axis-aligned cube with a corner at the origin"""
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float32) * size
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    triangles = []
+    for a, b, c, d in faces:
+        triangles += [corners[[a, b, c]], corners[[a, c, d]]]
+    return np.array(triangles)
+
+def normals(triangles):
+    n = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    return n / np.linalg.norm(n, axis=1, keepdims=True)
+
+def write_binary(path, triangles):
+    records = np.zeros(len(triangles), dtype=STL_DTYPE)
+    records['normal'] = normals(triangles)
+    records['vertices'] = triangles
+    with open(path, 'wb') as f:
+        f.write(b'solid part (SolidWorks starts binary files like this too)'.ljust(80, b' '))
+        f.write(len(records).to_bytes(4, 'little'))
+        f.write(records.tobytes())
+    return path
+
+def write_ascii(path, triangles):
+    lines = ['solid part']
+    for normal, triangle in zip(normals(triangles), triangles):
+        lines.append(f"  facet normal {normal[0]:e} {normal[1]:e} {normal[2]:e}")
+        lines.append("    outer loop")
+        lines += [f"      vertex {x:e} {y:e} {z:e}" for x, y, z in triangle]
+        lines += ["    endloop", "  endfacet"]
+    lines.append('endsolid part')
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+def test_ascii_and_binary_read_the_same(tmp_path, monkeypatch):
+    triangles = cube()
+    binary = write_binary(tmp_path / 'cube-binary.stl', triangles)
+    ascii_ = write_ascii(tmp_path / 'cube-ascii.stl', triangles)
+    assert is_binary_stl(binary) and not is_binary_stl(ascii_)
+    monkeypatch.setattr(mesh, 'ASCII_CHUNK', 97)  # facets split across many chunks
+    from_binary, from_ascii = open_stl(binary), open_stl(ascii_)
+    assert np.array_equal(from_binary['vertices'], triangles)
+    assert np.array_equal(from_ascii['vertices'], triangles)
+    assert np.allclose(from_ascii['normal'], from_binary['normal'])
+    a, b = Mesh(from_ascii), Mesh(from_binary)
+    assert (a.volume, a.area) == pytest.approx((b.volume, b.area))
+    assert np.array_equal(a.bounds[0], b.bounds[0]) and np.array_equal(a.bounds[1], b.bounds[1])
+
+def test_binary_is_a_view_of_the_mapped_file(tmp_path):
+    records = open_stl(write_binary(tmp_path / 'cube.stl', cube()))
+    assert not records.flags.owndata
+    assert not records.flags.writeable
+
+def test_bounds_of_the_mapped_file(tmp_path):
+    part = Mesh(open_stl(write_binary(tmp_path / 'cube.stl', cube(25.0))))
+    low, high = part.bounds
+    assert low.tolist() == [0, 0, 0] and high.tolist() == [25, 25, 25]
+    assert part.size.tolist() == [25, 25, 25]
+
+def test_empty_and_truncated_files(tmp_path):
+    assert len(open_stl(write_binary(tmp_path / 'empty.stl', np.zeros((0, 3, 3), dtype=np.float32)))) == 0
+    truncated = tmp_path / 'truncated.stl'
+    truncated.write_text('solid x\n facet normal 0 0 1\n  outer loop\n   vertex 0 0 0\n   vertex 1 0 0\n')
+    with pytest.raises(ValueError, match='truncated'):
+        open_stl(truncated)
+
+def test_cube_measurements():
+    part = Mesh.from_triangles(cube(100.0), name='block')  # 10 cm cube
+    assert part.volume == pytest.approx(1000 * 1000.0)
+    assert part.signed_volume > 0  # normals point out
+    assert part.area == pytest.approx(6 * 100 * 100.0)
+    density, price = mesh.MATERIALS['ABS']
+    assert part.mass('ABS') == pytest.approx(1000 * density)
+    assert part.material_cost('ABS') == pytest.approx(density * price)
+
+def test_quote_leaves_out_implausible_sizes():
+    good = Mesh.from_triangles(cube(100.0), name='lid')
+    inches = Mesh.from_triangles(cube(4.0), name='lid-in-inches')
+    huge = Mesh.from_triangles(cube(2000.0), name='assembly')
+    assert mesh.size_problem(good) is None
+    assert 'inches' in mesh.size_problem(inches)
+    assert 'wrong units' in mesh.size_problem(huge)
+    grams, dollars, problems = mesh.quote([good, inches, huge])
+    assert grams == pytest.approx(good.mass())
+    assert dollars == pytest.approx(good.material_cost())
+    assert len(problems) == 2
+
+def test_production_parts_exist_and_are_plausible():
+    parts = mesh.load_parts()
+    assert [p.name for p in parts] == [name.rsplit('.', 1)[0] for name in mesh.PRODUCTION_PARTS]
+    assert all(mesh.size_problem(p) is None for p in parts)
+
+def test_business_plan_reports_quote_problems_only_through_warnings(monkeypatch, capsys):
+    from poptop.build import GENERATOR_GLOB, ROOT, load_generator
+    from poptop.pdf.theme import get_styles
+
+    path, = [p for p in ROOT.glob(GENERATOR_GLOB) if p.name == 'generate_pdf.py']
+    generator = load_generator(path)
+    monkeypatch.setattr(mesh, 'PLAUSIBLE_SIZE_MM', (1.0, 2.0))
+    generator.DOCUMENT.build_story(get_styles())
+    assert capsys.readouterr().err == ''
+    warnings = generator.DOCUMENT.warnings()
+    assert len(warnings) == len(mesh.PRODUCTION_PARTS)
+    assert warnings[0].startswith('no resin quote for ')
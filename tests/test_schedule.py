@@ -0,0 +1,47 @@
+from datetime import date
+
+from poptop.schedule import Schedule
+from poptop.tasks import Priority, Status, Task
+
+def task(id, start=None, due=None, dependencies=()):
+    return Task(id, 'Phase 1', f'Task {id}', 'Paul', Status.NOT_STARTED, Priority.HIGH,
+                start_date=start, due_date=due, dependencies=tuple(dependencies))
+
+def ids(tasks):
+    return [t.id for t in tasks]
+
+def test_critical_path_follows_the_dependencies_that_push_the_finish():
+    # 2 and 3 are planned to start before their dependency finishes, so each is pushed back
+    schedule = Schedule([
+        task(1, date(2026, 3, 1), date(2026, 3, 5)),
+        task(2, date(2026, 3, 4), date(2026, 3, 10), [1]),
+        task(3, date(2026, 3, 8), date(2026, 3, 20), [2]),
+        task(4, date(2026, 3, 1), date(2026, 3, 3)),
+    ])
+    assert ids(schedule.critical_path()) == [1, 2, 3]
+    assert schedule.finish_date() == date(2026, 3, 23)
+    assert schedule[3].slack == -3
+
+def test_undated_tasks_have_no_slack_and_stay_off_the_path():
+    schedule = Schedule([
+        task(1, date(2026, 3, 1), date(2026, 3, 5)),
+        task(2),                                  # no dates at all
+        task(3, dependencies=[1]),                # earliest start from 1, but no due date
+        task(4, date(2026, 3, 2), date(2026, 3, 4)),
+    ])
+    assert schedule[2].slack is None
+    assert schedule[3].earliest_start == date(2026, 3, 5)
+    assert schedule[3].slack is None
+    assert ids(schedule.critical_path()) == [1]
+    assert all(e.slack is not None for e in schedule.at_risk(threshold=100))
+
+def test_critical_path_is_empty_without_dates():
+    schedule = Schedule([task(1), task(2, dependencies=[1])])
+    assert schedule.critical_path() == []
+    assert schedule.at_risk() == []
+    assert schedule.finish_date() is None
+
+def test_missing_dependency_is_reported_not_scheduled():
+    schedule = Schedule([task(1, date(2026, 3, 1), date(2026, 3, 5), [99])])
+    assert schedule.missing == [(1, 99)]
+    assert ids(schedule.critical_path()) == [1]
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from poptop.search import SearchIndex, normalize_date, split_query
+
+PLAN = """# Launch Plan 2026
+
+## Phase 2: Prototype
+**Owner: Paul G**
+
+Print the first rotating cap on Feb 13.
+The cap doesn't rotate freely yet.
+
+| Task | Owner | Due |
+|------|-------|-----|
+| Order resin | Maria | 3/2/2026 |
+| Paul's test rig | ==Sam== | Feb 20 |
+
+## Phase 3: Pilot
+Rotating cap pilot run, March 2026 review on 2026-03-15.
+"""
+
+GENERATOR = '''"""Not indexed: a docstring"""
+def build_story(styles):
+    return ["<b>Phase 4</b> rotating cap launch", "Lead: Dana K, Feb 2026"]
+'''
+
+@pytest.fixture
+def index(tmp_path):
+    (tmp_path / '01-Plans').mkdir()
+    (tmp_path / '01-Plans' / 'plan.md').write_text(PLAN, encoding='utf-8')
+    (tmp_path / '02-Docs' / 'drafts').mkdir(parents=True)
+    (tmp_path / '02-Docs' / 'drafts' / 'generate_pdf.py').write_text(GENERATOR, encoding='utf-8')
+    index = SearchIndex(root=tmp_path, index_file=tmp_path / 'index.json')
+    index.refresh()
+    return index
+
+def lines(hits):
+    return [(path, number) for path, number, _ in hits]
+
+def test_split_query_groups_quoted_phrases():
+    assert split_query('owner:"Paul G" rotating "first cap') == ['owner:Paul G', 'rotating', 'first cap']
+    assert split_query("doesn't Paul's") == ["doesn't", "Paul's"]
+
+def test_phrase_needs_adjacent_words(index):
+    assert lines(index.search('"rotating cap"')) == [
+        ('01-Plans/plan.md', 6), ('01-Plans/plan.md', 15), ('02-Docs/drafts/generate_pdf.py', 3)]
+    # Both words are on line 6, but not next to each other in this order
+    assert index.search('"cap rotating"') == []
+    assert lines(index.search('"first rotating cap" in:plan')) == [('01-Plans/plan.md', 6)]
+
+def test_apostrophes_stay_inside_a_word(index):
+    assert lines(index.search("doesn't")) == [('01-Plans/plan.md', 7)]
+    assert lines(index.search("Paul's rig")) == [('01-Plans/plan.md', 12)]
+
+def test_date_field_matches_by_prefix(index):
+    assert lines(index.search('date:2026-02-13')) == [('01-Plans/plan.md', 6)]
+    assert lines(index.search('date:3/2/2026')) == [('01-Plans/plan.md', 11)]
+    assert lines(index.search('date:2026-03')) == [('01-Plans/plan.md', 11), ('01-Plans/plan.md', 15)]
+    assert lines(index.search('date:2026-02 in:generate')) == [('02-Docs/drafts/generate_pdf.py', 3)]
+
+def test_phase_field_covers_the_section_under_the_heading(index):
+    assert lines(index.search('phase:2 cap')) == [('01-Plans/plan.md', 6), ('01-Plans/plan.md', 7)]
+    assert lines(index.search('phase:"Phase 3"')) == [('01-Plans/plan.md', 14), ('01-Plans/plan.md', 15)]
+    assert lines(index.search('phase:4')) == [('02-Docs/drafts/generate_pdf.py', 3)]
+
+def test_owner_field_from_labels_columns_and_highlights(index):
+    assert lines(index.search('owner:"Paul G" freely')) == [('01-Plans/plan.md', 7)]
+    assert lines(index.search('owner:maria')) == [('01-Plans/plan.md', 11)]
+    assert lines(index.search('owner:sam')) == [('01-Plans/plan.md', 12)]
+    assert lines(index.search('owner:dana')) == [('02-Docs/drafts/generate_pdf.py', 3)]
+
+def test_docstrings_are_not_indexed(index):
+    assert index.search('docstring') == []
+
+def test_saved_index_reloads_and_refreshes_changed_files(index, tmp_path):
+    index.save()
+    again = SearchIndex(root=tmp_path, index_file=tmp_path / 'index.json').load()
+    assert again.refresh() == 0
+    assert again.search('"rotating cap"') == index.search('"rotating cap"')
+
+    plan = tmp_path / '01-Plans' / 'plan.md'
+    plan.write_text(PLAN + 'Ship the rotating cap.\n', encoding='utf-8')
+    os.utime(plan, ns=(1, 1))
+    assert again.refresh() == 1
+    assert ('01-Plans/plan.md', 16) in lines(again.search('"rotating cap"'))
+
+def test_normalize_date():
+    assert normalize_date('2026-2') == '2026-02'
+    assert normalize_date('Feb 13 2026') == '2026-02-13'
+    with pytest.raises(ValueError):
+        normalize_date('someday')
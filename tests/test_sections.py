@@ -0,0 +1,33 @@
+import pytest
+from reportlab.platypus import PageBreak, Paragraph
+
+from poptop.pdf import sections
+from poptop.pdf.document import Document, render
+from poptop.pdf.theme import get_styles
+
+pypdf = pytest.importorskip('pypdf')
+
+def story(styles):
+    return [
+        Paragraph('Overview', styles['SectionTitle']), Paragraph('First section.', styles['Normal']),
+        PageBreak(),
+        Paragraph('Details', styles['SectionTitle']), Paragraph('Second section.', styles['Normal']),
+    ]
+
+def test_split_sections_at_page_breaks():
+    names = [name for name, _ in sections.split_sections(story(get_styles()) + [PageBreak()])]
+    assert names == ['overview', 'details']
+
+def test_stitched_pdf_keeps_the_document_info(tmp_path, monkeypatch):
+    monkeypatch.setattr(sections, 'CACHE_DIR', tmp_path / 'cache')
+    document = Document('sample', tmp_path / 'sample.pdf', story, sectioned=True)
+    pages, relaid = sections.render_sections(document, tmp_path / 'stitched.pdf', story(get_styles()), keywords='stamp')
+    render(document, tmp_path / 'flat.pdf')
+
+    stitched = pypdf.PdfReader(tmp_path / 'stitched.pdf').metadata
+    flat = pypdf.PdfReader(tmp_path / 'flat.pdf').metadata
+    assert (pages, relaid) == (2, ['overview', 'details'])
+    for key in ('/Title', '/Author', '/Subject', '/Creator'):
+        assert stitched[key] == flat[key]
+    assert stitched['/CreationDate'].startswith('D:')
+    assert stitched['/Keywords'] == 'stamp'
@@ -0,0 +1,101 @@
+import copy
+import random
+
+from poptop.sheets import (MockBackend, SheetSync, apply_updates, column_name, diff_table,
+                           parse_range, without_computed)
+
+HEADER = ['ID', 'Task', 'Owner', 'Status', 'Days Left']
+OLD = [
+    HEADER,
+    ['1', 'Order resin', 'Maria', 'Done', '0'],
+    ['2', 'Print caps', 'Paul', 'In Progress', '3'],
+    ['3', 'Test rig', 'Sam', 'Not Started', '9'],
+]
+
+def ranges(updates):
+    return [(update['range'], update['values']) for update in updates]
+
+def test_column_names_and_ranges():
+    assert [column_name(i) for i in (0, 25, 26, 27, 701, 702)] == ['A', 'Z', 'AA', 'AB', 'ZZ', 'AAA']
+    assert parse_range('A5:M7') == (4, 6, 0, 12)
+    assert parse_range('AA2') == (1, 1, 26, 26)
+
+def test_empty_sheet_gets_the_header_and_every_row():
+    assert ranges(diff_table('Tasks', [], OLD)) == [('A1:E4', OLD)]
+
+def test_unchanged_table_sends_nothing():
+    assert diff_table('Tasks', OLD, copy.deepcopy(OLD)) == []
+
+def test_adjacent_cells_and_rows_become_one_range():
+    new = copy.deepcopy(OLD)
+    new[1][2:4] = ['Dana', 'Blocked']
+    new[2][2:4] = ['Dana', 'Done']
+    new[3][1] = 'Test rig v2'
+    assert ranges(diff_table('Tasks', OLD, new)) == [
+        ('C2:D3', [['Dana', 'Blocked'], ['Dana', 'Done']]),
+        ('B4:B4', [['Test rig v2']]),
+    ]
+
+def test_appended_and_removed_rows():
+    longer = OLD + [['4', 'Pilot run', 'Paul', 'Not Started', '20']]
+    assert ranges(diff_table('Tasks', OLD, longer)) == [('A5:E5', [longer[4]])]
+    shorter = OLD[:2]
+    assert ranges(diff_table('Tasks', OLD, shorter)) == [('A3:E4', [[''] * 5, [''] * 5])]
+
+def test_header_and_computed_columns_are_not_written():
+    new = copy.deepcopy(OLD)
+    new[0][1] = 'Task Name'
+    new[2][4] = '2'
+    new[2][3] = 'Done'
+    assert ranges(diff_table('Tasks', OLD, new, computed=('Days Left',))) == [('D3:D3', [['Done']])]
+    # An empty sheet still gets the header
+    assert diff_table('Tasks', [], new, computed=('Days Left',))[0]['values'][0] == new[0]
+
+def test_filled_sheet_cells_are_kept_as_conflicts():
+    sheet = [HEADER, ['1', 'Order resin', 'Maria (edited)', '', ''], ['2', 'Print caps']]
+    conflicts = []
+    updates = diff_table('Tasks', sheet, OLD, computed=('Days Left',), conflicts=conflicts)
+    assert conflicts == ['Tasks!C2']
+    assert ranges(updates) == [
+        ('D2:D2', [['Done']]),
+        ('C3:D3', [['Paul', 'In Progress']]),
+        ('A4:D4', [['3', 'Test rig', 'Sam', 'Not Started']]),
+    ]
+
+def test_applying_the_diff_gives_the_new_table():
+    rng = random.Random(19)
+    for _ in range(200):
+        old = [HEADER] + [[rng.choice(['', 'a', 'b']) for _ in HEADER] for _ in range(rng.randint(0, 6))]
+        new = [HEADER] + [[rng.choice(['', 'a', 'b']) for _ in HEADER] for _ in range(rng.randint(0, 6))]
+        sheets = {'Tasks': copy.deepcopy(old)}
+        apply_updates(sheets, diff_table('Tasks', old, new))
+        while new and not any(new[-1]):
+            new.pop()
+        assert [row + [''] * (len(HEADER) - len(row)) for row in sheets['Tasks']] == new
+
+def test_sync_sends_one_batch_and_keeps_sheet_edits(tmp_path):
+    backend = MockBackend(str(tmp_path / 'sheets.json'))
+    backend.batch_update([{'sheet': 'Tasks', 'range': 'A1:C2',
+                           'values': [HEADER[:3], ['1', 'Order resin', 'Maria (edited)']]}])
+    sync = SheetSync(backend, snapshot_path=str(tmp_path / 'snapshot.json'))
+
+    dry = sync.sync({'Tasks': OLD}, dry_run=True)
+    assert dry.conflicts == ['Tasks!C2'] and not (tmp_path / 'snapshot.json').exists()
+
+    backend.round_trips = 0
+    first = sync.sync({'Tasks': OLD})
+    assert first.round_trips == backend.round_trips == 2  # read the new table, then one write
+    assert first.conflicts == ['Tasks!C2']
+    sheet = backend.read()['Tasks']
+    assert sheet[1][2] == 'Maria (edited)' and sheet[3] == OLD[3][:4]  # no Days Left: a formula
+
+    new = copy.deepcopy(OLD)
+    new[2][3] = 'Done'
+    again = SheetSync(backend, snapshot_path=str(tmp_path / 'snapshot.json'))
+    second = again.sync({'Tasks': new})
+    assert (ranges(second.updates), second.round_trips) == ([('D3:D3', [['Done']])], 1)
+    assert again.sync({'Tasks': new}).updates == []
+
+def test_without_computed_blanks_formula_cells():
+    assert without_computed('Tasks', OLD)[1:] == [row[:4] + [''] for row in OLD[1:]]
+    assert without_computed('Tasks', []) == []
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from poptop import simplify
+from poptop.mesh import Mesh
+from poptop.simplify import IndexedMesh, decimate, preview_mesh, read_ply, weld, write_ply
+
+from test_mesh import cube, write_binary
+
+def sphere(radius=20.0, rings=24, segments=48):
+    """Triangle soup of a closed UV sphere, every shared corner repeated per triangle"""
+    theta = np.linspace(0, np.pi, rings + 1)
+    phi = np.linspace(0, 2 * np.pi, segments + 1)
+    grid = np.stack([np.outer(np.sin(theta), np.cos(phi)),
+                     np.outer(np.sin(theta), np.sin(phi)),
+                     np.repeat(np.cos(theta)[:, None], segments + 1, axis=1)], axis=-1) * radius
+    triangles = []
+    for i in range(rings):
+        for j in range(segments):
+            a, b, c, d = grid[i, j], grid[i + 1, j], grid[i + 1, j + 1], grid[i, j + 1]
+            if i > 0:
+                triangles.append([a, b, d])
+            if i < rings - 1:
+                triangles.append([d, b, c])
+    return np.array(triangles, dtype=np.float32)
+
+def plate(size=30.0, steps=20):
+    """Open square grid in the z = 0 plane"""
+    xs = np.linspace(0, size, steps + 1)
+    triangles = []
+    for i in range(steps):
+        for j in range(steps):
+            a, b = (xs[i], xs[j], 0), (xs[i + 1], xs[j], 0)
+            c, d = (xs[i + 1], xs[j + 1], 0), (xs[i], xs[j + 1], 0)
+            triangles += [[a, b, c], [a, c, d]]
+    return np.array(triangles, dtype=np.float32)
+
+def area(mesh):
+    t = mesh.triangles.astype(np.float64)
+    return np.linalg.norm(np.cross(t[:, 1] - t[:, 0], t[:, 2] - t[:, 0]), axis=1).sum() / 2
+
+def test_weld_shares_corners():
+    vertices, faces = weld(cube())
+    assert (len(vertices), len(faces)) == (8, 12)
+    assert np.array_equal(vertices[faces], cube())
+
+def test_weld_snaps_corners_within_tolerance():
+    triangles = cube()
+    triangles[1::2] += np.float32(2e-5)  # export noise on every other triangle
+    vertices, faces = weld(triangles, tolerance=1e-4)
+    assert (len(vertices), len(faces)) == (8, 12)
+    vertices, faces = weld(triangles, tolerance=1e-6)
+    assert len(vertices) > 8
+
+def test_weld_drops_collapsed_triangles():
+    triangles = np.concatenate([cube(), [[[0, 0, 0], [0, 0, 0], [1, 0, 0]]]]).astype(np.float32)
+    assert len(weld(triangles)[1]) == 12
+    vertices, faces = weld(np.zeros((0, 3, 3)))
+    assert vertices.shape == faces.shape == (0, 3)
+
+def test_decimate_meets_the_budget_and_keeps_the_shape():
+    welded = IndexedMesh.from_mesh(Mesh.from_triangles(sphere(), 'ball'))
+    assert len(welded.vertices) == 24 * 48 - 48 + 2
+    simple = decimate(welded, budget=300)
+    assert 0 < len(simple) <= 300
+    assert len(simple.vertices) < len(welded.vertices) / 5
+    assert simple.name == 'ball'
+    # Every face is proper, every vertex used, and the surface stays on the sphere
+    assert (simplify._proper(simple.faces)).all()
+    assert np.array_equal(np.unique(simple.faces), np.arange(len(simple.vertices)))
+    assert np.allclose(np.linalg.norm(simple.vertices, axis=1), 20.0, rtol=0.05)
+
+def test_decimate_keeps_open_edges():
+    welded = IndexedMesh.from_mesh(Mesh.from_triangles(plate()))
+    simple = decimate(welded, budget=100)
+    assert len(simple) <= 100
+    assert np.allclose(simple.vertices.min(axis=0), [0, 0, 0], atol=1e-3)
+    assert np.allclose(simple.vertices.max(axis=0), [30, 30, 0], atol=1e-3)
+    assert np.isclose(area(simple), 900.0, rtol=1e-3)
+
+def test_decimate_leaves_small_meshes_alone():
+    welded = IndexedMesh.from_mesh(Mesh.from_triangles(cube()))
+    assert decimate(welded, budget=12) is welded
+
+def test_ply_round_trip(tmp_path):
+    simple = decimate(IndexedMesh.from_mesh(Mesh.from_triangles(sphere(), 'ball')), budget=300)
+    write_ply(simple, tmp_path / 'ball.ply')
+    again = read_ply(tmp_path / 'ball.ply')
+    assert again.name == 'ball'
+    assert np.array_equal(again.vertices, simple.vertices)
+    assert np.array_equal(again.faces, simple.faces)
+    assert not (tmp_path / 'ball.ply.tmp').exists()
+
+def test_read_ply_refuses_other_files(tmp_path):
+    (tmp_path / 'text.ply').write_bytes(b'ply\nformat ascii 1.0\nend_header\n')
+    (tmp_path / 'part.stl').write_bytes(b'solid part\nendsolid part\n')
+    with pytest.raises(ValueError):
+        read_ply(tmp_path / 'text.ply')
+    with pytest.raises(ValueError):
+        read_ply(tmp_path / 'part.stl')
+
+def test_preview_mesh_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(simplify, 'CACHE_DIR', tmp_path / 'previews')
+    stl = write_binary(tmp_path / 'ball.stl', sphere())
+    first = preview_mesh(stl, budget=300)
+    assert len(list((tmp_path / 'previews').glob('*.ply'))) == 1
+    monkeypatch.setattr(simplify, 'decimate', None)  # a second call must not decimate again
+    second = preview_mesh(stl, budget=300)
+    assert np.array_equal(first.vertices, second.vertices)
+    assert np.array_equal(first.faces, second.faces)
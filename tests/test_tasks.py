@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+
+from poptop.tasks import COLUMNS, Priority, Status, Task, TaskStore, iter_tasks, load_tasks, sheet_row
+
+HEADER = '\t'.join(COLUMNS)
+NO_BLOCKER = '\t'.join(c for c in COLUMNS if c != 'Blocker')
+
+def write(tmp_path, header, *rows):
+    path = tmp_path / 'tasks.tsv'
+    path.write_text('\n'.join([header, *rows]) + '\n', encoding='utf-8')
+    return path
+
+def test_load_tasks_from_the_dashboard_tsvs():
+    store = load_tasks()
+    assert len(store) == len({task.id for task in store}) > 100
+    first = store.get(1)
+    assert first.status is Status.IN_PROGRESS
+    assert first.priority is Priority.HIGH
+    assert first.due_date == date(2026, 2, 6)
+    assert first.notes == 'Agenda prepared'
+    assert store.get(2).dependencies == (1,)
+
+def test_records_use_slots():
+    task = load_tasks().get(1)
+    assert not hasattr(task, '__dict__')
+    with pytest.raises(AttributeError):
+        task.color = 'red'
+
+def test_index_lookups_match_a_scan():
+    store = load_tasks()
+    owner = store.owners[0]
+    phase = store.phases[0]
+    expected = [t for t in store if t.status is Status.NOT_STARTED and t.owner == owner and t.phase == phase]
+    assert store.query(status='Not Started', owner=owner, phase=phase) == expected
+    assert store.query(owner=owner) == [t for t in store if t.owner == owner]
+    assert store.query(owner='Nobody') == []
+    assert store.dependents(1) == [t for t in store if 1 in t.dependencies]
+
+def test_duplicate_ids_are_refused():
+    task = Task(1, 'Phase 0', 'Call', 'Paul', Status.NOT_STARTED, Priority.HIGH)
+    with pytest.raises(ValueError):
+        TaskStore([task, task])
+
+def test_sheet_row_keeps_a_real_blocker_when_dependencies_are_empty():
+    row = ['5', 'Phase 1', 'Tooling', 'Paul', 'Blocked', 'High', '', '', '', '', 'Waiting on quote', 'Call Tuesday']
+    assert sheet_row(row, COLUMNS) == row + ['']
+
+def test_sheet_row_adds_blocker_for_a_header_without_it():
+    header = [c for c in COLUMNS if c != 'Blocker']
+    row = ['5', 'Phase 1', 'Tooling', 'Paul', 'Blocked', 'High', '', '', '', '', 'Call Tuesday', '4']
+    assert sheet_row(row, header) == row[:10] + ['', 'Call Tuesday', '4']
+    assert sheet_row(row[:4], header) == row[:4] + [''] * 9
+
+def test_iter_tasks_reads_columns_by_header(tmp_path):
+    with_blocker = write(tmp_path, HEADER, '7\tP1\tMold\tPaul\tBlocked\tHigh\t\t3/1/2026\t\t\tNo quote\tChase vendor')
+    task, = iter_tasks(with_blocker)
+    assert (task.blocker, task.notes, task.dependencies) == ('No quote', 'Chase vendor', ())
+
+    without = write(tmp_path, NO_BLOCKER, '7\tP1\tMold\tPaul\tBlocked\tHigh\t\t3/1/2026\t\t\tChase vendor\t2;3')
+    task, = iter_tasks(without)
+    assert (task.blocker, task.notes, task.dependencies) == ('', 'Chase vendor', (2, 3))
+
+def test_bad_values_name_the_line(tmp_path):
+    path = write(tmp_path, HEADER, '7\tP1\tMold\tPaul\tDone-ish\tHigh')
+    with pytest.raises(ValueError, match='tasks.tsv:2'):
+        list(iter_tasks(path))
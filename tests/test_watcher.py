@@ -0,0 +1,104 @@
+import asyncio
+import subprocess
+
+import pytest
+
+from poptop.watcher import NotesWatcher, is_note
+
+def git(repo, *args):
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.name', 'Test')
+    git(tmp_path, 'config', 'user.email', 'test@example.com')
+    (tmp_path / 'notes').mkdir()
+    (tmp_path / 'README.md').write_text('PopTop\n')
+    git(tmp_path, 'add', 'README.md')
+    git(tmp_path, 'commit', '-q', '-m', 'Initial commit')
+    return tmp_path
+
+async def fake_events(queue):
+    """Paths put on queue, until None"""
+    while (path := await queue.get()) is not None:
+        yield path
+
+def commits(repo):
+    """(subject, files) of every commit after the first, oldest first"""
+    log = git(repo, 'log', '--reverse', '--format=%x00%s', '--name-only')
+    entries = [entry.strip().split('\n') for entry in log.split('\0') if entry.strip()]
+    return [(lines[0], sorted(filter(None, lines[1:]))) for lines in entries[1:]]
+
+def test_is_note():
+    assert is_note('/notes/2026-02-13.md')
+    assert not is_note('/notes/2026-02-13-email-draft.md')
+    assert not is_note('/notes/.2026-02-13.md.swp')
+
+def test_saves_are_batched_into_one_commit(repo):
+    notes = repo / 'notes'
+    events = asyncio.Queue()
+    watcher = NotesWatcher(notes_dir=notes, repo_dir=repo, quiet=0.1, max_delay=5,
+                           push=False, log_file=None, events=fake_events(events))
+
+    async def save(name, text):
+        (notes / name).write_text(text)
+        await events.put(str(notes / name))
+        await asyncio.sleep(0.02)
+
+    async def scenario():
+        run = asyncio.create_task(watcher.run())
+        for i in range(3):
+            await save('2026-02-13.md', f'# Standup\nsave {i}\n')
+        await save('2026-02-14.md', '# Review\n')
+        await save('2026-02-13-email-draft.md', 'Hi team\n')
+        await save('scratch.txt', 'not a note\n')
+        assert watcher.queue_depth == 2 and watcher.metrics.commits == 0
+        await asyncio.sleep(0.3)
+        assert watcher.metrics.commits == 1 and watcher.queue_depth == 0
+
+        await save('2026-02-14.md', '# Review\nupdated\n')
+        await events.put(None)  # the event source ends; run commits what is queued
+        await run
+
+    asyncio.run(scenario())
+    assert commits(repo) == [
+        ('Update meeting notes: 2026-02-13.md, 2026-02-14.md', ['notes/2026-02-13.md', 'notes/2026-02-14.md']),
+        ('Update meeting notes: 2026-02-14.md', ['notes/2026-02-14.md']),
+    ]
+    assert (watcher.metrics.events, watcher.metrics.ignored) == (7, 2)
+    assert (watcher.metrics.batches, watcher.metrics.files_committed) == (2, 3)
+    # Drafts and other files stay out of the commits
+    assert git(repo, 'status', '--porcelain').split('\n')[:2] == ['?? notes/2026-02-13-email-draft.md',
+                                                                 '?? notes/scratch.txt']
+
+def test_max_delay_caps_a_busy_folder(repo):
+    notes = repo / 'notes'
+    events = asyncio.Queue()
+    watcher = NotesWatcher(notes_dir=notes, repo_dir=repo, quiet=0.1, max_delay=0.25,
+                           push=False, log_file=None, events=fake_events(events))
+
+    async def scenario():
+        run = asyncio.create_task(watcher.run())
+        # Saves every 50ms never leave the folder quiet for 100ms
+        for i in range(12):
+            (notes / '2026-02-13.md').write_text(f'save {i}\n')
+            await events.put(str(notes / '2026-02-13.md'))
+            await asyncio.sleep(0.05)
+        await events.put(None)
+        await run
+
+    asyncio.run(scenario())
+    assert 2 <= watcher.metrics.commits <= 4
+    assert all(latency < 1.0 for latency in watcher.metrics.latencies)
+
+def test_unchanged_notes_make_no_commit(repo):
+    notes = repo / 'notes'
+    (notes / '2026-02-13.md').write_text('# Standup\n')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'Add notes')
+    watcher = NotesWatcher(notes_dir=notes, repo_dir=repo, push=False, log_file=None,
+                           events=fake_events(asyncio.Queue()))
+    watcher.queue(str(notes / '2026-02-13.md'))  # touched, but saved as it was
+    asyncio.run(watcher.flush())
+    assert (watcher.metrics.batches, watcher.metrics.commits) == (1, 0)
@@ -0,0 +1,101 @@
+import asyncio
+import csv
+
+import pytest
+
+from poptop.sheets import MockBackend
+from poptop.webhook import WebhookReceiver
+
+class FakeRefresher:
+    """Counts refreshes instead of reading the task files"""
+    def __init__(self, fail=False):
+        self.refreshes = 0
+        self.fail = fail
+        self.written = []
+
+    def refresh(self):
+        self.refreshes += 1
+        if self.fail:
+            raise OSError('task file missing')
+        return 3
+
+    def write(self, payload):
+        self.written.append(payload)
+
+    def apply(self, change):
+        self.written.append(change)
+
+@pytest.fixture
+def receiver(tmp_path, monkeypatch):
+    monkeypatch.delenv('SHEETS_WEBHOOK_TOKEN', raising=False)
+    receiver = WebhookReceiver(quiet=0.05, max_delay=0.2, refresher=FakeRefresher(),
+                               sync_log=str(tmp_path / 'sync.tsv'),
+                               sheets=MockBackend(str(tmp_path / 'sheets.json')), token='secret')
+    receiver.log = lambda message: None
+    return receiver
+
+def notes(repo, commit):
+    return {'event': 'meeting_notes_updated', 'repo': repo, 'commit': commit}
+
+def sync_log(receiver):
+    with open(receiver.sync_log, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f, delimiter='\t'))
+
+def test_events_from_one_repo_share_a_refresh(receiver):
+    for repo, commit in [('a/poptop', 'c1'), ('a/poptop', 'c2'), ('b/notes', 'n1'), ('a/poptop', 'c2')]:
+        assert receiver.handle(notes(repo, commit)) == {'status': 'success', 'message': 'Dashboard update queued'}
+    assert receiver.queue_depth == 4
+    assert receiver.pending['a/poptop'].commits == ['c1', 'c2']
+
+    asyncio.run(receiver.flush())
+    assert receiver.refresher.refreshes == 2
+    assert receiver.queue_depth == 0 and not receiver.pending
+    assert receiver.last_sync['C20'] == 'n1'
+    rows = sync_log(receiver)
+    assert [(r['Repo'], r['Commit'], r['Events'], r['Commits']) for r in rows] == [
+        ('a/poptop', 'c2', '3', '2'), ('b/notes', 'n1', '1', '1')]
+    metrics = receiver.metrics.as_dict(receiver.queue_depth)
+    assert (metrics['events'], metrics['refreshes'], metrics['max_queue_depth']) == (4, 2, 4)
+
+def test_flush_loop_waits_for_a_quiet_repo(receiver):
+    async def scenario():
+        loop = asyncio.create_task(receiver._flush_loop())
+        for commit in ('c1', 'c2', 'c3'):
+            receiver.handle(notes('a/poptop', commit))
+            await asyncio.sleep(0.01)
+        assert receiver.refresher.refreshes == 0  # still inside the quiet period
+        await asyncio.sleep(0.15)
+        loop.cancel()
+    asyncio.run(scenario())
+    assert receiver.refresher.refreshes == 1
+    assert [(r['Events'], r['Commits']) for r in sync_log(receiver)] == [('3', '3')]
+
+def test_failed_refresh_is_counted_not_logged(receiver):
+    receiver.refresher.fail = True
+    receiver.handle(notes('a/poptop', 'c1'))
+    asyncio.run(receiver.flush())
+    assert (receiver.metrics.refreshes, receiver.metrics.refresh_failures) == (0, 1)
+    assert receiver.last_sync is None
+
+def test_write_events_need_the_token(receiver):
+    update = {'event': 'sheet_rows', 'updates': [{'sheet': 'Tasks', 'range': 'A1:B1', 'values': [['Task', 'Owner']]}]}
+    unauthorized = {'status': 'error', 'message': 'Unauthorized'}
+    assert receiver.handle(update) == unauthorized
+    assert receiver.handle(dict(update, token='wrong')) == unauthorized
+    assert receiver.handle({'event': 'dashboard_payload', 'payload': {}}) == unauthorized
+    assert receiver.metrics.errors == 3
+    assert receiver.sheets.read() == {} and receiver.refresher.written == []
+
+    assert receiver.handle(dict(update, token='secret'))['message'] == '1 range(s) written'
+    reply = receiver.handle({'event': 'sheet_values', 'sheets': ['Tasks'], 'token': 'secret'})
+    assert reply['sheets'] == {'Tasks': [['Task', 'Owner']]}
+
+def test_write_events_are_refused_without_a_configured_token(receiver):
+    receiver.token = None
+    assert receiver.handle({'event': 'sheet_values', 'sheets': ['Tasks'], 'token': ''})['status'] == 'error'
+    # Sync events never needed one
+    assert receiver.handle(notes('a/poptop', 'c1'))['status'] == 'success'
+
+def test_other_events_are_ignored(receiver):
+    assert receiver.handle({'event': 'ping'}) == {'status': 'ok', 'message': 'Event received'}
+    assert receiver.metrics.ignored == 1 and not receiver.pending